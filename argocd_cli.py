@@ -2,43 +2,57 @@
 import click
 import subprocess
 import yaml
+from kubernetes import client, config
+from kubernetes.client.rest import ApiException
+
+HELM_REPO_ADD_CMD = ("helm", "repo", "add", "argo", "https://argoproj.github.io/argo-helm")
+HELM_REPO_UPDATE_CMD = ("helm", "repo", "update")
+HA_SET_ARGS = ("--set", "redis-ha.enabled=true", "--set", "controller.replicas=3")
 
 class ArgocdCLI:
     def __init__(self, namespace, release_name):
         self.namespace = namespace
         self.release_name = release_name
+        config.load_kube_config()
+        self.core_v1 = client.CoreV1Api()
     
     def run_cmd(self, cmd):
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(list(cmd), shell=False, capture_output=True, text=True, check=False)
         if result.returncode != 0:
             raise Exception(f"Command failed: {result.stderr}")
         return result.stdout
 
     def install(self, values_file, ha, version):
-        print(f"Installing ArgoCD in namespace '{self.namespace}'...")
+        click.echo(f"Installing ArgoCD in namespace '{self.namespace}'...")
         
         # Add repo
-        self.run_cmd("helm repo add argo https://argoproj.github.io/argo-helm")
-        self.run_cmd("helm repo update")
+        self.run_cmd(HELM_REPO_ADD_CMD)
+        self.run_cmd(HELM_REPO_UPDATE_CMD)
         
         # Create namespace
-        subprocess.run(f"kubectl create namespace {self.namespace}", shell=True)
+        try:
+            self.core_v1.create_namespace(
+                client.V1Namespace(metadata=client.V1ObjectMeta(name=self.namespace))
+            )
+        except ApiException as e:
+            if e.status != 409:  # Ignore if already exists
+                raise
         
         # Build install command
-        cmd = f"helm install {self.release_name} argo/argo-cd --namespace {self.namespace}"
+        cmd = ["helm", "install", self.release_name, "argo/argo-cd", "--namespace", self.namespace]
         
         if values_file:
-            cmd += f" --values {values_file}"
+            cmd += ["--values", values_file]
         
         if version:
-            cmd += f" --version {version}"
+            cmd += ["--version", version]
         
         if ha:
             # Add HA-specific values
-            cmd += " --set redis-ha.enabled=true --set controller.replicas=3"
+            cmd += HA_SET_ARGS
         
         self.run_cmd(cmd)
-        print("✅ ArgoCD installed successfully!")
+        click.secho("✅ ArgoCD installed successfully!", fg="green")
 
 @click.group()
 def cli():
@@ -61,9 +75,14 @@ def install(namespace, release_name, values, ha, version):
 def uninstall(namespace):
     """Uninstall ArgoCD"""
     click.confirm(f'Are you sure you want to uninstall ArgoCD from {namespace}?', abort=True)
-    subprocess.run(f"helm uninstall argocd --namespace {namespace}", shell=True)
-    subprocess.run(f"kubectl delete namespace {namespace}", shell=True)
-    print("✅ ArgoCD uninstalled")
+    subprocess.run(["helm", "uninstall", "argocd", "--namespace", namespace], check=False)
+    config.load_kube_config()
+    try:
+        client.CoreV1Api().delete_namespace(namespace)
+    except ApiException as e:
+        if e.status != 404:  # Ignore if already deleted
+            raise
+    click.secho("✅ ArgoCD uninstalled", fg="green")
 
 if __name__ == '__main__':
     cli()
\ No newline at end of file
@@ -2,16 +2,6 @@
 
 __version__ = "0.1.0"
 
-from argocd_cli.models import (
-    ApplicationConfig,
-    ApplicationSetConfig,
-    Environment,
-    SyncPolicy,
-    WorkflowNode,
-    WorkflowStatus,
-    WorkflowSubmission,
-)
-
 __all__ = [
     "ApplicationConfig",
     "ApplicationSetConfig",
@@ -21,3 +11,11 @@ __all__ = [
     "WorkflowStatus",
     "WorkflowSubmission",
 ]
+
+
+def __getattr__(name):
+    """Import the model classes on first access so CLI startup skips them."""
+    if name in __all__:
+        from argocd_cli import models
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
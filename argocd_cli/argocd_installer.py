@@ -1,11 +1,25 @@
 """ArgoCD installation and setup functionality."""
 
+import asyncio
+import base64
+import concurrent.futures
+import functools
+import hashlib
+import json
+import os
 import subprocess
+import threading
 import time
-from typing import Optional, Tuple
+from collections import deque
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
-from kubernetes import client, config
+import urllib3
+import yaml
+from kubernetes import client, watch
 from kubernetes.client.rest import ApiException
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.discovery import CacheEncoder, LazyDiscoverer
 
 from argocd_cli.exceptions import (
     ClusterAccessError,
@@ -16,6 +30,158 @@ from argocd_cli.exceptions import (
     TimeoutError as CLITimeoutError,
     handle_kubernetes_api_exception
 )
+from argocd_cli.k8s_client import get_api_client
+
+# Per-user cache for data that can be reused across CLI invocations
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "argocd_cli"
+
+# How long API discovery results are trusted before being re-fetched
+DISCOVERY_CACHE_TTL = 600
+
+# Helm repository that provides the argo-cd chart
+ARGO_HELM_REPO_URL = "https://argoproj.github.io/argo-helm"
+
+# Pooled HTTP client for downloading install manifests
+_HTTP = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=4,
+    timeout=urllib3.Timeout(total=60),
+    retries=urllib3.Retry(total=3, backoff_factor=0.5)
+)
+
+# Concurrent API requests used when applying install manifests
+MANIFEST_APPLY_WORKERS = 8
+
+# Lines of helm output kept for error messages when an install fails
+HELM_OUTPUT_TAIL_LINES = 50
+
+
+def argocd_server_name(release_name: str) -> str:
+    """Name of the argocd-server Deployment and Service for a release.
+    
+    Mirrors the argo-cd chart's fullname helper, which only prefixes the
+    release name when it does not already contain "argocd". The upstream
+    manifests correspond to the default release name "argocd".
+    """
+    prefix = release_name if "argocd" in release_name else f"{release_name}-argocd"
+    return f"{prefix}-server"
+
+
+async def _run_in_thread(func, *args):
+    """Run a blocking call in the default executor without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+async def _run_helm(args: list, timeout: int) -> subprocess.CompletedProcess:
+    """Run a helm command asynchronously.
+    
+    Args:
+        args: Arguments to pass to helm
+        timeout: Timeout in seconds
+        
+    Returns:
+        Completed process with decoded stdout and stderr
+        
+    Raises:
+        FileNotFoundError: If helm is not installed
+        subprocess.TimeoutExpired: If the command does not finish in time
+    """
+    cmd = ["helm", *args]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout.decode(), stderr.decode())
+
+
+def _fetch_manifest(url: str) -> bytes:
+    """Download a manifest, reusing a cached copy when its ETag still matches.
+    
+    Args:
+        url: Manifest URL
+        
+    Returns:
+        Raw manifest content
+        
+    Raises:
+        urllib3.exceptions.HTTPError: If the manifest cannot be downloaded
+    """
+    key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    cache_dir = CACHE_DIR / "manifests"
+    body_path = cache_dir / f"{key}.yaml"
+    etag_path = cache_dir / f"{key}.etag"
+    
+    headers = {}
+    try:
+        if body_path.exists():
+            headers["If-None-Match"] = etag_path.read_text().strip()
+    except OSError:
+        pass
+    
+    response = _HTTP.request("GET", url, headers=headers)
+    if response.status == 304:
+        try:
+            return body_path.read_bytes()
+        except OSError:
+            # Cache vanished underneath us; fetch unconditionally
+            response = _HTTP.request("GET", url)
+    if response.status != 200:
+        raise urllib3.exceptions.HTTPError(f"HTTP {response.status}")
+    
+    etag = response.headers.get("ETag")
+    if etag:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = body_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(response.data)
+            os.replace(tmp_path, body_path)
+            etag_path.write_text(etag)
+        except OSError:
+            pass
+    return response.data
+
+
+class CachedDiscoverer(LazyDiscoverer):
+    """API discoverer backed by an on-disk cache that expires after a TTL.
+    
+    The cache file is keyed by API server URL, so separate clusters never
+    share discovery results.
+    """
+
+    def __init__(self, client, cache_file=None):
+        if cache_file is None:
+            server_hash = hashlib.sha256(client.configuration.host.encode()).hexdigest()[:16]
+            cache_file = str(CACHE_DIR / "discovery" / f"{server_hash}.json")
+        self._cache_path = cache_file
+        
+        # Drop stale results so the parent class re-fetches them
+        try:
+            if time.time() - os.stat(cache_file).st_mtime > DISCOVERY_CACHE_TTL:
+                os.remove(cache_file)
+        except OSError:
+            pass
+        
+        super().__init__(client, cache_file)
+
+    def _write_cache(self):
+        """Write the discovery cache atomically."""
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            tmp_path = f"{self._cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._cache, f, cls=CacheEncoder)
+            os.replace(tmp_path, self._cache_path)
+        except Exception:
+            # Failing to write the cache only costs a re-discovery next run
+            pass
 
 
 class ArgoCDInstaller:
@@ -28,30 +194,45 @@ class ArgoCDInstaller:
             ClusterAccessError: If Kubernetes configuration cannot be loaded
         """
         try:
-            config.load_kube_config()
-        except config.ConfigException:
-            try:
-                config.load_incluster_config()
-            except Exception as e:
-                raise ClusterAccessError(f"Failed to load Kubernetes configuration: {str(e)}")
-        except Exception as e:
-            raise ClusterAccessError(f"Failed to initialize Kubernetes client: {str(e)}")
-        
-        try:
-            self.core_v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
+            self.api_client = get_api_client()
+            self.core_v1 = client.CoreV1Api(self.api_client)
+            self.apps_v1 = client.AppsV1Api(self.api_client)
+        except ClusterAccessError:
+            raise
         except Exception as e:
             raise ClusterAccessError(f"Failed to create Kubernetes API clients: {str(e)}")
+        
+        self._discovery = None
+
+    @property
+    def discovery(self) -> DynamicClient:
+        """Dynamic client used to resolve manifest kinds, built on first use."""
+        if self._discovery is None:
+            self._discovery = DynamicClient(self.api_client, discoverer=CachedDiscoverer)
+        return self._discovery
 
     def validate_cluster_access(self) -> Tuple[bool, str]:
         """
         Validate that the cluster is accessible.
         
+        Probes /readyz, which returns a tiny body, and falls back to the
+        API versions list when that endpoint is not readable.
+        
         Returns:
             Tuple of (success, message)
         """
         try:
-            self.core_v1.get_api_resources()
+            try:
+                self.api_client.call_api(
+                    "/readyz", "GET",
+                    auth_settings=["BearerToken"],
+                    response_type="str",
+                    _return_http_data_only=True
+                )
+            except ApiException as e:
+                if e.status not in (401, 403, 404):
+                    raise
+                client.CoreApi(self.api_client).get_api_versions()
             return True, "Cluster is accessible"
         except ApiException as e:
             error = handle_kubernetes_api_exception(e, "access cluster")
@@ -66,13 +247,12 @@ class ArgoCDInstaller:
         Returns:
             Tuple of (success, message)
         """
+        return asyncio.run(self._check_helm_installed_async())
+
+    async def _check_helm_installed_async(self) -> Tuple[bool, str]:
+        """Asynchronous implementation of check_helm_installed."""
         try:
-            result = subprocess.run(
-                ["helm", "version", "--short"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = await _run_helm(["version", "--short"], timeout=10)
             if result.returncode == 0:
                 return True, f"Helm is installed: {result.stdout.strip()}"
             
@@ -86,31 +266,19 @@ class ArgoCDInstaller:
         except Exception as e:
             return False, f"Error checking Helm: {str(e)}"
 
-    def install_argocd(
-        self,
-        namespace: str = "argocd",
-        release_name: str = "argocd",
-        use_helm: bool = True,
-        version: Optional[str] = None
-    ) -> Tuple[bool, str]:
+    def _ensure_namespace(self, namespace: str) -> Tuple[bool, str]:
         """
-        Install ArgoCD using Helm or kubectl.
+        Create the namespace if it doesn't exist.
+        
+        The namespace read is also the install's cluster access probe, so
+        connection and authorization failures are reported as such.
         
         Args:
-            namespace: Kubernetes namespace for installation
-            release_name: Helm release name (if using Helm)
-            use_helm: Whether to use Helm (True) or kubectl manifests (False)
-            version: Specific ArgoCD version to install
+            namespace: Kubernetes namespace
             
         Returns:
             Tuple of (success, message)
         """
-        # Validate cluster access
-        success, message = self.validate_cluster_access()
-        if not success:
-            return False, message
-
-        # Create namespace if it doesn't exist
         try:
             self.core_v1.read_namespace(namespace)
         except ApiException as e:
@@ -123,10 +291,61 @@ class ArgoCDInstaller:
                 except Exception as create_error:
                     return False, f"Failed to create namespace: {str(create_error)}"
             else:
-                return False, f"Error checking namespace: {str(e)}"
+                error = handle_kubernetes_api_exception(e, "read namespace", "namespace")
+                return False, f"Cannot access cluster: {error.message}"
+        except Exception as e:
+            return False, f"Cannot access cluster: {str(e)}"
+        return True, f"Namespace '{namespace}' is ready"
+
+    async def _run_preflight_checks(self, namespace: str, use_helm: bool) -> Tuple[bool, str]:
+        """
+        Run the independent pre-install checks concurrently.
+        
+        Args:
+            namespace: Kubernetes namespace for installation
+            use_helm: Whether the Helm checks are needed
+            
+        Returns:
+            Tuple of (success, message) of the first failing check, in the
+            order the checks are listed
+        """
+        checks = [_run_in_thread(self._ensure_namespace, namespace)]
+        if use_helm:
+            checks.append(self._check_helm_installed_async())
+        
+        for success, message in await asyncio.gather(*checks):
+            if not success:
+                return False, message
+        return True, "Pre-install checks passed"
+
+    def install_argocd(
+        self,
+        namespace: str = "argocd",
+        release_name: str = "argocd",
+        use_helm: bool = True,
+        version: Optional[str] = None,
+        output_callback: Optional[Callable[[str], None]] = None
+    ) -> Tuple[bool, str]:
+        """
+        Install ArgoCD using Helm or the upstream manifests.
+        
+        Args:
+            namespace: Kubernetes namespace for installation
+            release_name: Helm release name (if using Helm)
+            use_helm: Whether to use Helm (True) or the upstream manifests (False)
+            version: Specific ArgoCD version to install
+            output_callback: Called with each line of helm output as it arrives
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        # Check cluster access via the namespace and Helm setup concurrently
+        success, message = asyncio.run(self._run_preflight_checks(namespace, use_helm))
+        if not success:
+            return False, message
 
         if use_helm:
-            return self._install_with_helm(namespace, release_name, version)
+            return self._install_with_helm(namespace, release_name, version, output_callback)
         else:
             return self._install_with_kubectl(namespace, version)
 
@@ -134,39 +353,21 @@ class ArgoCDInstaller:
         self,
         namespace: str,
         release_name: str,
-        version: Optional[str]
+        version: Optional[str],
+        output_callback: Optional[Callable[[str], None]] = None
     ) -> Tuple[bool, str]:
-        """Install ArgoCD using Helm."""
-        # Check Helm installation
-        success, message = self.check_helm_installed()
-        if not success:
-            return False, message
-
-        try:
-            # Add ArgoCD Helm repository
-            subprocess.run(
-                ["helm", "repo", "add", "argo", "https://argoproj.github.io/argo-helm"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True
-            )
-            subprocess.run(
-                ["helm", "repo", "update"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True
-            )
-        except subprocess.CalledProcessError as e:
-            return False, f"Failed to add ArgoCD Helm repository: {e.stderr}"
-        except Exception as e:
-            return False, f"Error adding Helm repository: {str(e)}"
-
+        """Install ArgoCD using Helm.
+        
+        Expects the Helm checks in _run_preflight_checks to have passed.
+        Helm output is streamed line by line instead of being buffered for
+        the whole install; only the last few lines are kept for errors.
+        """
         # Install ArgoCD
         try:
             helm_cmd = [
-                "helm", "install", release_name, "argo/argo-cd",
+                "helm", "upgrade", "--install", "--atomic",
+                "--repo", ARGO_HELM_REPO_URL,
+                release_name, "argo-cd",
                 "--namespace", namespace,
                 "--create-namespace",
                 "--set", "server.service.type=LoadBalancer",
@@ -177,18 +378,44 @@ class ArgoCDInstaller:
             if version:
                 helm_cmd.extend(["--version", version])
             
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 helm_cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=360
+                bufsize=1
             )
             
-            if result.returncode != 0:
+            # Kill helm if it outlives its own --timeout plus an --atomic rollback
+            timed_out = threading.Event()
+            
+            def _kill_helm():
+                timed_out.set()
+                proc.kill()
+            
+            watchdog = threading.Timer(420, _kill_helm)
+            watchdog.start()
+            output_tail = deque(maxlen=HELM_OUTPUT_TAIL_LINES)
+            try:
+                for line in proc.stdout:
+                    line = line.rstrip("\n")
+                    output_tail.append(line)
+                    if output_callback:
+                        output_callback(line)
+                proc.wait()
+            finally:
+                watchdog.cancel()
+                proc.stdout.close()
+            
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(helm_cmd, 420)
+            
+            if proc.returncode != 0:
+                output = "\n".join(output_tail)
                 # Check if already installed
-                if "already exists" in result.stderr:
+                if "already exists" in output:
                     return False, f"ArgoCD is already installed in namespace '{namespace}'"
-                return False, f"Helm install failed: {result.stderr}"
+                return False, f"Helm install failed: {output}"
                 
         except subprocess.TimeoutExpired:
             return False, "Installation timed out. Check cluster resources and try again."
@@ -199,7 +426,7 @@ class ArgoCDInstaller:
         admin_password = self.get_admin_password(namespace)
         
         # Get UI access URL
-        ui_url = self.get_ui_url(namespace, f"{release_name}-argocd-server")
+        ui_url = self.get_ui_url(namespace, argocd_server_name(release_name))
 
         return True, f"""ArgoCD installed successfully in namespace '{namespace}'
 
@@ -220,7 +447,7 @@ Next Steps:
         namespace: str,
         version: Optional[str]
     ) -> Tuple[bool, str]:
-        """Install ArgoCD using kubectl and manifests."""
+        """Install ArgoCD by applying the upstream manifests in-process."""
         try:
             # Determine manifest URL
             if version:
@@ -228,19 +455,30 @@ Next Steps:
             else:
                 manifest_url = "https://raw.githubusercontent.com/argoproj/argo-cd/stable/manifests/install.yaml"
             
-            # Apply manifests
-            result = subprocess.run(
-                ["kubectl", "apply", "-n", namespace, "-f", manifest_url],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            # Download and parse manifests
+            manifest_docs = [doc for doc in yaml.safe_load_all(_fetch_manifest(manifest_url)) if doc]
             
-            if result.returncode != 0:
-                return False, f"kubectl apply failed: {result.stderr}"
+            # Apply CRDs first and wait for them so custom resources can be created
+            crds = [doc for doc in manifest_docs if doc.get("kind") == "CustomResourceDefinition"]
+            others = [doc for doc in manifest_docs if doc.get("kind") != "CustomResourceDefinition"]
             
-            # Wait for deployments to be ready
-            time.sleep(5)
+            failures = self._apply_manifests(crds, namespace)
+            if not failures and crds:
+                crd_names = [crd["metadata"]["name"] for crd in crds]
+                if not self.wait_for_crds_established(crd_names):
+                    return False, "Timed out waiting for ArgoCD CRDs to become established"
+            if not failures:
+                failures = self._apply_manifests(others, namespace)
+            
+            if failures:
+                return False, f"Failed to apply manifests: {failures[0].reason} ({len(failures)} resource(s) failed)"
+            
+            # Wait for the ArgoCD server to be ready
+            if not self.wait_for_server_ready(namespace):
+                return True, (
+                    f"ArgoCD manifests applied in namespace '{namespace}', but the server is not ready yet.\n"
+                    f"Check progress: kubectl get pods -n {namespace}"
+                )
             
             # Get admin password
             admin_password = self.get_admin_password(namespace)
@@ -262,73 +500,175 @@ Next Steps:
 3. Change the admin password: argocd account update-password
 """
             
-        except subprocess.TimeoutExpired:
-            return False, "Installation timed out"
+        except urllib3.exceptions.HTTPError as e:
+            return False, f"Failed to download ArgoCD manifests from {manifest_url}: {str(e)}"
         except Exception as e:
             return False, f"Error during installation: {str(e)}"
 
-    def get_admin_password(self, namespace: str) -> str:
+    def _apply_manifests(self, manifests: List[dict], namespace: str) -> List[ApiException]:
+        """
+        Create manifests concurrently on a bounded thread pool.
+        
+        Resource types are resolved up front on the calling thread, since
+        discovery may refresh its cache and is not safe to share.
+        
+        Args:
+            manifests: Parsed Kubernetes objects
+            namespace: Namespace for namespaced objects that do not set one
+            
+        Returns:
+            API errors for the objects that could not be created
+        """
+        failures = []
+        resolved = []
+        for manifest in manifests:
+            try:
+                resolved.append((manifest, self._resolve_resource(manifest)))
+            except ApiException as e:
+                failures.append(e)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MANIFEST_APPLY_WORKERS) as pool:
+            futures = [
+                pool.submit(self._apply_manifest, manifest, namespace, resource)
+                for manifest, resource in resolved
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except ApiException as e:
+                    failures.append(e)
+        return failures
+
+    def _resolve_resource(self, manifest: dict):
+        """Look up the API resource for a manifest's apiVersion and kind."""
+        return self.discovery.resources.get(
+            api_version=manifest["apiVersion"],
+            kind=manifest["kind"]
+        )
+
+    def wait_for_crds_established(self, names: List[str], timeout_seconds: int = 60) -> bool:
+        """
+        Wait for CustomResourceDefinitions to report the Established condition.
+        
+        Args:
+            names: CRD names to wait for
+            timeout_seconds: Maximum time to wait
+            
+        Returns:
+            True if every CRD was established before the timeout
+        """
+        pending = set(names)
+        w = watch.Watch()
+        for event in w.stream(
+            client.ApiextensionsV1Api(self.api_client).list_custom_resource_definition,
+            timeout_seconds=timeout_seconds
+        ):
+            if event["type"] not in ("ADDED", "MODIFIED"):
+                continue
+            crd = event["object"]
+            conditions = (crd.status.conditions if crd.status else None) or []
+            if any(c.type == "Established" and c.status == "True" for c in conditions):
+                pending.discard(crd.metadata.name)
+            if not pending:
+                w.stop()
+                return True
+        return False
+
+    def _apply_manifest(self, manifest: dict, namespace: str, resource=None) -> None:
+        """
+        Create a single manifest, resolving its resource type via discovery.
+        
+        Args:
+            manifest: Parsed Kubernetes object
+            namespace: Namespace for namespaced objects that do not set one
+            resource: Already resolved API resource, looked up if omitted
+            
+        Raises:
+            ApiException: If the object cannot be created
+        """
+        if resource is None:
+            resource = self._resolve_resource(manifest)
+        
+        try:
+            if resource.namespaced:
+                target_namespace = manifest.get("metadata", {}).get("namespace", namespace)
+                resource.create(body=manifest, namespace=target_namespace)
+            else:
+                resource.create(body=manifest)
+        except ApiException as e:
+            if e.status != 409:  # Ignore if already exists
+                raise
+
+    def get_admin_password(self, namespace: str, timeout_seconds: int = 120) -> str:
         """
         Get the ArgoCD admin password from the secret.
         
+        Waits for the secret to be created if it does not exist yet.
+        
         Args:
             namespace: Kubernetes namespace
+            timeout_seconds: Maximum time to wait for the secret
             
         Returns:
             Admin password or error message
         """
         try:
-            # Wait a bit for secret to be created
-            time.sleep(2)
+            # Wait for the initial admin password secret to be created
+            secret = None
+            w = watch.Watch()
+            for event in w.stream(
+                self.core_v1.list_namespaced_secret,
+                namespace=namespace,
+                field_selector="metadata.name=argocd-initial-admin-secret",
+                timeout_seconds=timeout_seconds
+            ):
+                if event["type"] in ("ADDED", "MODIFIED"):
+                    secret = event["object"]
+                    w.stop()
+                    break
             
-            # Try to get the initial admin password secret
-            try:
-                secret = self.core_v1.read_namespaced_secret(
-                    "argocd-initial-admin-secret",
-                    namespace
-                )
-                import base64
-                password = base64.b64decode(secret.data.get("password", "")).decode("utf-8")
-                return password
-            except ApiException as e:
-                if e.status == 404:
-                    # Fallback: try to get from argocd-secret
-                    try:
-                        result = subprocess.run(
-                            ["kubectl", "-n", namespace, "get", "secret", "argocd-initial-admin-secret",
-                             "-o", "jsonpath={.data.password}"],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
-                        if result.returncode == 0 and result.stdout:
-                            import base64
-                            return base64.b64decode(result.stdout).decode("utf-8")
-                    except:
-                        pass
-                    
-                    return "Run: kubectl -n argocd get secret argocd-initial-admin-secret -o jsonpath='{.data.password}' | base64 -d"
-                raise
+            if secret is None:
+                return "Run: kubectl -n argocd get secret argocd-initial-admin-secret -o jsonpath='{.data.password}' | base64 -d"
+            
+            password = base64.b64decode((secret.data or {}).get("password", "")).decode("utf-8")
+            return password
                 
         except Exception as e:
             return f"Error retrieving password: {str(e)}"
 
-    def get_ui_url(self, namespace: str, service_name: str) -> str:
+    def get_ui_url(self, namespace: str, service_name: str, timeout_seconds: int = 60) -> str:
         """
         Get the ArgoCD UI access URL.
         
+        For LoadBalancer services, waits for an external address to be assigned.
+        
         Args:
             namespace: Kubernetes namespace
             service_name: Service name
+            timeout_seconds: Maximum time to wait for the service address
             
         Returns:
             UI access information
         """
         try:
-            # Wait a bit for service to be ready
-            time.sleep(2)
+            # Wait for the service, and its load balancer address if it has one
+            service = None
+            w = watch.Watch()
+            for event in w.stream(
+                self.core_v1.list_namespaced_service,
+                namespace=namespace,
+                field_selector=f"metadata.name={service_name}",
+                timeout_seconds=timeout_seconds
+            ):
+                if event["type"] not in ("ADDED", "MODIFIED"):
+                    continue
+                service = event["object"]
+                if service.spec.type != "LoadBalancer" or service.status.load_balancer.ingress:
+                    w.stop()
+                    break
             
-            service = self.core_v1.read_namespaced_service(service_name, namespace)
+            if service is None:
+                return f"UI Access: Run 'kubectl port-forward -n {namespace} svc/{service_name} 8080:443' then visit https://localhost:8080"
             
             if service.spec.type == "LoadBalancer":
                 if service.status.load_balancer.ingress:
@@ -351,12 +691,46 @@ Next Steps:
         except Exception as e:
             return f"UI Access: Run 'kubectl port-forward -n {namespace} svc/{service_name} 8080:443' then visit https://localhost:8080"
 
-    def check_argocd_installed(self, namespace: str = "argocd") -> Tuple[bool, str]:
+    def wait_for_server_ready(
+        self,
+        namespace: str,
+        release_name: str = "argocd",
+        timeout_seconds: int = 300
+    ) -> bool:
+        """
+        Wait for the ArgoCD server deployment to have all replicas ready.
+        
+        Args:
+            namespace: Kubernetes namespace
+            release_name: Helm release name (default matches the upstream manifests)
+            timeout_seconds: Maximum time to wait
+            
+        Returns:
+            True if the server became ready before the timeout
+        """
+        w = watch.Watch()
+        for event in w.stream(
+            self.apps_v1.list_namespaced_deployment,
+            namespace=namespace,
+            field_selector=f"metadata.name={argocd_server_name(release_name)}",
+            timeout_seconds=timeout_seconds
+        ):
+            if event["type"] not in ("ADDED", "MODIFIED"):
+                continue
+            deployment = event["object"]
+            ready_replicas = deployment.status.ready_replicas or 0
+            if ready_replicas > 0 and ready_replicas == (deployment.spec.replicas or 0):
+                w.stop()
+                return True
+        return False
+
+    def check_argocd_installed(self, namespace: str = "argocd", release_name: str = "argocd") -> Tuple[bool, str]:
         """
         Check if ArgoCD is already installed.
         
         Args:
             namespace: Kubernetes namespace to check
+            release_name: Helm release name (default matches the upstream manifests)
             
         Returns:
             Tuple of (is_installed, message)
@@ -372,23 +746,19 @@ Next Steps:
             
             # Check for ArgoCD server deployment
             try:
-                deployments = self.apps_v1.list_namespaced_deployment(namespace)
-                argocd_deployments = [d for d in deployments.items if "argocd-server" in d.metadata.name]
-                
-                if argocd_deployments:
-                    deployment = argocd_deployments[0]
-                    ready_replicas = deployment.status.ready_replicas or 0
-                    replicas = deployment.spec.replicas or 0
-                    
-                    if ready_replicas == replicas and ready_replicas > 0:
-                        return True, f"ArgoCD is installed and running in namespace '{namespace}'"
-                    else:
-                        return True, f"ArgoCD is installed but not fully ready ({ready_replicas}/{replicas} replicas)"
-                
-                return False, f"ArgoCD server deployment not found in namespace '{namespace}'"
-                
+                deployment = self.apps_v1.read_namespaced_deployment(argocd_server_name(release_name), namespace)
             except ApiException as e:
+                if e.status == 404:
+                    return False, f"ArgoCD server deployment not found in namespace '{namespace}'"
                 return False, f"Error checking deployments: {str(e)}"
+            
+            ready_replicas = deployment.status.ready_replicas or 0
+            replicas = deployment.spec.replicas or 0
+            
+            if ready_replicas == replicas and ready_replicas > 0:
+                return True, f"ArgoCD is installed and running in namespace '{namespace}'"
+            else:
+                return True, f"ArgoCD is installed but not fully ready ({ready_replicas}/{replicas} replicas)"
                 
         except Exception as e:
             return False, f"Error checking ArgoCD installation: {str(e)}"
@@ -1,25 +1,269 @@
 """Main CLI entry point for ArgoCD automation tool."""
 
 import click
+import json
 import os
-from rich.console import Console
-
-from argocd_cli.workflows_installer import WorkflowsInstaller
-from argocd_cli.template_generator import TemplateGenerator
-from argocd_cli.workflow_client import WorkflowClient
-from argocd_cli.validators import Validator
-from argocd_cli.formatters import Formatters
-from argocd_cli.config import get_config
-from argocd_cli.exceptions import (
-    ArgoCDCLIError,
-    ClusterAccessError,
-    ValidationError,
-    WorkflowSubmissionError,
-    TemplateError
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+# Repository URL patterns, compiled once at import
+_GIT_URL_RE = re.compile(r'\.git$|github\.com|gitlab\.com|bitbucket\.org|^git@|^git://|^ssh://')
+_HELM_REPO_URL_RE = re.compile(r'charts\.|artifacthub\.io|chartmuseum')
+
+# Workflow parameter spelling of booleans, indexed by the bool itself
+_BOOL_STR = ("false", "true")
+
+# Rich markup style per workflow phase in the delete confirmation table
+_PHASE_STYLE = {
+    "Succeeded": "green",
+    "Failed": "red",
+    "Error": "red",
+    "Running": "yellow",
+}
+
+
+# Fields every ApplicationSet environment must define, all strings
+_ENV_REQUIRED_FIELDS = ("name", "cluster", "namespace")
+
+# Keys accepted by `config set` and `config get`, in display order
+_CONFIG_KEYS = ("namespace", "cluster_context", "output_format", "kubeconfig")
+_VALID_CONFIG_KEYS = frozenset(_CONFIG_KEYS)
+
+# Allowed values for config keys that only take a fixed set
+_CONFIG_CHOICES = {"output_format": ("table", "json", "yaml")}
+
+# submit appset workflow parameters that must not be blank
+_REQUIRED_APPSET_PARAMS = ("appset_name", "namespace", "repo_url", "chart_path", "generator_type", "environments")
+
+
+def _validate_environment(idx: int, env) -> None:
+    """Validate one ApplicationSet environment entry.
+    
+    Raises:
+        ValueError: If the entry is not an object with the required string fields
+    """
+    if not isinstance(env, dict):
+        raise ValueError(f"Environment {idx} must be a JSON object")
+    
+    missing_fields = [f for f in _ENV_REQUIRED_FIELDS if f not in env]
+    if missing_fields:
+        raise ValueError(
+            f"Environment '{env.get('name', idx)}' missing required fields: {', '.join(missing_fields)}"
+        )
+    
+    for name in _ENV_REQUIRED_FIELDS:
+        if not isinstance(env[name], str):
+            raise ValueError(f"Environment '{env.get('name', idx)}' field '{name}' must be a string")
+
+
+def _validate_environments(environments_data) -> None:
+    """Validate the parsed --environments value.
+    
+    Raises:
+        ValueError: If it is not a non-empty array of valid environments
+    """
+    if not isinstance(environments_data, list):
+        raise ValueError("Environments must be a JSON array")
+    
+    if not environments_data:
+        raise ValueError("At least one environment must be specified")
+    
+    for idx, env in enumerate(environments_data):
+        _validate_environment(idx, env)
+
+
+def _load_environments_file(file_path: str) -> Tuple[list, Optional[str]]:
+    """Parse and validate an --environments @file.
+    
+    When ijson is installed the array is streamed and each environment is
+    validated as it is read, so the raw file is never held in memory
+    alongside the parsed list. Otherwise the file is parsed in one go.
+    
+    Args:
+        file_path: Path to a JSON file containing an array of environments
+        
+    Returns:
+        Tuple of (validated environments, raw file text or None when streamed)
+        
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON (non-streaming parse)
+        ValueError: If the file is not a valid environments array
+    """
+    try:
+        import ijson
+    except ImportError:
+        # Read bytes so the parser can skip a separate decode step
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        environments_data = _json_loads(raw)
+        _validate_environments(environments_data)
+        return environments_data, raw.decode()
+    
+    environments_data = []
+    with open(file_path, 'rb') as f:
+        # ijson yields nothing for a non-array document, so check the opening token
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        if first != b'[':
+            raise ValueError("Environments must be a JSON array")
+        f.seek(0)
+        
+        try:
+            for idx, env in enumerate(ijson.items(f, 'item', use_float=True)):
+                _validate_environment(idx, env)
+                environments_data.append(env)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in {file_path}: {str(e)}")
+    
+    if not environments_data:
+        raise ValueError("At least one environment must be specified")
+    return environments_data, None
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to JSON text, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj)
+    return orjson.dumps(obj).decode()
+
+
+_CONSOLE = None
+
+
+def _console():
+    """Create the rich console on first use so parser-only paths skip importing rich."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+class _LazyConsole:
+    """Forwards attribute access to the console returned by _console()."""
+
+    def __getattr__(self, name):
+        return getattr(_console(), name)
+
+
+console = _LazyConsole()
+
+
+# How long a successful cluster access check is trusted, in this process and across invocations
+CLUSTER_ACCESS_TTL = 30
+_ACCESS_CACHE_FILE = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "argocd_cli", "access.json"
 )
-from argocd_cli.error_handlers import handle_cli_errors
 
-console = Console()
+
+@dataclass
+class CliContext:
+    """Global options and per-invocation state shared with subcommands through ctx.obj."""
+    
+    kubeconfig: Optional[str] = None
+    context: Optional[str] = None
+    config: Any = None
+    workflows_namespace: str = "argo"
+    # Monotonic time of the last successful cluster access check
+    cluster_checked_at: Optional[float] = None
+    # WorkflowClient instances built during this invocation, keyed by namespace
+    workflow_clients: Dict[str, Any] = field(default_factory=dict)
+
+
+def _cluster_ok(ctx, validator) -> bool:
+    """Validate cluster access, skipping the API call if it succeeded within CLUSTER_ACCESS_TTL.
+    
+    Successes are remembered on ctx.obj and in a small cache file keyed by kubeconfig
+    and context, so scripts running several commands in a row only probe once.
+    
+    Args:
+        ctx: Click context whose obj holds the check timestamp
+        validator: Validator used when the cached result is missing or stale
+        
+    Returns:
+        True if cluster is accessible
+        
+    Raises:
+        ClusterAccessError: If cluster is not accessible
+    """
+    checked_at = ctx.obj.cluster_checked_at
+    if checked_at is not None and time.monotonic() - checked_at < CLUSTER_ACCESS_TTL:
+        return True
+    
+    key = f"{ctx.obj.kubeconfig or ''}|{ctx.obj.context or ''}"
+    try:
+        if time.time() - os.path.getmtime(_ACCESS_CACHE_FILE) < CLUSTER_ACCESS_TTL:
+            with open(_ACCESS_CACHE_FILE, 'rb') as f:
+                if _json_loads(f.read()).get('key') == key:
+                    ctx.obj.cluster_checked_at = time.monotonic()
+                    return True
+    except (OSError, ValueError, AttributeError):
+        pass
+    
+    if not validator.validate_cluster_access():
+        return False
+    
+    ctx.obj.cluster_checked_at = time.monotonic()
+    try:
+        os.makedirs(os.path.dirname(_ACCESS_CACHE_FILE), exist_ok=True)
+        with open(_ACCESS_CACHE_FILE, 'w') as f:
+            f.write(_json_dumps({'key': key}))
+    except OSError:
+        pass
+    return True
+
+
+def _parse_labels(label: tuple) -> dict:
+    """Turn repeated ``-l key=value`` options into a label dict, warning about malformed ones.
+    
+    Args:
+        label: Raw --label option values
+        
+    Returns:
+        Mapping of label keys to values
+    """
+    labels = {}
+    for label_str in label:
+        key, sep, value = label_str.partition('=')
+        if sep:
+            labels[key.strip()] = value.strip()
+        else:
+            from argocd_cli.formatters import Formatters
+            Formatters.print_warning(f"Ignoring invalid label format: {label_str}")
+    return labels
+
+
+def _get_workflow_client(ctx, namespace: str):
+    """Return the WorkflowClient for a namespace, reusing one from this invocation if built.
+    
+    Args:
+        ctx: Click context whose obj holds the client cache
+        namespace: Kubernetes namespace for workflows
+        
+    Returns:
+        WorkflowClient for the namespace
+    """
+    from argocd_cli.workflow_client import WorkflowClient
+    
+    clients = ctx.obj.workflow_clients
+    if namespace not in clients:
+        clients[namespace] = WorkflowClient(namespace=namespace)
+    return clients[namespace]
 
 
 @click.group()
@@ -86,8 +330,7 @@ def cli(ctx, kubeconfig, context):
     For more information on a specific command, use:
       argocd-cli COMMAND --help
     """
-    # Ensure context object exists
-    ctx.ensure_object(dict)
+    from argocd_cli.config import get_config
     
     # Load configuration
     config = get_config()
@@ -98,15 +341,13 @@ def cli(ctx, kubeconfig, context):
     effective_context = context or config.cluster_context
     
     # Store global options in context for use by subcommands
-    ctx.obj['kubeconfig'] = effective_kubeconfig
-    ctx.obj['context'] = effective_context
-    ctx.obj['config'] = config
+    ctx.obj = CliContext(kubeconfig=effective_kubeconfig, context=effective_context, config=config)
     
-    # Set environment variables if provided
-    if effective_kubeconfig:
+    # Set environment variables if provided and not already set to the same value
+    if effective_kubeconfig and os.environ.get('KUBECONFIG') != effective_kubeconfig:
         os.environ['KUBECONFIG'] = effective_kubeconfig
     
-    if effective_context:
+    if effective_context and os.environ.get('KUBE_CONTEXT') != effective_context:
         os.environ['KUBE_CONTEXT'] = effective_context
 
 
@@ -133,14 +374,11 @@ def workflows(ctx, namespace):
     in the config file (~/.argocd-cli/config.yaml), via ARGO_NAMESPACE
     environment variable, or overridden per command.
     """
-    # Get config from context
-    config = ctx.obj.get('config')
-    
-    # Use provided namespace, or fall back to config, or default to 'argo'
-    effective_namespace = namespace or (config.namespace if config else 'argo')
+    # Use provided namespace, or fall back to config (which defaults to 'argo')
+    effective_namespace = namespace or ctx.obj.config.namespace
     
     # Store namespace in context for subcommands
-    ctx.obj['workflows_namespace'] = effective_namespace
+    ctx.obj.workflows_namespace = effective_namespace
 
 
 @workflows.group()
@@ -182,8 +420,13 @@ def create(ctx, template_type: str):
     - Argo Workflows installed in the cluster
     - Sufficient cluster permissions to create WorkflowTemplates
     """
+    from argocd_cli.exceptions import ArgoCDCLIError
+    from argocd_cli.formatters import Formatters
+    from argocd_cli.template_generator import TemplateGenerator
+    from argocd_cli.validators import Validator
+    
     # Get namespace from context (set by workflows group)
-    namespace = ctx.obj.get('workflows_namespace', 'argo')
+    namespace = ctx.obj.workflows_namespace
     
     console.print("\n[bold cyan]Creating Workflow Templates...[/bold cyan]\n")
     
@@ -192,12 +435,14 @@ def create(ctx, template_type: str):
         validator = Validator()
         
         with console.status("[bold yellow]Validating cluster access...[/bold yellow]"):
-            if not validator.validate_cluster_access():
+            if not _cluster_ok(ctx, validator):
                 Formatters.print_error("Cannot access Kubernetes cluster")
-                console.print("\n[bold yellow]Troubleshooting:[/bold yellow]")
-                console.print("• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]")
-                console.print("• Check kubeconfig: [bold]kubectl config view[/bold]")
-                console.print("• Verify cluster connectivity: [bold]kubectl get nodes[/bold]\n")
+                console.print(
+                    "\n[bold yellow]Troubleshooting:[/bold yellow]\n"
+                    "• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]\n"
+                    "• Check kubeconfig: [bold]kubectl config view[/bold]\n"
+                    "• Verify cluster connectivity: [bold]kubectl get nodes[/bold]\n"
+                )
                 raise click.ClickException("Cluster access validation failed")
         
         Formatters.print_success("Cluster access validated")
@@ -206,14 +451,13 @@ def create(ctx, template_type: str):
         with console.status(f"[bold yellow]Validating namespace '{namespace}'...[/bold yellow]"):
             if not validator.validate_namespace(namespace):
                 Formatters.print_warning(f"Namespace '{namespace}' does not exist, creating it...")
-                import subprocess
-                result = subprocess.run(
-                    ["kubectl", "create", "namespace", namespace],
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode != 0:
-                    Formatters.print_error(f"Failed to create namespace: {result.stderr}")
+                from kubernetes import client as k8s_client
+                try:
+                    validator.core_api.create_namespace(
+                        k8s_client.V1Namespace(metadata=k8s_client.V1ObjectMeta(name=namespace))
+                    )
+                except Exception as e:
+                    Formatters.print_error(f"Failed to create namespace: {str(e)}")
                     raise click.ClickException(f"Namespace creation failed")
                 Formatters.print_success(f"Namespace '{namespace}' created")
             else:
@@ -228,39 +472,37 @@ def create(ctx, template_type: str):
         else:
             templates_to_create = [template_type]
         
-        created_templates = []
+        template_yamls = []
         
         for tmpl_type in templates_to_create:
-            console.print(f"\n[bold cyan]Creating {tmpl_type} template...[/bold cyan]")
-            
             try:
                 # Generate template YAML
                 with console.status(f"[bold yellow]Generating {tmpl_type} template YAML...[/bold yellow]"):
                     if tmpl_type == "application":
-                        template_yaml = generator.generate_application_template()
-                        template_name = "create-argocd-application"
+                        template_yamls.append(generator.generate_application_template())
                     elif tmpl_type == "applicationset":
-                        template_yaml = generator.generate_applicationset_template()
-                        template_name = "create-argocd-applicationset"
+                        template_yamls.append(generator.generate_applicationset_template())
                     elif tmpl_type == "infrastructure":
-                        template_yaml = generator.generate_infrastructure_template()
-                        template_name = "provision-infrastructure"
+                        template_yamls.append(generator.generate_infrastructure_template())
                 
                 Formatters.print_success(f"Generated {tmpl_type} template YAML")
                 
-                # Apply template to cluster
-                with console.status(f"[bold yellow]Applying {tmpl_type} template to cluster...[/bold yellow]"):
-                    generator.apply_template(template_yaml)
-                
-                Formatters.print_success(f"Template '{template_name}' created successfully")
-                created_templates.append(template_name)
-                
             except ValueError as e:
                 Formatters.print_error(f"Validation error for {tmpl_type} template: {str(e)}")
                 raise click.ClickException(f"Template validation failed: {str(e)}")
-            except RuntimeError as e:
-                Formatters.print_error(f"Failed to apply {tmpl_type} template: {str(e)}")
-                raise click.ClickException(f"Template application failed: {str(e)}")
+        
+        # Apply all templates to the cluster over one shared API client
+        try:
+            with console.status("[bold yellow]Applying templates to cluster...[/bold yellow]"):
+                created_templates = generator.apply_templates_batch(template_yamls)
+        except ArgoCDCLIError as e:
+            for template_name in getattr(e, "applied_templates", ()):
+                Formatters.print_success(f"Template '{template_name}' created successfully")
+            Formatters.print_error(f"Failed to apply templates: {e.message}")
+            raise click.ClickException(f"Template application failed: {e.message}")
+        
+        for template_name in created_templates:
+            Formatters.print_success(f"Template '{template_name}' created successfully")
         
         # Summary
         console.print(f"\n[bold green]✓ Successfully created {len(created_templates)} template(s)[/bold green]\n")
@@ -268,20 +510,24 @@ def create(ctx, template_type: str):
         for tmpl in created_templates:
             console.print(f"  • {tmpl}")
         
-        console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-        console.print("1. List templates: [bold]argocd-cli workflows templates list[/bold]")
-        console.print("2. Submit a workflow: [bold]argocd-cli workflows submit app[/bold]")
-        console.print("3. Monitor workflows: [bold]argocd-cli workflows list[/bold]\n")
+        console.print(
+            "\n[bold cyan]Next Steps:[/bold cyan]\n"
+            "1. List templates: [bold]argocd-cli workflows templates list[/bold]\n"
+            "2. Submit a workflow: [bold]argocd-cli workflows submit app[/bold]\n"
+            "3. Monitor workflows: [bold]argocd-cli workflows list[/bold]\n"
+        )
         
     except click.ClickException:
         raise
     except Exception as e:
-        console.print(f"\n[bold red]✗ Unexpected Error[/bold red]\n")
-        console.print(f"[red]{str(e)}[/red]\n")
-        console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-        console.print("• Verify Argo Workflows is installed: [bold]kubectl get pods -n argo[/bold]")
-        console.print("• Check cluster permissions: [bold]kubectl auth can-i create workflowtemplates.argoproj.io -n argo[/bold]")
-        console.print("• Review Argo Workflows logs: [bold]kubectl logs -n argo -l app=workflow-controller[/bold]\n")
+        console.print(
+            "\n[bold red]✗ Unexpected Error[/bold red]\n\n"
+            f"[red]{str(e)}[/red]\n\n"
+            "[bold yellow]Troubleshooting:[/bold yellow]\n"
+            "• Verify Argo Workflows is installed: [bold]kubectl get pods -n argo[/bold]\n"
+            "• Check cluster permissions: [bold]kubectl auth can-i create workflowtemplates.argoproj.io -n argo[/bold]\n"
+            "• Review Argo Workflows logs: [bold]kubectl logs -n argo -l app=workflow-controller[/bold]\n"
+        )
         raise click.ClickException(f"Template creation error: {str(e)}")
 
 
@@ -298,14 +544,16 @@ def list_templates(ctx):
     - kubectl configured with cluster access
     - Argo Workflows installed in the cluster
     """
+    from argocd_cli.formatters import Formatters
+    
     # Get namespace from context
-    namespace = ctx.obj.get('workflows_namespace', 'argo')
+    namespace = ctx.obj.workflows_namespace
     
     console.print("\n[bold cyan]Listing Workflow Templates...[/bold cyan]\n")
     
     try:
         # Initialize workflow client
-        client = WorkflowClient(namespace=namespace)
+        client = _get_workflow_client(ctx, namespace)
         
         # List templates
         with console.status(f"[bold yellow]Retrieving templates from namespace '{namespace}'...[/bold yellow]"):
@@ -316,20 +564,21 @@ def list_templates(ctx):
             console.print("\n[bold cyan]Tip:[/bold cyan] Create templates using: [bold]argocd-cli workflows templates create[/bold]\n")
             return
         
-        # Format and display templates
-        output = Formatters.format_template_list(templates)
-        console.print(output)
+        # Render templates straight to the terminal
+        Formatters.print_template_list(templates, console=_console())
         
         # Display additional information
         console.print(f"\n[dim]Found {len(templates)} template(s) in namespace '{namespace}'[/dim]\n")
         
     except Exception as e:
-        console.print(f"\n[bold red]✗ Error listing templates[/bold red]\n")
-        console.print(f"[red]{str(e)}[/red]\n")
-        console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-        console.print("• Verify cluster access: [bold]kubectl cluster-info[/bold]")
-        console.print("• Check namespace exists: [bold]kubectl get namespace argo[/bold]")
-        console.print("• Verify Argo Workflows is installed: [bold]kubectl get crd workflowtemplates.argoproj.io[/bold]\n")
+        console.print(
+            "\n[bold red]✗ Error listing templates[/bold red]\n\n"
+            f"[red]{str(e)}[/red]\n\n"
+            "[bold yellow]Troubleshooting:[/bold yellow]\n"
+            "• Verify cluster access: [bold]kubectl cluster-info[/bold]\n"
+            "• Check namespace exists: [bold]kubectl get namespace argo[/bold]\n"
+            "• Verify Argo Workflows is installed: [bold]kubectl get crd workflowtemplates.argoproj.io[/bold]\n"
+        )
         raise click.ClickException(f"Failed to list templates: {str(e)}")
 
 
@@ -478,8 +727,11 @@ def submit_app(
         --sync-policy auto \\
         --helm-parameters "replicas=3,image.tag=v2.0"
     """
+    from argocd_cli.formatters import Formatters
+    from argocd_cli.validators import Validator
+    
     # Get workflow namespace from context
-    workflow_namespace = ctx.obj.get('workflows_namespace', 'argo')
+    workflow_namespace = ctx.obj.workflows_namespace
     # Use app_namespace for the Application resource namespace
     namespace = app_namespace
     
@@ -488,15 +740,17 @@ def submit_app(
     try:
         # Initialize validator and workflow client
         validator = Validator()
-        client = WorkflowClient(namespace=workflow_namespace)
+        client = _get_workflow_client(ctx, workflow_namespace)
         
         # Validate cluster access
         with console.status("[bold yellow]Validating cluster access...[/bold yellow]"):
-            if not validator.validate_cluster_access():
+            if not _cluster_ok(ctx, validator):
                 Formatters.print_error("Cannot access Kubernetes cluster")
-                console.print("\n[bold yellow]Troubleshooting:[/bold yellow]")
-                console.print("• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]")
-                console.print("• Check kubeconfig: [bold]kubectl config view[/bold]\n")
+                console.print(
+                    "\n[bold yellow]Troubleshooting:[/bold yellow]\n"
+                    "• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]\n"
+                    "• Check kubeconfig: [bold]kubectl config view[/bold]\n"
+                )
                 raise click.ClickException("Cluster access validation failed")
         
         Formatters.print_success("Cluster access validated")
@@ -505,19 +759,14 @@ def submit_app(
         if not destination_namespace:
             destination_namespace = app_name
         
-        # Parse helm parameters if provided
-        helm_params_dict = {}
-        if helm_parameters:
-            try:
-                for param in helm_parameters.split(','):
-                    if '=' in param:
-                        key, value = param.split('=', 1)
-                        helm_params_dict[key.strip()] = value.strip()
-                    else:
-                        Formatters.print_warning(f"Ignoring invalid parameter format: {param}")
-            except Exception as e:
-                Formatters.print_error(f"Failed to parse helm parameters: {str(e)}")
-                raise click.ClickException("Invalid helm parameters format")
+        # Validate helm parameters if provided; they are forwarded as a string
+        normalized_params = re.sub(r'\s*([,=])\s*', r'\1', helm_parameters.strip()) if helm_parameters else ""
+        valid_params = []
+        for param in normalized_params.split(',') if normalized_params else []:
+            if '=' in param:
+                valid_params.append(param)
+            else:
+                Formatters.print_warning(f"Ignoring invalid parameter format: {param}")
         
         # Parse sync policy
         automated = sync_policy in ["auto", "auto-prune", "auto-heal"]
@@ -532,42 +781,34 @@ def submit_app(
             "chart_path": chart_path,
             "destination_cluster": destination_cluster,
             "destination_namespace": destination_namespace,
-            "sync_automated": str(automated).lower(),
-            "sync_prune": str(prune).lower(),
-            "sync_self_heal": str(self_heal).lower(),
+            "sync_automated": _BOOL_STR[automated],
+            "sync_prune": _BOOL_STR[prune],
+            "sync_self_heal": _BOOL_STR[self_heal],
         }
         
         # Add optional parameters
         if values_file:
             parameters["values_file"] = values_file
         
-        if helm_params_dict:
-            # Convert dict to comma-separated key=value format
-            parameters["helm_parameters"] = ",".join([f"{k}={v}" for k, v in helm_params_dict.items()])
+        if valid_params:
+            parameters["helm_parameters"] = (
+                normalized_params if len(valid_params) == normalized_params.count(',') + 1
+                else ",".join(valid_params)
+            )
         
-        # Validate required parameters
-        with console.status("[bold yellow]Validating parameters...[/bold yellow]"):
-            required_params = ["app_name", "namespace", "repo_url", "chart_path", 
-                             "destination_cluster", "destination_namespace"]
-            try:
-                validator.validate_parameters(required_params, parameters)
-            except Exception as e:
-                Formatters.print_error(f"Parameter validation failed: {str(e)}")
-                raise click.ClickException(str(e))
+        # Click already enforces the required options and the rest have defaults,
+        # so only reject values that were passed as empty strings
+        empty_params = [key for key in ("app_name", "repo_url", "chart_path") if not parameters[key].strip()]
+        if empty_params:
+            message = f"Empty required parameters: {', '.join(empty_params)}"
+            Formatters.print_error(f"Parameter validation failed: {message}")
+            raise click.ClickException(message)
         
         Formatters.print_success("Parameters validated")
         
         # Validate Git URL if it's a Git repository (not a Helm repository)
         # Check if it's actually a Git URL by looking for .git or known Git hosting patterns
-        is_git_repo = (
-            repo_url.endswith('.git') or
-            'github.com' in repo_url or
-            'gitlab.com' in repo_url or
-            'bitbucket.org' in repo_url or
-            repo_url.startswith('git@') or
-            repo_url.startswith('git://') or
-            repo_url.startswith('ssh://')
-        )
+        is_git_repo = bool(_GIT_URL_RE.search(repo_url))
         
         if is_git_repo:
             with console.status("[bold yellow]Validating repository URL...[/bold yellow]"):
@@ -579,19 +820,22 @@ def submit_app(
                     raise click.ClickException(str(e))
         
         # Display submission summary
-        console.print("\n[bold cyan]Workflow Submission Summary:[/bold cyan]")
-        console.print(f"  Application Name: [bold]{app_name}[/bold]")
-        console.print(f"  Namespace: [bold]{namespace}[/bold]")
-        console.print(f"  Repository: [bold]{repo_url}[/bold]")
-        console.print(f"  Chart Path: [bold]{chart_path}[/bold]")
-        console.print(f"  Destination Cluster: [bold]{destination_cluster}[/bold]")
-        console.print(f"  Destination Namespace: [bold]{destination_namespace}[/bold]")
-        console.print(f"  Sync Policy: [bold]{sync_policy}[/bold]")
+        summary_lines = [
+            "\n[bold cyan]Workflow Submission Summary:[/bold cyan]",
+            f"  Application Name: [bold]{app_name}[/bold]",
+            f"  Namespace: [bold]{namespace}[/bold]",
+            f"  Repository: [bold]{repo_url}[/bold]",
+            f"  Chart Path: [bold]{chart_path}[/bold]",
+            f"  Destination Cluster: [bold]{destination_cluster}[/bold]",
+            f"  Destination Namespace: [bold]{destination_namespace}[/bold]",
+            f"  Sync Policy: [bold]{sync_policy}[/bold]",
+        ]
         if values_file:
-            console.print(f"  Values File: [bold]{values_file}[/bold]")
-        if helm_params_dict:
-            console.print(f"  Helm Parameters: [bold]{len(helm_params_dict)} parameter(s)[/bold]")
-        console.print()
+            summary_lines.append(f"  Values File: [bold]{values_file}[/bold]")
+        if valid_params:
+            summary_lines.append(f"  Helm Parameters: [bold]{len(valid_params)} parameter(s)[/bold]")
+        summary_lines.append("")
+        console.print("\n".join(summary_lines))
         
         # Submit workflow
         with console.status("[bold yellow]Submitting workflow to Argo Workflows...[/bold yellow]"):
@@ -602,10 +846,12 @@ def submit_app(
                 )
             except Exception as e:
                 Formatters.print_error(f"Failed to submit workflow: {str(e)}")
-                console.print("\n[bold yellow]Troubleshooting:[/bold yellow]")
-                console.print("• Verify Argo Workflows is running: [bold]kubectl get pods -n argo[/bold]")
-                console.print("• Check WorkflowTemplate exists: [bold]argocd-cli workflows templates list[/bold]")
-                console.print("• Create templates if missing: [bold]argocd-cli workflows templates create[/bold]\n")
+                console.print(
+                    "\n[bold yellow]Troubleshooting:[/bold yellow]\n"
+                    "• Verify Argo Workflows is running: [bold]kubectl get pods -n argo[/bold]\n"
+                    "• Check WorkflowTemplate exists: [bold]argocd-cli workflows templates list[/bold]\n"
+                    "• Create templates if missing: [bold]argocd-cli workflows templates create[/bold]\n"
+                )
                 raise click.ClickException(f"Workflow submission failed: {str(e)}")
         
         Formatters.print_success(f"Workflow submitted: {workflow_name}")
@@ -614,12 +860,15 @@ def submit_app(
         with console.status("[bold yellow]Retrieving workflow status...[/bold yellow]"):
             try:
                 status = client.get_workflow_status(workflow_name)
-                console.print(f"\n[bold green]✓ Workflow Created Successfully[/bold green]\n")
-                console.print(f"  Workflow Name: [bold]{workflow_name}[/bold]")
-                console.print(f"  Status: [bold]{status.phase}[/bold]")
-                console.print(f"  Progress: [bold]{status.progress}[/bold]")
+                status_lines = [
+                    "\n[bold green]✓ Workflow Created Successfully[/bold green]\n",
+                    f"  Workflow Name: [bold]{workflow_name}[/bold]",
+                    f"  Status: [bold]{status.phase}[/bold]",
+                    f"  Progress: [bold]{status.progress}[/bold]",
+                ]
                 if status.started_at:
-                    console.print(f"  Started: [bold]{status.started_at.strftime('%Y-%m-%d %H:%M:%S')}[/bold]")
+                    status_lines.append(f"  Started: [bold]{status.started_at.strftime('%Y-%m-%d %H:%M:%S')}[/bold]")
+                console.print("\n".join(status_lines))
             except Exception as e:
                 # Don't fail if we can't get status, workflow was submitted successfully
                 Formatters.print_warning(f"Workflow submitted but status unavailable: {str(e)}")
@@ -627,65 +876,26 @@ def submit_app(
         # GitOps: Save manifest to Git repository or locally
         if gitops_repo or save_manifest:
             from argocd_cli.gitops import GitOpsManager
+            from argocd_cli.template_generator import TemplateGenerator
             
             console.print("\n[bold cyan]GitOps: Saving Application Manifest...[/bold cyan]\n")
             
             # Generate the Application manifest
             # Detect if this is a Helm repository or Git repository
-            is_helm_repo = 'charts.' in repo_url or 'artifacthub.io' in repo_url or 'chartmuseum' in repo_url
+            is_helm_repo = bool(_HELM_REPO_URL_RE.search(repo_url))
             
-            if is_helm_repo:
-                # Helm repository - use 'chart' field
-                manifest_content = f"""apiVersion: argoproj.io/v1alpha1
-kind: Application
-metadata:
-  name: {app_name}
-  namespace: {namespace}
-spec:
-  project: default
-  source:
-    repoURL: {repo_url}
-    chart: {chart_path}
-    targetRevision: "*"
-    helm: {{}}
-  destination:
-    server: {destination_cluster}
-    namespace: {destination_namespace}
-  syncPolicy:
-    syncOptions:
-    - CreateNamespace=true
-"""
-            else:
-                # Git repository - use 'path' field
-                manifest_content = f"""apiVersion: argoproj.io/v1alpha1
-kind: Application
-metadata:
-  name: {app_name}
-  namespace: {namespace}
-spec:
-  project: default
-  source:
-    repoURL: {repo_url}
-    path: {chart_path}
-    targetRevision: HEAD
-    helm: {{}}
-  destination:
-    server: {destination_cluster}
-    namespace: {destination_namespace}
-  syncPolicy:
-    syncOptions:
-    - CreateNamespace=true
-"""
-            
-            # Add sync policy if automated
-            if automated:
-                manifest_content = manifest_content.replace(
-                    "syncPolicy:",
-                    f"""syncPolicy:
-    automated:
-      selfHeal: {self_heal}
-      prune: {prune}"""
-                )
+            manifest_content = TemplateGenerator.render_application_yaml(
+                app_name=app_name,
+                namespace=namespace,
+                repo_url=repo_url,
+                chart_path=chart_path,
+                is_helm_repo=is_helm_repo,
+                destination_cluster=destination_cluster,
+                destination_namespace=destination_namespace,
+                automated=automated,
+                prune=prune,
+                self_heal=self_heal
+            )
             
             manifest_name = f"{app_name}.yaml"
             
@@ -717,8 +927,7 @@ spec:
             # Save locally
             if save_manifest:
                 try:
-                    gitops = GitOpsManager(repo_url="")  # Dummy URL for local save
-                    success, message = gitops.save_manifest_locally(
+                    success, message = GitOpsManager.save_manifest_locally(
                         manifest_content=manifest_content,
                         manifest_name=manifest_name
                     )
@@ -730,16 +939,17 @@ spec:
                     Formatters.print_warning(f"Local save failed: {str(e)}")
         
         # Display next steps
-        console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-        console.print(f"1. Monitor workflow: [bold]argocd-cli workflows status {workflow_name}[/bold]")
-        console.print(f"2. View logs: [bold]argocd-cli workflows logs {workflow_name}[/bold]")
-        console.print(f"3. List all workflows: [bold]argocd-cli workflows list[/bold]\n")
+        console.print(
+            "\n[bold cyan]Next Steps:[/bold cyan]\n"
+            f"1. Monitor workflow: [bold]argocd-cli workflows status {workflow_name}[/bold]\n"
+            f"2. View logs: [bold]argocd-cli workflows logs {workflow_name}[/bold]\n"
+            "3. List all workflows: [bold]argocd-cli workflows list[/bold]\n"
+        )
         
     except click.ClickException:
         raise
     except Exception as e:
-        console.print(f"\n[bold red]✗ Unexpected Error[/bold red]\n")
-        console.print(f"[red]{str(e)}[/red]\n")
+        console.print(f"\n[bold red]✗ Unexpected Error[/bold red]\n\n[red]{str(e)}[/red]\n")
         raise click.ClickException(f"Workflow submission error: {str(e)}")
 
 
@@ -828,34 +1038,37 @@ def submit_appset(
         --generator-type list \\
         --sync-policy auto
     """
+    from argocd_cli.formatters import Formatters
+    from argocd_cli.validators import Validator
+    
     # Get workflow namespace from context
-    workflow_namespace = ctx.obj.get('workflows_namespace', 'argo')
+    workflow_namespace = ctx.obj.workflows_namespace
     # Use app_namespace for the ApplicationSet resource namespace
     namespace = app_namespace
     
     console.print("\n[bold cyan]Submitting ApplicationSet Creation Workflow...[/bold cyan]\n")
     
     try:
-        import json
-        import os
-        
         # Initialize validator and workflow client
         validator = Validator()
-        client = WorkflowClient(namespace=workflow_namespace)
+        client = _get_workflow_client(ctx, workflow_namespace)
         
         # Validate cluster access
         with console.status("[bold yellow]Validating cluster access...[/bold yellow]"):
-            if not validator.validate_cluster_access():
+            if not _cluster_ok(ctx, validator):
                 Formatters.print_error("Cannot access Kubernetes cluster")
-                console.print("\n[bold yellow]Troubleshooting:[/bold yellow]")
-                console.print("• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]")
-                console.print("• Check kubeconfig: [bold]kubectl config view[/bold]\n")
+                console.print(
+                    "\n[bold yellow]Troubleshooting:[/bold yellow]\n"
+                    "• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]\n"
+                    "• Check kubeconfig: [bold]kubectl config view[/bold]\n"
+                )
                 raise click.ClickException("Cluster access validation failed")
         
         Formatters.print_success("Cluster access validated")
         
         # Parse environments JSON
         environments_data = None
+        environments_json = None
         with console.status("[bold yellow]Parsing environments configuration...[/bold yellow]"):
             try:
                 # Check if environments is a file path (starts with @)
@@ -865,30 +1078,12 @@ def submit_appset(
                         Formatters.print_error(f"Environments file not found: {file_path}")
                         raise click.ClickException(f"File not found: {file_path}")
                     
-                    with open(file_path, 'r') as f:
-                        environments_data = json.load(f)
+                    environments_data, environments_json = _load_environments_file(file_path)
                 else:
                     # Parse as JSON string
-                    environments_data = json.loads(environments)
-                
-                # Validate environments data structure
-                if not isinstance(environments_data, list):
-                    raise ValueError("Environments must be a JSON array")
-                
-                if len(environments_data) == 0:
-                    raise ValueError("At least one environment must be specified")
-                
-                # Validate each environment has required fields
-                for idx, env in enumerate(environments_data):
-                    if not isinstance(env, dict):
-                        raise ValueError(f"Environment {idx} must be a JSON object")
-                    
-                    required_fields = ["name", "cluster", "namespace"]
-                    missing_fields = [f for f in required_fields if f not in env]
-                    if missing_fields:
-                        raise ValueError(
-                            f"Environment '{env.get('name', idx)}' missing required fields: {', '.join(missing_fields)}"
-                        )
+                    environments_data = _json_loads(environments)
+                    _validate_environments(environments_data)
+                    environments_json = environments
                 
             except json.JSONDecodeError as e:
                 Formatters.print_error(f"Invalid JSON format: {str(e)}")
@@ -916,35 +1111,25 @@ def submit_appset(
             "repo_url": repo_url,
             "chart_path": chart_path,
             "generator_type": generator_type,
-            "environments": json.dumps(environments_data),
-            "sync_automated": str(automated).lower(),
-            "sync_prune": str(prune).lower(),
-            "sync_self_heal": str(self_heal).lower(),
+            # Validation does not modify the data, so forward the input text when we have it
+            "environments": environments_json if environments_json is not None else _json_dumps(environments_data),
+            "sync_automated": _BOOL_STR[automated],
+            "sync_prune": _BOOL_STR[prune],
+            "sync_self_heal": _BOOL_STR[self_heal],
         }
         
-        # Validate required parameters
-        with console.status("[bold yellow]Validating parameters...[/bold yellow]"):
-            required_params = ["appset_name", "namespace", "repo_url", "chart_path", 
-                             "generator_type", "environments"]
-            try:
-                validator.validate_parameters(required_params, parameters)
-            except Exception as e:
-                Formatters.print_error(f"Parameter validation failed: {str(e)}")
-                raise click.ClickException(str(e))
+        # Every required key is set above, so only reject values passed as empty strings
+        empty_params = [key for key in _REQUIRED_APPSET_PARAMS if not parameters[key].strip()]
+        if empty_params:
+            message = f"Empty required parameters: {', '.join(empty_params)}"
+            Formatters.print_error(f"Parameter validation failed: {message}")
+            raise click.ClickException(message)
         
         Formatters.print_success("Parameters validated")
         
         # Validate Git URL if it's a Git repository (not a Helm repository)
         # Check if it's actually a Git URL by looking for .git or known Git hosting patterns
-        is_git_repo = (
-            repo_url.endswith('.git') or
-            'github.com' in repo_url or
-            'gitlab.com' in repo_url or
-            'bitbucket.org' in repo_url or
-            repo_url.startswith('git@') or
-            repo_url.startswith('git://') or
-            repo_url.startswith('ssh://')
-        )
+        is_git_repo = bool(_GIT_URL_RE.search(repo_url))
         
         if is_git_repo:
             with console.status("[bold yellow]Validating repository URL...[/bold yellow]"):
@@ -956,14 +1141,16 @@ def submit_appset(
                     raise click.ClickException(str(e))
         
         # Display submission summary
-        console.print("\n[bold cyan]Workflow Submission Summary:[/bold cyan]")
-        console.print(f"  ApplicationSet Name: [bold]{appset_name}[/bold]")
-        console.print(f"  Namespace: [bold]{namespace}[/bold]")
-        console.print(f"  Repository: [bold]{repo_url}[/bold]")
-        console.print(f"  Chart Path: [bold]{chart_path}[/bold]")
-        console.print(f"  Generator Type: [bold]{generator_type}[/bold]")
-        console.print(f"  Sync Policy: [bold]{sync_policy}[/bold]")
-        console.print(f"  Environments: [bold]{len(environments_data)}[/bold]")
+        console.print(
+            "\n[bold cyan]Workflow Submission Summary:[/bold cyan]\n"
+            f"  ApplicationSet Name: [bold]{appset_name}[/bold]\n"
+            f"  Namespace: [bold]{namespace}[/bold]\n"
+            f"  Repository: [bold]{repo_url}[/bold]\n"
+            f"  Chart Path: [bold]{chart_path}[/bold]\n"
+            f"  Generator Type: [bold]{generator_type}[/bold]\n"
+            f"  Sync Policy: [bold]{sync_policy}[/bold]\n"
+            f"  Environments: [bold]{len(environments_data)}[/bold]"
+        )
         
         # Display environment details
         console.print("\n[bold cyan]Target Environments:[/bold cyan]")
@@ -980,10 +1167,12 @@ def submit_appset(
                 )
             except Exception as e:
                 Formatters.print_error(f"Failed to submit workflow: {str(e)}")
-                console.print("\n[bold yellow]Troubleshooting:[/bold yellow]")
-                console.print("• Verify Argo Workflows is running: [bold]kubectl get pods -n argo[/bold]")
-                console.print("• Check WorkflowTemplate exists: [bold]argocd-cli workflows templates list[/bold]")
-                console.print("• Create templates if missing: [bold]argocd-cli workflows templates create[/bold]\n")
+                console.print(
+                    "\n[bold yellow]Troubleshooting:[/bold yellow]\n"
+                    "• Verify Argo Workflows is running: [bold]kubectl get pods -n argo[/bold]\n"
+                    "• Check WorkflowTemplate exists: [bold]argocd-cli workflows templates list[/bold]\n"
+                    "• Create templates if missing: [bold]argocd-cli workflows templates create[/bold]\n"
+                )
                 raise click.ClickException(f"Workflow submission failed: {str(e)}")
         
         Formatters.print_success(f"Workflow submitted: {workflow_name}")
@@ -992,10 +1181,12 @@ def submit_appset(
         with console.status("[bold yellow]Retrieving workflow status...[/bold yellow]"):
             try:
                 status = client.get_workflow_status(workflow_name)
-                console.print(f"\n[bold green]✓ Workflow Created Successfully[/bold green]\n")
-                console.print(f"  Workflow Name: [bold]{workflow_name}[/bold]")
-                console.print(f"  Status: [bold]{status.phase}[/bold]")
-                console.print(f"  Progress: [bold]{status.progress}[/bold]")
+                console.print(
+                    "\n[bold green]✓ Workflow Created Successfully[/bold green]\n\n"
+                    f"  Workflow Name: [bold]{workflow_name}[/bold]\n"
+                    f"  Status: [bold]{status.phase}[/bold]\n"
+                    f"  Progress: [bold]{status.progress}[/bold]"
+                )
                 if status.started_at:
                     console.print(f"  Started: [bold]{status.started_at.strftime('%Y-%m-%d %H:%M:%S')}[/bold]")
                 
@@ -1008,11 +1199,13 @@ def submit_appset(
                 Formatters.print_warning(f"Workflow submitted but status unavailable: {str(e)}")
         
         # Display next steps
-        console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-        console.print(f"1. Monitor workflow: [bold]argocd-cli workflows status {workflow_name}[/bold]")
-        console.print(f"2. View logs: [bold]argocd-cli workflows logs {workflow_name}[/bold]")
-        console.print(f"3. List all workflows: [bold]argocd-cli workflows list[/bold]")
-        console.print(f"4. Check generated Applications: [bold]kubectl get applications -n {namespace}[/bold]\n")
+        console.print(
+            "\n[bold cyan]Next Steps:[/bold cyan]\n"
+            f"1. Monitor workflow: [bold]argocd-cli workflows status {workflow_name}[/bold]\n"
+            f"2. View logs: [bold]argocd-cli workflows logs {workflow_name}[/bold]\n"
+            "3. List all workflows: [bold]argocd-cli workflows list[/bold]\n"
+            f"4. Check generated Applications: [bold]kubectl get applications -n {namespace}[/bold]\n"
+        )
         
     except click.ClickException:
         raise
@@ -1052,24 +1245,18 @@ def list_workflows(ctx, label: tuple):
       # Filter by label
       argocd-cli workflows list -l app=myapp -l env=prod
     """
+    from argocd_cli.formatters import Formatters
+    
     # Get namespace from context
-    namespace = ctx.obj.get('workflows_namespace', 'argo')
+    namespace = ctx.obj.workflows_namespace
     
     console.print("\n[bold cyan]Listing Workflows...[/bold cyan]\n")
     
     try:
         # Initialize workflow client
-        client = WorkflowClient(namespace=namespace)
-        
-        # Parse labels
-        labels = {}
-        if label:
-            for label_str in label:
-                if '=' in label_str:
-                    key, value = label_str.split('=', 1)
-                    labels[key.strip()] = value.strip()
-                else:
-                    Formatters.print_warning(f"Ignoring invalid label format: {label_str}")
+        client = _get_workflow_client(ctx, namespace)
+        
+        labels = _parse_labels(label)
         
         # List workflows
         with console.status(f"[bold yellow]Retrieving workflows from namespace '{namespace}'...[/bold yellow]"):
@@ -1082,9 +1269,8 @@ def list_workflows(ctx, label: tuple):
             console.print("\n[bold cyan]Tip:[/bold cyan] Submit a workflow using: [bold]argocd-cli workflows submit app[/bold]\n")
             return
         
-        # Format and display workflows
-        output = Formatters.format_workflow_list(workflows)
-        console.print(output)
+        # Render workflows straight to the terminal
+        Formatters.print_workflow_list(workflows, console=_console())
         
         # Display additional information
         filter_info = ""
@@ -1093,12 +1279,14 @@ def list_workflows(ctx, label: tuple):
         console.print(f"\n[dim]Found {len(workflows)} workflow(s) in namespace '{namespace}'{filter_info}[/dim]\n")
         
     except Exception as e:
-        console.print(f"\n[bold red]✗ Error listing workflows[/bold red]\n")
-        console.print(f"[red]{str(e)}[/red]\n")
-        console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-        console.print("• Verify cluster access: [bold]kubectl cluster-info[/bold]")
-        console.print("• Check namespace exists: [bold]kubectl get namespace argo[/bold]")
-        console.print("• Verify Argo Workflows is installed: [bold]kubectl get crd workflows.argoproj.io[/bold]\n")
+        console.print(
+            "\n[bold red]✗ Error listing workflows[/bold red]\n\n"
+            f"[red]{str(e)}[/red]\n\n"
+            "[bold yellow]Troubleshooting:[/bold yellow]\n"
+            "• Verify cluster access: [bold]kubectl cluster-info[/bold]\n"
+            "• Check namespace exists: [bold]kubectl get namespace argo[/bold]\n"
+            "• Verify Argo Workflows is installed: [bold]kubectl get crd workflows.argoproj.io[/bold]\n"
+        )
         raise click.ClickException(f"Failed to list workflows: {str(e)}")
 
 
@@ -1108,7 +1296,7 @@ def list_workflows(ctx, label: tuple):
     "--watch",
     "-w",
     is_flag=True,
-    help="Watch workflow status in real-time (updates every 2 seconds)"
+    help="Watch workflow status in real-time as the workflow changes"
 )
 @click.pass_context
 def workflow_status(ctx, workflow_name: str, watch: bool):
@@ -1136,36 +1324,34 @@ def workflow_status(ctx, workflow_name: str, watch: bool):
       # Check workflow in different namespace
       argocd-cli workflows status my-workflow-abc123 -n my-namespace
     """
+    from argocd_cli.formatters import Formatters
+    
     # Get namespace from context
-    namespace = ctx.obj.get('workflows_namespace', 'argo')
+    namespace = ctx.obj.workflows_namespace
     
     try:
         # Initialize workflow client
-        client = WorkflowClient(namespace=namespace)
+        client = _get_workflow_client(ctx, namespace)
         
         if watch:
             # Watch mode - continuously update status
             console.print(f"\n[bold cyan]Watching Workflow Status (Press Ctrl+C to stop)...[/bold cyan]\n")
             
             try:
-                import time
-                while True:
-                    # Clear screen (works on most terminals)
-                    console.clear()
-                    console.print(f"\n[bold cyan]Workflow Status (updating every 2s)[/bold cyan]\n")
-                    
-                    # Get and display status
-                    status = client.get_workflow_status(workflow_name)
-                    output = Formatters.format_workflow_status(status)
-                    console.print(output)
-                    
-                    # Check if workflow is complete
-                    if status.phase in ["Succeeded", "Failed", "Error"]:
-                        console.print(f"\n[bold]Workflow completed with status: {status.phase}[/bold]")
-                        break
-                    
-                    # Wait before next update
-                    time.sleep(2)
+                from rich.console import Group
+                from rich.live import Live
+                from rich.text import Text
+                
+                header = Text.from_markup("[bold cyan]Workflow Status (live)[/bold cyan]\n")
+                
+                # Redraw in place; Live only rewrites the lines that changed.
+                # The watch yields on each server-side change and ends once the workflow finishes.
+                with Live(console=_console(), auto_refresh=False) as live:
+                    for status in client.watch_workflow_status(workflow_name):
+                        output = Formatters.format_workflow_status(status)
+                        live.update(Group(header, Text.from_ansi(output)), refresh=True)
+                
+                console.print(f"\n[bold]Workflow completed with status: {status.phase}[/bold]")
             except KeyboardInterrupt:
                 console.print("\n\n[dim]Stopped watching workflow status[/dim]\n")
         else:
@@ -1176,8 +1362,7 @@ def workflow_status(ctx, workflow_name: str, watch: bool):
                 status = client.get_workflow_status(workflow_name)
             
             # Display status
-            output = Formatters.format_workflow_status(status)
-            console.print(output)
+            Formatters.print_workflow_status(status, console=_console())
             
             # Display next steps based on status
             console.print("\n[bold cyan]Available Commands:[/bold cyan]")
@@ -1192,12 +1377,14 @@ def workflow_status(ctx, workflow_name: str, watch: bool):
             console.print()
         
     except Exception as e:
-        console.print(f"\n[bold red]✗ Error retrieving workflow status[/bold red]\n")
-        console.print(f"[red]{str(e)}[/red]\n")
-        console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-        console.print("• Verify workflow exists: [bold]argocd-cli workflows list[/bold]")
-        console.print(f"• Check workflow name: [bold]kubectl get workflows -n {namespace}[/bold]")
-        console.print("• Verify cluster access: [bold]kubectl cluster-info[/bold]\n")
+        console.print(
+            "\n[bold red]✗ Error retrieving workflow status[/bold red]\n\n"
+            f"[red]{str(e)}[/red]\n\n"
+            "[bold yellow]Troubleshooting:[/bold yellow]\n"
+            "• Verify workflow exists: [bold]argocd-cli workflows list[/bold]\n"
+            f"• Check workflow name: [bold]kubectl get workflows -n {namespace}[/bold]\n"
+            "• Verify cluster access: [bold]kubectl cluster-info[/bold]\n"
+        )
         raise click.ClickException(f"Failed to get workflow status: {str(e)}")
 
 
@@ -1241,12 +1428,14 @@ def workflow_logs(ctx, workflow_name: str, step: str, follow: bool):
       # Stream logs from specific step
       argocd-cli workflows logs my-workflow-abc123 -s create-application -f
     """
+    from argocd_cli.formatters import STYLED_LOG_LINE_RE, Formatters
+    
     # Get namespace from context
-    namespace = ctx.obj.get('workflows_namespace', 'argo')
+    namespace = ctx.obj.workflows_namespace
     
     try:
         # Initialize workflow client
-        client = WorkflowClient(namespace=namespace)
+        client = _get_workflow_client(ctx, namespace)
         
         if follow:
             # Stream logs in real-time
@@ -1254,10 +1443,14 @@ def workflow_logs(ctx, workflow_name: str, step: str, follow: bool):
             console.print(f"\n[bold cyan]Streaming Workflow Logs{step_info} (Press Ctrl+C to stop)...[/bold cyan]\n")
             
             try:
+                out = sys.stdout
                 for log_line in client.stream_workflow_logs(workflow_name, step=step, follow=True):
-                    # Format and display each log line
-                    formatted = Formatters.format_workflow_logs(log_line, highlight_errors=True)
-                    console.print(formatted, end='')
+                    # Only lines that get highlighted go through rich; plain lines are written directly
+                    if STYLED_LOG_LINE_RE.search(log_line):
+                        Formatters.print_workflow_logs(log_line, highlight_errors=True, console=_console())
+                    else:
+                        out.write(log_line + "\n")
+                        out.flush()
             except KeyboardInterrupt:
                 console.print("\n\n[dim]Stopped streaming logs[/dim]\n")
         else:
@@ -1270,27 +1463,29 @@ def workflow_logs(ctx, workflow_name: str, step: str, follow: bool):
             
             # Display logs with formatting
             if logs:
-                output = Formatters.format_workflow_logs(logs, highlight_errors=True)
-                console.print(output)
+                Formatters.print_workflow_logs(logs, highlight_errors=True, console=_console())
             else:
                 Formatters.print_warning("No logs available yet")
                 console.print("\n[bold cyan]Tip:[/bold cyan] Logs may not be available if the workflow hasn't started yet")
                 console.print(f"Check workflow status: [bold]argocd-cli workflows status {workflow_name}[/bold]\n")
             
             # Display next steps
-            console.print("\n[bold cyan]Available Commands:[/bold cyan]")
-            console.print(f"• Check status: [bold]argocd-cli workflows status {workflow_name}[/bold]")
-            console.print(f"• Stream logs: [bold]argocd-cli workflows logs {workflow_name} --follow[/bold]")
-            console.print(f"• List all workflows: [bold]argocd-cli workflows list[/bold]")
-            console.print()
+            console.print(
+                "\n[bold cyan]Available Commands:[/bold cyan]\n"
+                f"• Check status: [bold]argocd-cli workflows status {workflow_name}[/bold]\n"
+                f"• Stream logs: [bold]argocd-cli workflows logs {workflow_name} --follow[/bold]\n"
+                "• List all workflows: [bold]argocd-cli workflows list[/bold]\n"
+            )
         
     except Exception as e:
-        console.print(f"\n[bold red]✗ Error retrieving workflow logs[/bold red]\n")
-        console.print(f"[red]{str(e)}[/red]\n")
-        console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-        console.print("• Verify workflow exists: [bold]argocd-cli workflows list[/bold]")
-        console.print(f"• Check workflow status: [bold]argocd-cli workflows status {workflow_name}[/bold]")
-        console.print(f"• Verify pods are running: [bold]kubectl get pods -n {namespace} -l workflows.argoproj.io/workflow={workflow_name}[/bold]\n")
+        console.print(
+            "\n[bold red]✗ Error retrieving workflow logs[/bold red]\n\n"
+            f"[red]{str(e)}[/red]\n\n"
+            "[bold yellow]Troubleshooting:[/bold yellow]\n"
+            "• Verify workflow exists: [bold]argocd-cli workflows list[/bold]\n"
+            f"• Check workflow status: [bold]argocd-cli workflows status {workflow_name}[/bold]\n"
+            f"• Verify pods are running: [bold]kubectl get pods -n {namespace} -l workflows.argoproj.io/workflow={workflow_name}[/bold]\n"
+        )
         raise click.ClickException(f"Failed to get workflow logs: {str(e)}")
 
 
@@ -1319,8 +1514,15 @@ def workflow_logs(ctx, workflow_name: str, step: str, follow: bool):
     is_flag=True,
     help="Skip confirmation prompt"
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(1, 64),
+    default=10,
+    help="Maximum parallel delete requests when workflows are deleted one by one",
+    show_default=True
+)
 @click.pass_context
-def delete_workflow(ctx, workflow_name: str, label: tuple, all: bool, retain_logs: bool, yes: bool):
+def delete_workflow(ctx, workflow_name: str, label: tuple, all: bool, retain_logs: bool, yes: bool, concurrency: int):
     """
     Delete workflows from the cluster.
     
@@ -1354,38 +1556,49 @@ def delete_workflow(ctx, workflow_name: str, label: tuple, all: bool, retain_log
       # Delete without confirmation prompt
       argocd-cli workflows delete my-workflow-abc123 --yes
     """
+    import concurrent.futures
+    
+    from argocd_cli.exceptions import WorkflowNotFoundError
+    from argocd_cli.formatters import Formatters
+    
     # Get namespace from context
-    namespace = ctx.obj.get('workflows_namespace', 'argo')
+    namespace = ctx.obj.workflows_namespace
     
     console.print("\n[bold cyan]Deleting Workflows...[/bold cyan]\n")
     
     try:
         # Initialize workflow client
-        client = WorkflowClient(namespace=namespace)
+        client = _get_workflow_client(ctx, namespace)
         
         # Validate input - must provide either workflow_name, labels, or --all
         if not workflow_name and not label and not all:
             Formatters.print_error("Must specify either a workflow name, label selectors (-l), or --all flag")
-            console.print("\n[bold yellow]Examples:[/bold yellow]")
-            console.print("• Delete specific workflow: [bold]argocd-cli workflows delete my-workflow-abc123[/bold]")
-            console.print("• Delete by label: [bold]argocd-cli workflows delete -l app=myapp[/bold]")
-            console.print("• Delete all: [bold]argocd-cli workflows delete --all[/bold]\n")
+            console.print(
+                "\n[bold yellow]Examples:[/bold yellow]\n"
+                "• Delete specific workflow: [bold]argocd-cli workflows delete my-workflow-abc123[/bold]\n"
+                "• Delete by label: [bold]argocd-cli workflows delete -l app=myapp[/bold]\n"
+                "• Delete all: [bold]argocd-cli workflows delete --all[/bold]\n"
+            )
             raise click.ClickException("Invalid arguments")
         
-        # Parse labels
-        labels = {}
-        if label:
-            for label_str in label:
-                if '=' in label_str:
-                    key, value = label_str.split('=', 1)
-                    labels[key.strip()] = value.strip()
-                else:
-                    Formatters.print_warning(f"Ignoring invalid label format: {label_str}")
+        labels = _parse_labels(label)
+        if not workflow_name and not labels and not all:
+            # An empty selector would match every workflow, so never fall through to a delete
+            Formatters.print_warning("No valid label selectors given, nothing to delete")
+            return
+        
+        # Named deletes with --yes and unattended selector deletes (--yes, output not a
+        # terminal) skip the lookup and the confirmation table
+        skip_listing = yes and (bool(workflow_name) or not sys.stdout.isatty())
         
         # Determine workflows to delete
         workflows_to_delete = []
         
-        if workflow_name:
+        if workflow_name and yes:
+            # No confirmation table to show, so let the delete call report a missing workflow
+            workflows_to_delete = [{"name": workflow_name}]
+        
+        elif workflow_name:
             # Delete specific workflow by name
             with console.status(f"[bold yellow]Checking workflow '{workflow_name}'...[/bold yellow]"):
                 try:
@@ -1395,7 +1608,7 @@ def delete_workflow(ctx, workflow_name: str, label: tuple, all: bool, retain_log
                     Formatters.print_error(f"Workflow '{workflow_name}' not found: {str(e)}")
                     raise click.ClickException(f"Workflow not found: {workflow_name}")
         
-        elif labels or all:
+        elif not skip_listing:
             # Delete by label selector or all workflows
             with console.status(f"[bold yellow]Finding workflows to delete...[/bold yellow]"):
                 workflows = client.list_workflows(namespace=namespace, labels=labels if labels else None)
@@ -1418,29 +1631,23 @@ def delete_workflow(ctx, workflow_name: str, label: tuple, all: bool, retain_log
                         workflows_to_delete.append({"name": wf_name, "phase": wf_phase})
         
         # Display workflows to be deleted
-        console.print(f"[bold yellow]Found {len(workflows_to_delete)} workflow(s) to delete:[/bold yellow]\n")
-        
-        from rich.table import Table
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Workflow Name", style="white")
-        table.add_column("Status", style="white")
-        
-        for wf in workflows_to_delete:
-            # Color-code status
-            phase = wf["phase"]
-            if phase == "Succeeded":
-                status_display = f"[green]{phase}[/green]"
-            elif phase == "Failed" or phase == "Error":
-                status_display = f"[red]{phase}[/red]"
-            elif phase == "Running":
-                status_display = f"[yellow]{phase}[/yellow]"
-            else:
-                status_display = phase
+        if not skip_listing:
+            console.print(f"[bold yellow]Found {len(workflows_to_delete)} workflow(s) to delete:[/bold yellow]\n")
             
-            table.add_row(wf["name"], status_display)
-        
-        console.print(table)
-        console.print()
+            from rich.table import Table
+            table = Table(show_header=True, header_style="bold cyan")
+            table.add_column("Workflow Name", style="white")
+            table.add_column("Status", style="white")
+            
+            rows = [
+                (wf["name"], f"[{_PHASE_STYLE.get(wf['phase'], 'white')}]{wf['phase']}[/]")
+                for wf in workflows_to_delete
+            ]
+            for row in rows:
+                table.add_row(*row)
+            
+            console.print(table)
+            console.print()
         
         # Display deletion options
         if retain_logs:
@@ -1450,7 +1657,10 @@ def delete_workflow(ctx, workflow_name: str, label: tuple, all: bool, retain_log
         
         console.print()
         
-        # Confirmation prompt
+        # Confirmation prompt; without a terminal to answer it, require --yes instead of blocking
+        if not yes and not sys.stdin.isatty():
+            raise click.ClickException("Refusing to delete without --yes in non-interactive mode")
+        
         if not yes:
             confirm = click.confirm(
                 f"Are you sure you want to delete {len(workflows_to_delete)} workflow(s)?",
@@ -1466,14 +1676,58 @@ def delete_workflow(ctx, workflow_name: str, label: tuple, all: bool, retain_log
         deleted_count = 0
         failed_count = 0
         
-        with console.status("[bold yellow]Deleting workflows...[/bold yellow]"):
-            for wf in workflows_to_delete:
+        if not workflow_name:
+            # One collection delete instead of a request per workflow
+            with console.status("[bold yellow]Deleting workflows...[/bold yellow]"):
                 try:
-                    client.delete_workflow(wf["name"], delete_pods=not retain_logs)
-                    deleted_count += 1
+                    deleted_count = client.delete_workflows_by_selector(
+                        labels if labels else None, delete_pods=not retain_logs
+                    )
+                    workflows_to_delete = []
                 except Exception as e:
-                    Formatters.print_error(f"Failed to delete workflow '{wf['name']}': {str(e)}")
-                    failed_count += 1
+                    if skip_listing:
+                        # No listed names to fall back to: fail the command
+                        raise
+                    else:
+                        # e.g. RBAC grants delete but not deletecollection: fall back to the listed names
+                        Formatters.print_warning(f"Collection delete failed, deleting workflows individually: {str(e)}")
+        
+        if workflows_to_delete:
+            from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+            
+            # Per-workflow progress, advanced as each delete completes
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                console=_console(),
+            ) as progress:
+                task = progress.add_task("Deleting workflows", total=len(workflows_to_delete))
+                
+                # Deletes are independent API round-trips, so overlap them on a bounded pool
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(concurrency, len(workflows_to_delete))
+                ) as pool:
+                    futures = {
+                        pool.submit(client.delete_workflow, wf["name"], delete_pods=not retain_logs): wf
+                        for wf in workflows_to_delete
+                    }
+                    for future in concurrent.futures.as_completed(futures):
+                        wf = futures[future]
+                        progress.advance(task)
+                        try:
+                            future.result()
+                            deleted_count += 1
+                        except WorkflowNotFoundError as e:
+                            if workflow_name:
+                                Formatters.print_error(f"Workflow '{workflow_name}' not found: {str(e)}")
+                                raise click.ClickException(f"Workflow not found: {workflow_name}")
+                            Formatters.print_error(f"Failed to delete workflow '{wf['name']}': {str(e)}")
+                            failed_count += 1
+                        except Exception as e:
+                            Formatters.print_error(f"Failed to delete workflow '{wf['name']}': {str(e)}")
+                            failed_count += 1
         
         # Display results
         console.print()
@@ -1497,12 +1751,14 @@ def delete_workflow(ctx, workflow_name: str, label: tuple, all: bool, retain_log
     except click.ClickException:
         raise
     except Exception as e:
-        console.print(f"\n[bold red]✗ Error deleting workflows[/bold red]\n")
-        console.print(f"[red]{str(e)}[/red]\n")
-        console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-        console.print("• Verify cluster access: [bold]kubectl cluster-info[/bold]")
-        console.print(f"• Check workflows exist: [bold]argocd-cli workflows list -n {namespace}[/bold]")
-        console.print("• Verify permissions: [bold]kubectl auth can-i delete workflows.argoproj.io[/bold]\n")
+        console.print(
+            "\n[bold red]✗ Error deleting workflows[/bold red]\n\n"
+            f"[red]{str(e)}[/red]\n\n"
+            "[bold yellow]Troubleshooting:[/bold yellow]\n"
+            "• Verify cluster access: [bold]kubectl cluster-info[/bold]\n"
+            f"• Check workflows exist: [bold]argocd-cli workflows list -n {namespace}[/bold]\n"
+            "• Verify permissions: [bold]kubectl auth can-i delete workflows.argoproj.io[/bold]\n"
+        )
         raise click.ClickException(f"Failed to delete workflows: {str(e)}")
 
 
@@ -1530,8 +1786,10 @@ def install(ctx, release_name: str):
     - Helm 3.x installed
     - Sufficient cluster permissions
     """
+    from argocd_cli.workflows_installer import WorkflowsInstaller
+    
     # Get namespace from context
-    namespace = ctx.obj.get('workflows_namespace', 'argo')
+    namespace = ctx.obj.workflows_namespace
     
     console.print("\n[bold cyan]Installing Argo Workflows...[/bold cyan]\n")
     
@@ -1545,28 +1803,34 @@ def install(ctx, release_name: str):
         if success:
             console.print(f"\n[bold green]✓ Success![/bold green]\n")
             console.print(message)
-            console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-            console.print("1. Access the Argo Workflows UI using the URL above")
-            console.print("2. Create workflow templates: [bold]argocd-cli workflows templates create[/bold]")
-            console.print("3. Submit workflows: [bold]argocd-cli workflows submit app[/bold]\n")
+            console.print(
+                "\n[bold cyan]Next Steps:[/bold cyan]\n"
+                "1. Access the Argo Workflows UI using the URL above\n"
+                "2. Create workflow templates: [bold]argocd-cli workflows templates create[/bold]\n"
+                "3. Submit workflows: [bold]argocd-cli workflows submit app[/bold]\n"
+            )
         else:
-            console.print(f"\n[bold red]✗ Installation Failed[/bold red]\n")
-            console.print(f"[red]{message}[/red]\n")
-            console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-            console.print("• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]")
-            console.print("• Check Helm installation: [bold]helm version[/bold]")
-            console.print("• Verify cluster permissions: [bold]kubectl auth can-i create deployments --namespace argo[/bold]")
-            console.print("• Check existing installation: [bold]helm list -n argo[/bold]\n")
+            console.print(
+                "\n[bold red]✗ Installation Failed[/bold red]\n\n"
+                f"[red]{message}[/red]\n\n"
+                "[bold yellow]Troubleshooting:[/bold yellow]\n"
+                "• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]\n"
+                "• Check Helm installation: [bold]helm version[/bold]\n"
+                "• Verify cluster permissions: [bold]kubectl auth can-i create deployments --namespace argo[/bold]\n"
+                "• Check existing installation: [bold]helm list -n argo[/bold]\n"
+            )
             raise click.ClickException(message)
             
     except Exception as e:
-        console.print(f"\n[bold red]✗ Unexpected Error[/bold red]\n")
-        console.print(f"[red]{str(e)}[/red]\n")
-        console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-        console.print("• Ensure you have a valid kubeconfig file")
-        console.print("• Verify network connectivity to the cluster")
-        console.print("• Check cluster resource availability")
-        console.print("• Review logs: [bold]kubectl logs -n argo -l app.kubernetes.io/name=argo-workflows-server[/bold]\n")
+        console.print(
+            "\n[bold red]✗ Unexpected Error[/bold red]\n\n"
+            f"[red]{str(e)}[/red]\n\n"
+            "[bold yellow]Troubleshooting:[/bold yellow]\n"
+            "• Ensure you have a valid kubeconfig file\n"
+            "• Verify network connectivity to the cluster\n"
+            "• Check cluster resource availability\n"
+            "• Review logs: [bold]kubectl logs -n argo -l app.kubernetes.io/name=argo-workflows-server[/bold]\n"
+        )
         raise click.ClickException(f"Installation error: {str(e)}")
 
 
@@ -1604,7 +1868,7 @@ def argocd():
 @click.option(
     "--use-kubectl",
     is_flag=True,
-    help="Use kubectl manifests instead of Helm"
+    help="Apply the upstream install manifests instead of using Helm"
 )
 @click.option(
     "--version",
@@ -1617,7 +1881,7 @@ def install(namespace: str, release_name: str, use_kubectl: bool, version: str):
     
     This command will:
     - Validate cluster accessibility
-    - Install ArgoCD using Helm or kubectl
+    - Install ArgoCD using Helm or the upstream manifests
     - Display admin credentials
     - Show UI access URL
     
@@ -1634,7 +1898,7 @@ def install(namespace: str, release_name: str, use_kubectl: bool, version: str):
       # Install in custom namespace
       argocd-cli argocd install -n my-argocd
       
-      # Install using kubectl manifests
+      # Install using the upstream manifests
       argocd-cli argocd install --use-kubectl
       
       # Install specific version
@@ -1653,25 +1917,30 @@ def install(namespace: str, release_name: str, use_kubectl: bool, version: str):
                 namespace=namespace,
                 release_name=release_name,
                 use_helm=not use_kubectl,
-                version=version
+                version=version,
+                output_callback=lambda line: console.print(line, markup=False, style="dim")
             )
         
         if success:
             console.print(f"\n[bold green]✓ Success![/bold green]\n")
             console.print(message)
-            console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-            console.print("1. Access the ArgoCD UI using the URL above")
-            console.print("2. Login with the admin credentials")
-            console.print("3. Install Argo Workflows: [bold]argocd-cli workflows install[/bold]")
-            console.print("4. Create workflow templates: [bold]argocd-cli workflows templates create[/bold]\n")
+            console.print(
+                "\n[bold cyan]Next Steps:[/bold cyan]\n"
+                "1. Access the ArgoCD UI using the URL above\n"
+                "2. Login with the admin credentials\n"
+                "3. Install Argo Workflows: [bold]argocd-cli workflows install[/bold]\n"
+                "4. Create workflow templates: [bold]argocd-cli workflows templates create[/bold]\n"
+            )
         else:
-            console.print(f"\n[bold red]✗ Installation Failed[/bold red]\n")
-            console.print(f"[red]{message}[/red]\n")
-            console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-            console.print("• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]")
-            console.print("• Check Helm installation: [bold]helm version[/bold]")
-            console.print("• Verify cluster permissions: [bold]kubectl auth can-i create deployments --namespace argocd[/bold]")
-            console.print("• Check existing installation: [bold]argocd-cli argocd status[/bold]\n")
+            console.print(
+                "\n[bold red]✗ Installation Failed[/bold red]\n\n"
+                f"[red]{message}[/red]\n\n"
+                "[bold yellow]Troubleshooting:[/bold yellow]\n"
+                "• Verify kubectl is configured: [bold]kubectl cluster-info[/bold]\n"
+                "• Check Helm installation: [bold]helm version[/bold]\n"
+                "• Verify cluster permissions: [bold]kubectl auth can-i create deployments --namespace argocd[/bold]\n"
+                "• Check existing installation: [bold]argocd-cli argocd status[/bold]\n"
+            )
             raise click.ClickException(message)
             
     except Exception as e:
@@ -1688,7 +1957,14 @@ def install(namespace: str, release_name: str, use_kubectl: bool, version: str):
     help="Kubernetes namespace to check",
     show_default=True
 )
-def status(namespace: str):
+@click.option(
+    "--release-name",
+    "-r",
+    default="argocd",
+    help="Helm release name for ArgoCD",
+    show_default=True
+)
+def status(namespace: str, release_name: str):
     """
     Check ArgoCD installation status.
     
@@ -1702,7 +1978,8 @@ def status(namespace: str):
       # Check custom namespace
       argocd-cli argocd status -n my-argocd
     """
-    from argocd_cli.argocd_installer import ArgoCDInstaller
+    from argocd_cli.formatters import Formatters
+    from argocd_cli.argocd_installer import ArgoCDInstaller, argocd_server_name
     
     console.print("\n[bold cyan]Checking ArgoCD Status...[/bold cyan]\n")
     
@@ -1710,19 +1987,21 @@ def status(namespace: str):
         installer = ArgoCDInstaller()
         
         with console.status("[bold yellow]Checking installation...[/bold yellow]"):
-            is_installed, message = installer.check_argocd_installed(namespace)
+            is_installed, message = installer.check_argocd_installed(namespace, release_name)
         
         if is_installed:
             Formatters.print_success(message)
             
             # Get admin password
-            admin_password = installer.get_admin_password(namespace)
-            console.print(f"\n[bold cyan]Admin Credentials:[/bold cyan]")
-            console.print(f"  Username: [bold]admin[/bold]")
-            console.print(f"  Password: [bold]{admin_password}[/bold]")
+            admin_password = installer.get_admin_password(namespace, timeout_seconds=5)
+            console.print(
+                "\n[bold cyan]Admin Credentials:[/bold cyan]\n"
+                "  Username: [bold]admin[/bold]\n"
+                f"  Password: [bold]{admin_password}[/bold]"
+            )
             
             # Get UI URL
-            ui_url = installer.get_ui_url(namespace, "argocd-server")
+            ui_url = installer.get_ui_url(namespace, argocd_server_name(release_name), timeout_seconds=5)
             console.print(f"\n{ui_url}\n")
         else:
             Formatters.print_warning(message)
@@ -1759,29 +2038,33 @@ def config_init():
     Creates ~/.argocd-cli/config.yaml with default configuration.
     If the file already exists, it will not be overwritten.
     """
-    from pathlib import Path
+    from argocd_cli.config import get_config
     
     config_obj = get_config()
     config_path = config_obj.config_path
     
     if config_path.exists():
-        console.print(f"\n[bold yellow]Configuration file already exists:[/bold yellow] {config_path}\n")
-        console.print("Use [bold]argocd-cli config set[/bold] to modify values")
-        console.print("or [bold]argocd-cli config show[/bold] to view current configuration\n")
+        console.print(
+            f"\n[bold yellow]Configuration file already exists:[/bold yellow] {config_path}\n\n"
+            "Use [bold]argocd-cli config set[/bold] to modify values\n"
+            "or [bold]argocd-cli config show[/bold] to view current configuration\n"
+        )
         return
     
     try:
         config_obj.create_default_config()
-        console.print(f"\n[bold green]✓ Configuration file created:[/bold green] {config_path}\n")
-        console.print("[bold cyan]Default Configuration:[/bold cyan]")
-        console.print(f"  namespace: {config_obj.namespace}")
-        console.print(f"  cluster_context: {config_obj.cluster_context or 'None (use current context)'}")
-        console.print(f"  output_format: {config_obj.output_format}")
-        console.print(f"  kubeconfig: {config_obj.kubeconfig or 'None (use default)'}")
-        console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-        console.print("• View configuration: [bold]argocd-cli config show[/bold]")
-        console.print("• Set values: [bold]argocd-cli config set namespace my-namespace[/bold]")
-        console.print("• Edit file directly: [bold]$EDITOR ~/.argocd-cli/config.yaml[/bold]\n")
+        console.print(
+            f"\n[bold green]✓ Configuration file created:[/bold green] {config_path}\n\n"
+            "[bold cyan]Default Configuration:[/bold cyan]\n"
+            f"  namespace: {config_obj.namespace}\n"
+            f"  cluster_context: {config_obj.cluster_context or 'None (use current context)'}\n"
+            f"  output_format: {config_obj.output_format}\n"
+            f"  kubeconfig: {config_obj.kubeconfig or 'None (use default)'}\n"
+            "\n[bold cyan]Next Steps:[/bold cyan]\n"
+            "• View configuration: [bold]argocd-cli config show[/bold]\n"
+            "• Set values: [bold]argocd-cli config set namespace my-namespace[/bold]\n"
+            "• Edit file directly: [bold]$EDITOR ~/.argocd-cli/config.yaml[/bold]\n"
+        )
     except Exception as e:
         console.print(f"\n[bold red]✗ Failed to create configuration file[/bold red]\n")
         console.print(f"[red]{str(e)}[/red]\n")
@@ -1795,6 +2078,8 @@ def config_show():
     Shows the effective configuration including values from the config file,
     environment variables, and defaults.
     """
+    from argocd_cli.config import get_config
+    
     config_obj = get_config()
     config_path = config_obj.config_path
     
@@ -1806,11 +2091,13 @@ def config_show():
     else:
         console.print("[bold green]Status:[/bold green] Initialized")
     
-    console.print("\n[bold cyan]Current Configuration:[/bold cyan]")
-    console.print(f"  namespace: [bold]{config_obj.namespace}[/bold]")
-    console.print(f"  cluster_context: [bold]{config_obj.cluster_context or 'None (use current context)'}[/bold]")
-    console.print(f"  output_format: [bold]{config_obj.output_format}[/bold]")
-    console.print(f"  kubeconfig: [bold]{config_obj.kubeconfig or 'None (use default)'}[/bold]")
+    console.print(
+        "\n[bold cyan]Current Configuration:[/bold cyan]\n"
+        f"  namespace: [bold]{config_obj.namespace}[/bold]\n"
+        f"  cluster_context: [bold]{config_obj.cluster_context or 'None (use current context)'}[/bold]\n"
+        f"  output_format: [bold]{config_obj.output_format}[/bold]\n"
+        f"  kubeconfig: [bold]{config_obj.kubeconfig or 'None (use default)'}[/bold]"
+    )
     
     console.print("\n[bold cyan]Environment Variables:[/bold cyan]")
     env_vars = {
@@ -1826,9 +2113,11 @@ def config_show():
         else:
             console.print(f"  {key}: [dim]Not set[/dim]")
     
-    console.print("\n[bold cyan]Available Commands:[/bold cyan]")
-    console.print("• Modify configuration: [bold]argocd-cli config set KEY VALUE[/bold]")
-    console.print("• Edit file directly: [bold]$EDITOR ~/.argocd-cli/config.yaml[/bold]\n")
+    console.print(
+        "\n[bold cyan]Available Commands:[/bold cyan]\n"
+        "• Modify configuration: [bold]argocd-cli config set KEY VALUE[/bold]\n"
+        "• Edit file directly: [bold]$EDITOR ~/.argocd-cli/config.yaml[/bold]\n"
+    )
 
 
 @config.command("set")
@@ -1854,29 +2143,34 @@ def config_set(key: str, value: str):
       # Set kubeconfig path
       argocd-cli config set kubeconfig /path/to/kubeconfig
     """
+    from argocd_cli.config import get_config
+    
     config_obj = get_config()
     
     # Validate key
-    valid_keys = ['namespace', 'cluster_context', 'output_format', 'kubeconfig']
-    if key not in valid_keys:
+    if key not in _VALID_CONFIG_KEYS:
         console.print(f"\n[bold red]✗ Invalid configuration key:[/bold red] {key}\n")
-        console.print(f"[bold cyan]Valid keys:[/bold cyan] {', '.join(valid_keys)}\n")
+        console.print(f"[bold cyan]Valid keys:[/bold cyan] {', '.join(_CONFIG_KEYS)}\n")
         raise click.ClickException(f"Invalid configuration key: {key}")
     
-    # Validate value for specific keys
-    if key == 'output_format' and value not in ['table', 'json', 'yaml']:
-        console.print(f"\n[bold red]✗ Invalid output format:[/bold red] {value}\n")
-        console.print("[bold cyan]Valid formats:[/bold cyan] table, json, yaml\n")
-        raise click.ClickException(f"Invalid output format: {value}")
+    # Validate value for keys with a fixed set of choices
+    choices = _CONFIG_CHOICES.get(key)
+    if choices and value not in choices:
+        label = key.replace('_', ' ')
+        console.print(f"\n[bold red]✗ Invalid {label}:[/bold red] {value}\n")
+        console.print(f"[bold cyan]Valid values:[/bold cyan] {', '.join(choices)}\n")
+        raise click.ClickException(f"Invalid {label}: {value}")
     
     try:
         # Set value
         config_obj.set(key, value)
         config_obj.save()
         
-        console.print(f"\n[bold green]✓ Configuration updated[/bold green]\n")
-        console.print(f"  {key}: [bold]{value}[/bold]")
-        console.print(f"\n[dim]Configuration saved to: {config_obj.config_path}[/dim]\n")
+        console.print(
+            "\n[bold green]✓ Configuration updated[/bold green]\n\n"
+            f"  {key}: [bold]{value}[/bold]\n"
+            f"\n[dim]Configuration saved to: {config_obj.config_path}[/dim]\n"
+        )
         
     except Exception as e:
         console.print(f"\n[bold red]✗ Failed to update configuration[/bold red]\n")
@@ -1899,13 +2193,14 @@ def config_get(key: str):
       # Get cluster context
       argocd-cli config get cluster_context
     """
+    from argocd_cli.config import get_config
+    
     config_obj = get_config()
     
     # Validate key
-    valid_keys = ['namespace', 'cluster_context', 'output_format', 'kubeconfig']
-    if key not in valid_keys:
+    if key not in _VALID_CONFIG_KEYS:
         console.print(f"\n[bold red]✗ Invalid configuration key:[/bold red] {key}\n")
-        console.print(f"[bold cyan]Valid keys:[/bold cyan] {', '.join(valid_keys)}\n")
+        console.print(f"[bold cyan]Valid keys:[/bold cyan] {', '.join(_CONFIG_KEYS)}\n")
         raise click.ClickException(f"Invalid configuration key: {key}")
     
     value = config_obj.get(key)
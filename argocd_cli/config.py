@@ -1,10 +1,21 @@
 """Configuration management for ArgoCD CLI."""
 
+import functools
+import logging
 import os
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+logger = logging.getLogger(__name__)
+
+# Environment overrides for config keys, read once when the module is imported
+_ENV_OVERRIDES = {
+    "namespace": os.environ.get("ARGO_NAMESPACE"),
+    "cluster_context": os.environ.get("KUBE_CONTEXT"),
+    "kubeconfig": os.environ.get("KUBECONFIG"),
+    "output_format": os.environ.get("ARGOCD_CLI_OUTPUT_FORMAT"),
+}
+
 
 class Config:
     """Manages CLI configuration from file and environment variables."""
@@ -25,7 +36,20 @@ class Config:
             config_path: Path to configuration file. Defaults to ~/.argocd-cli/config.yaml
         """
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
-        self.config = self._load_config()
+        # Plain string form for os.path calls, which skip pathlib's per-call object overhead
+        self._config_path_str = os.fspath(self.config_path)
+        self._config = None
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration values, loaded from file and environment on first access."""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default config.
@@ -37,27 +61,22 @@ class Config:
         config = self.DEFAULT_CONFIG.copy()
         
         # Load from file if it exists
-        if self.config_path.exists():
+        if os.path.exists(self._config_path_str):
             try:
-                with open(self.config_path, 'r') as f:
-                    file_config = yaml.safe_load(f) or {}
+                # Imported here so runs without a config file never load yaml
+                import yaml
+                
+                # libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                with open(self._config_path_str, 'r') as f:
+                    file_config = yaml.load(f, Loader=loader) or {}
                     config.update(file_config)
-            except Exception as e:
+            except (yaml.YAMLError, OSError, TypeError, ValueError) as e:
                 # If config file is invalid, use defaults
-                print(f"Warning: Failed to load config from {self.config_path}: {e}")
+                logger.warning("Failed to load config from %s: %s", self.config_path, e)
         
         # Override with environment variables
-        if os.getenv('ARGO_NAMESPACE'):
-            config['namespace'] = os.getenv('ARGO_NAMESPACE')
-        
-        if os.getenv('KUBE_CONTEXT'):
-            config['cluster_context'] = os.getenv('KUBE_CONTEXT')
-        
-        if os.getenv('KUBECONFIG'):
-            config['kubeconfig'] = os.getenv('KUBECONFIG')
-        
-        if os.getenv('ARGOCD_CLI_OUTPUT_FORMAT'):
-            config['output_format'] = os.getenv('ARGOCD_CLI_OUTPUT_FORMAT')
+        config.update({key: value for key, value in _ENV_OVERRIDES.items() if value})
         
         return config
     
@@ -83,17 +102,31 @@ class Config:
         self.config[key] = value
     
     def save(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file.
+        
+        The file is written to a temporary sibling and renamed over the
+        original, so an interrupted save never leaves a truncated config.
+        """
+        import yaml
+        
         # Create config directory if it doesn't exist
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write config to file
-        with open(self.config_path, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False)
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                yaml.dump(self.config, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._config_path_str)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
     def create_default_config(self) -> None:
         """Create default configuration file if it doesn't exist."""
-        if not self.config_path.exists():
+        if not os.path.exists(self._config_path_str):
             self.config = self.DEFAULT_CONFIG.copy()
             self.save()
     
@@ -118,25 +151,20 @@ class Config:
         return self.get('kubeconfig')
 
 
-# Global config instance
-_config_instance: Optional[Config] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_config(config_path: Optional[Path] = None) -> Config:
     """Get global configuration instance.
     
+    The instance is cached, so the config file is read and parsed once
+    per process for a given path.
+    
     Args:
         config_path: Optional path to configuration file
         
     Returns:
         Config instance
     """
-    global _config_instance
-    
-    if _config_instance is None:
-        _config_instance = Config(config_path)
-    
-    return _config_instance
+    return Config(config_path)
 
 
 def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
@@ -24,6 +24,14 @@ from argocd_cli.exceptions import (
 
 console = Console()
 
+# Guidance shown for exceptions that are not ArgoCDCLIError subclasses
+_UNEXPECTED_ERROR_HELP = (
+    "[bold yellow]Troubleshooting:[/bold yellow]\n"
+    "• This is an unexpected error. Please report it if it persists.\n"
+    "• Check the error message above for details.\n"
+    "• Verify your environment and configuration.\n"
+)
+
 
 def handle_cli_errors(func):
     """Decorator to handle CLI errors with consistent formatting.
@@ -36,14 +44,12 @@ def handle_cli_errors(func):
         try:
             return func(*args, **kwargs)
         except ArgoCDCLIError as e:
-            # Handle all custom CLI errors
-            console.print(f"\n[bold red]✗ Error[/bold red]\n")
-            console.print(f"[red]{e.message}[/red]\n")
-            
-            # Display troubleshooting steps if available
+            # Handle all custom CLI errors, with troubleshooting steps if available
+            output = f"\n[bold red]✗ Error[/bold red]\n\n[red]{e.message}[/red]\n"
             troubleshooting = e.get_troubleshooting_text()
             if troubleshooting:
-                console.print(f"[bold yellow]{troubleshooting}[/bold yellow]\n")
+                output += f"\n[bold yellow]{troubleshooting}[/bold yellow]\n"
+            console.print(output)
             
             raise click.ClickException(e.message)
             
@@ -57,12 +63,7 @@ def handle_cli_errors(func):
             
         except Exception as e:
             # Handle unexpected errors
-            console.print(f"\n[bold red]✗ Unexpected Error[/bold red]\n")
-            console.print(f"[red]{str(e)}[/red]\n")
-            console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-            console.print("• This is an unexpected error. Please report it if it persists.")
-            console.print("• Check the error message above for details.")
-            console.print("• Verify your environment and configuration.\n")
+            console.print(f"\n[bold red]✗ Unexpected Error[/bold red]\n\n[red]{str(e)}[/red]\n\n{_UNEXPECTED_ERROR_HELP}")
             raise click.ClickException(f"Unexpected error: {str(e)}")
     
     return wrapper
@@ -92,14 +93,11 @@ def print_error(message: str, troubleshooting: list = None):
         message: Error message to display
         troubleshooting: Optional list of troubleshooting suggestions
     """
-    console.print(f"\n[bold red]✗ Error[/bold red]\n")
-    console.print(f"[red]{message}[/red]\n")
-    
+    output = f"\n[bold red]✗ Error[/bold red]\n\n[red]{message}[/red]\n"
     if troubleshooting:
-        console.print("[bold yellow]Troubleshooting:[/bold yellow]")
-        for step in troubleshooting:
-            console.print(f"• {step}")
-        console.print()
+        steps = "".join(f"• {step}\n" for step in troubleshooting)
+        output += f"\n[bold yellow]Troubleshooting:[/bold yellow]\n{steps}"
+    console.print(output)
 
 
 def print_warning(message: str):
@@ -1,18 +1,26 @@
 """Custom exceptions for ArgoCD CLI with detailed error messages and troubleshooting guidance."""
 
+from typing import Callable, Dict, Optional, Sequence
+
+# Resolved once at import rather than on every handle_kubernetes_api_exception call
+try:
+    from kubernetes.client.rest import ApiException
+except ImportError:
+    ApiException = None
+
 
 class ArgoCDCLIError(Exception):
     """Base exception for all ArgoCD CLI errors."""
     
-    def __init__(self, message: str, troubleshooting: list = None):
+    def __init__(self, message: str, troubleshooting: Optional[Sequence[str]] = None):
         """Initialize exception with message and optional troubleshooting steps.
         
         Args:
             message: Error message describing what went wrong
-            troubleshooting: List of troubleshooting suggestions
+            troubleshooting: Sequence of troubleshooting suggestions, stored without copying
         """
         self.message = message
-        self.troubleshooting = troubleshooting or []
+        self.troubleshooting = troubleshooting or ()
         super().__init__(self.message)
     
     def get_troubleshooting_text(self) -> str:
@@ -24,24 +32,22 @@ class ArgoCDCLIError(Exception):
         if not self.troubleshooting:
             return ""
         
-        lines = ["Troubleshooting:"]
-        for step in self.troubleshooting:
-            lines.append(f"• {step}")
-        return "\n".join(lines)
+        return "Troubleshooting:\n" + "\n".join(f"• {step}" for step in self.troubleshooting)
 
 
 class ClusterAccessError(ArgoCDCLIError):
     """Raised when cluster access validation fails."""
     
+    _TROUBLESHOOTING = (
+        "Verify kubectl is configured: kubectl cluster-info",
+        "Check kubeconfig file: kubectl config view",
+        "Verify cluster connectivity: kubectl get nodes",
+        "Ensure you have valid credentials: kubectl auth whoami",
+        "Check if cluster is reachable: ping <cluster-endpoint>",
+    )
+    
     def __init__(self, message: str = "Cannot access Kubernetes cluster"):
-        troubleshooting = [
-            "Verify kubectl is configured: kubectl cluster-info",
-            "Check kubeconfig file: kubectl config view",
-            "Verify cluster connectivity: kubectl get nodes",
-            "Ensure you have valid credentials: kubectl auth whoami",
-            "Check if cluster is reachable: ping <cluster-endpoint>"
-        ]
-        super().__init__(message, troubleshooting)
+        super().__init__(message, self._TROUBLESHOOTING)
 
 
 class NamespaceError(ArgoCDCLIError):
@@ -61,30 +67,37 @@ class NamespaceError(ArgoCDCLIError):
 class ValidationError(ArgoCDCLIError):
     """Raised when input validation fails."""
     
+    _TROUBLESHOOTING = (
+        "Review the command help: argocd-cli <command> --help",
+        "Check parameter format and values",
+        "Ensure all required parameters are provided",
+    )
+    
     def __init__(self, message: str, field: str = None):
         self.field = field
-        troubleshooting = [
-            "Review the command help: argocd-cli <command> --help",
-            "Check parameter format and values",
-            "Ensure all required parameters are provided"
-        ]
-        super().__init__(message, troubleshooting)
+        super().__init__(message, self._TROUBLESHOOTING)
 
 
 class WorkflowSubmissionError(ArgoCDCLIError):
     """Raised when workflow submission fails."""
     
+    _TROUBLESHOOTING = (
+        "Verify Argo Workflows is running: kubectl get pods -n argo",
+        "Check WorkflowTemplate exists: argocd-cli workflows templates list",
+        "Create templates if missing: argocd-cli workflows templates create",
+        "Verify RBAC permissions: kubectl auth can-i create workflows.argoproj.io",
+        "Check Argo Workflows controller logs: kubectl logs -n argo -l app=workflow-controller",
+    )
+    
     def __init__(self, message: str, template_name: str = None):
         self.template_name = template_name
-        troubleshooting = [
-            "Verify Argo Workflows is running: kubectl get pods -n argo",
-            "Check WorkflowTemplate exists: argocd-cli workflows templates list",
-            "Create templates if missing: argocd-cli workflows templates create",
-            "Verify RBAC permissions: kubectl auth can-i create workflows.argoproj.io",
-            "Check Argo Workflows controller logs: kubectl logs -n argo -l app=workflow-controller"
-        ]
+        troubleshooting = self._TROUBLESHOOTING
         if template_name:
-            troubleshooting.insert(1, f"Verify template '{template_name}' exists: kubectl get workflowtemplate {template_name} -n argo")
+            troubleshooting = [
+                troubleshooting[0],
+                f"Verify template '{template_name}' exists: kubectl get workflowtemplate {template_name} -n argo",
+                *troubleshooting[1:]
+            ]
         super().__init__(message, troubleshooting)
 
 
@@ -105,66 +118,71 @@ class WorkflowNotFoundError(ArgoCDCLIError):
 class TemplateError(ArgoCDCLIError):
     """Raised when template operations fail."""
     
+    _TROUBLESHOOTING = (
+        "Verify Argo Workflows is installed: kubectl get crd workflowtemplates.argoproj.io",
+        "Check cluster permissions: kubectl auth can-i create workflowtemplates.argoproj.io -n argo",
+        "Review Argo Workflows logs: kubectl logs -n argo -l app=workflow-controller",
+        "Validate YAML syntax if using custom templates",
+    )
+    
     def __init__(self, message: str, template_type: str = None):
         self.template_type = template_type
-        troubleshooting = [
-            "Verify Argo Workflows is installed: kubectl get crd workflowtemplates.argoproj.io",
-            "Check cluster permissions: kubectl auth can-i create workflowtemplates.argoproj.io -n argo",
-            "Review Argo Workflows logs: kubectl logs -n argo -l app=workflow-controller",
-            "Validate YAML syntax if using custom templates"
-        ]
-        super().__init__(message, troubleshooting)
+        super().__init__(message, self._TROUBLESHOOTING)
 
 
 class HelmError(ArgoCDCLIError):
     """Raised when Helm operations fail."""
     
+    _TROUBLESHOOTING = (
+        "Verify Helm is installed: helm version",
+        "Check Helm repository: helm repo list",
+        "Update Helm repositories: helm repo update",
+        "Verify chart exists: helm search repo <chart-name>",
+        "Check Helm permissions: helm list --all-namespaces",
+    )
+    
     def __init__(self, message: str, operation: str = "operation"):
-        troubleshooting = [
-            "Verify Helm is installed: helm version",
-            "Check Helm repository: helm repo list",
-            "Update Helm repositories: helm repo update",
-            "Verify chart exists: helm search repo <chart-name>",
-            "Check Helm permissions: helm list --all-namespaces"
-        ]
-        super().__init__(message, troubleshooting)
+        super().__init__(message, self._TROUBLESHOOTING)
 
 
 class GitRepositoryError(ArgoCDCLIError):
     """Raised when Git repository validation fails."""
     
+    _TROUBLESHOOTING = (
+        "Verify repository URL format (https://, git@, ssh://)",
+        "Check repository accessibility: git ls-remote <repo-url>",
+        "Ensure repository exists and is not private (or credentials are configured)",
+        "Verify network connectivity to Git server",
+        "Check if repository requires authentication",
+    )
+    
     def __init__(self, repo_url: str, reason: str = ""):
-        message = f"Invalid or inaccessible Git repository: {repo_url}"
-        if reason:
-            message += f" - {reason}"
+        message = f"Invalid or inaccessible Git repository: {repo_url}{f' - {reason}' if reason else ''}"
         
-        troubleshooting = [
-            "Verify repository URL format (https://, git@, ssh://)",
-            "Check repository accessibility: git ls-remote <repo-url>",
-            "Ensure repository exists and is not private (or credentials are configured)",
-            "Verify network connectivity to Git server",
-            "Check if repository requires authentication"
-        ]
-        super().__init__(message, troubleshooting)
+        super().__init__(message, self._TROUBLESHOOTING)
 
 
 class KubernetesAPIError(ArgoCDCLIError):
     """Raised when Kubernetes API operations fail."""
     
+    _TROUBLESHOOTING = (
+        "Verify cluster connectivity: kubectl cluster-info",
+        "Check API server status: kubectl get --raw /healthz",
+        "Verify RBAC permissions: kubectl auth can-i <verb> <resource>",
+        "Check resource quotas: kubectl describe resourcequota -n <namespace>",
+        "Review API server logs if you have access",
+    )
+    
     def __init__(self, message: str, resource_type: str = None, operation: str = None):
         self.resource_type = resource_type
         self.operation = operation
         
-        troubleshooting = [
-            "Verify cluster connectivity: kubectl cluster-info",
-            "Check API server status: kubectl get --raw /healthz",
-            "Verify RBAC permissions: kubectl auth can-i <verb> <resource>",
-            "Check resource quotas: kubectl describe resourcequota -n <namespace>",
-            "Review API server logs if you have access"
-        ]
-        
+        troubleshooting = self._TROUBLESHOOTING
         if resource_type and operation:
-            troubleshooting.insert(0, f"Verify permissions for {operation} on {resource_type}: kubectl auth can-i {operation} {resource_type}")
+            troubleshooting = [
+                f"Verify permissions for {operation} on {resource_type}: kubectl auth can-i {operation} {resource_type}",
+                *troubleshooting
+            ]
         
         super().__init__(message, troubleshooting)
 
@@ -173,9 +191,7 @@ class WorkflowExecutionError(ArgoCDCLIError):
     """Raised when workflow execution encounters errors."""
     
     def __init__(self, workflow_name: str, phase: str, message: str = ""):
-        error_msg = f"Workflow '{workflow_name}' {phase.lower()}"
-        if message:
-            error_msg += f": {message}"
+        error_msg = f"Workflow '{workflow_name}' {phase.lower()}{f': {message}' if message else ''}"
         
         troubleshooting = [
             f"Check workflow status: argocd-cli workflows status {workflow_name}",
@@ -191,17 +207,19 @@ class WorkflowExecutionError(ArgoCDCLIError):
 class ConfigurationError(ArgoCDCLIError):
     """Raised when configuration is invalid or missing."""
     
+    _TROUBLESHOOTING = (
+        "Check configuration file format (YAML)",
+        "Verify configuration file permissions",
+        "Review configuration documentation",
+        "Use default configuration: rm ~/.argocd-cli/config.yaml",
+    )
+    
     def __init__(self, message: str, config_path: str = None):
         self.config_path = config_path
-        troubleshooting = [
-            "Check configuration file format (YAML)",
-            "Verify configuration file permissions",
-            "Review configuration documentation",
-            "Use default configuration: rm ~/.argocd-cli/config.yaml"
-        ]
         
+        troubleshooting = self._TROUBLESHOOTING
         if config_path:
-            troubleshooting.insert(0, f"Check configuration file: cat {config_path}")
+            troubleshooting = [f"Check configuration file: cat {config_path}", *troubleshooting]
         
         super().__init__(message, troubleshooting)
 
@@ -210,9 +228,7 @@ class ResourceNotFoundError(ArgoCDCLIError):
     """Raised when a Kubernetes resource cannot be found."""
     
     def __init__(self, resource_type: str, resource_name: str, namespace: str = None):
-        message = f"{resource_type} '{resource_name}' not found"
-        if namespace:
-            message += f" in namespace '{namespace}'"
+        message = f"{resource_type} '{resource_name}' not found{f' in namespace {namespace!r}' if namespace else ''}"
         
         troubleshooting = [
             f"List all {resource_type}s: kubectl get {resource_type}",
@@ -231,9 +247,7 @@ class PermissionError(ArgoCDCLIError):
     """Raised when user lacks required permissions."""
     
     def __init__(self, operation: str, resource: str = None):
-        message = f"Insufficient permissions to {operation}"
-        if resource:
-            message += f" {resource}"
+        message = f"Insufficient permissions to {operation}{f' {resource}' if resource else ''}"
         
         troubleshooting = [
             "Check your RBAC permissions: kubectl auth can-i --list",
@@ -249,9 +263,7 @@ class TimeoutError(ArgoCDCLIError):
     """Raised when an operation times out."""
     
     def __init__(self, operation: str, timeout_seconds: int = None):
-        message = f"Operation timed out: {operation}"
-        if timeout_seconds:
-            message += f" (timeout: {timeout_seconds}s)"
+        message = f"Operation timed out: {operation}{f' (timeout: {timeout_seconds}s)' if timeout_seconds else ''}"
         
         troubleshooting = [
             "Check cluster responsiveness: kubectl get nodes",
@@ -263,6 +275,22 @@ class TimeoutError(ArgoCDCLIError):
         super().__init__(message, troubleshooting)
 
 
+# Exception factories for API status codes with a dedicated mapping, called
+# as factory(api_exception, operation, resource_type)
+_STATUS_FACTORIES: Dict[int, Callable[..., ArgoCDCLIError]] = {
+    401: lambda e, operation, resource_type: PermissionError("authenticate", "cluster"),
+    403: lambda e, operation, resource_type: PermissionError(operation, resource_type),
+    404: lambda e, operation, resource_type: (
+        ResourceNotFoundError(resource_type, "unknown") if resource_type
+        else KubernetesAPIError(f"Resource not found during {operation}", resource_type, operation)
+    ),
+    409: lambda e, operation, resource_type: KubernetesAPIError(
+        f"Resource conflict during {operation} - resource may already exist", resource_type, operation
+    ),
+    422: lambda e, operation, resource_type: ValidationError(f"Invalid resource specification: {e.reason}"),
+}
+
+
 def handle_kubernetes_api_exception(e: Exception, operation: str = "operation", resource_type: str = None) -> ArgoCDCLIError:
     """Convert Kubernetes API exceptions to custom exceptions with context.
     
@@ -274,25 +302,13 @@ def handle_kubernetes_api_exception(e: Exception, operation: str = "operation",
     Returns:
         Appropriate custom exception with troubleshooting guidance
     """
-    from kubernetes.client.rest import ApiException
-    
-    if isinstance(e, ApiException):
-        if e.status == 401:
-            return PermissionError("authenticate", "cluster")
-        elif e.status == 403:
-            return PermissionError(operation, resource_type)
-        elif e.status == 404:
-            if resource_type:
-                return ResourceNotFoundError(resource_type, "unknown")
-            return KubernetesAPIError(f"Resource not found during {operation}", resource_type, operation)
-        elif e.status == 409:
-            return KubernetesAPIError(f"Resource conflict during {operation} - resource may already exist", resource_type, operation)
-        elif e.status == 422:
-            return ValidationError(f"Invalid resource specification: {e.reason}")
-        elif e.status >= 500:
+    if ApiException is not None and isinstance(e, ApiException):
+        factory = _STATUS_FACTORIES.get(e.status)
+        if factory:
+            return factory(e, operation, resource_type)
+        if e.status is not None and e.status >= 500:
             return KubernetesAPIError(f"Kubernetes API server error during {operation}: {e.reason}", resource_type, operation)
-        else:
-            return KubernetesAPIError(f"API error during {operation}: {e.reason} (status: {e.status})", resource_type, operation)
+        return KubernetesAPIError(f"API error during {operation}: {e.reason} (status: {e.status})", resource_type, operation)
     
     # For non-API exceptions, return generic error
     return KubernetesAPIError(f"Unexpected error during {operation}: {str(e)}", resource_type, operation)
@@ -1,20 +1,125 @@
 """Output formatting and display utilities using rich library."""
 
-from typing import List, Dict, Optional
-from datetime import datetime
-from io import StringIO
+import functools
+import sys
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timezone
 import re
 
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.syntax import Syntax
+from rich.markup import escape
 from rich.text import Text
-from rich import box
 
 from argocd_cli.models import WorkflowStatus, WorkflowNode
 
+# Rich color per workflow or node phase
+_PHASE_COLORS = {
+    "Running": "blue",
+    "Succeeded": "green",
+    "Failed": "red",
+    "Error": "red",
+    "Pending": "yellow",
+    "Skipped": "dim",
+    "Omitted": "dim"
+}
+
+# Status icon per workflow or node phase
+_PHASE_ICONS = {
+    "Running": "⏳",
+    "Succeeded": "✓",
+    "Failed": "✗",
+    "Error": "✗",
+    "Pending": "○",
+    "Skipped": "⊘",
+    "Omitted": "⊘"
+}
+
+# (color, icon) per phase, so table rows need a single lookup
+_PHASE_STYLE = {phase: (_PHASE_COLORS[phase], _PHASE_ICONS[phase]) for phase in _PHASE_COLORS}
+_DEFAULT_PHASE_STYLE = ("white", "•")
+
+# Terminal console shared by the print_* helpers and, through capture(), the format_* ones
+_STDOUT_CONSOLE = Console(highlight=False)
+
+# Log line classifiers for format_workflow_logs, compiled once at import
+_LOG_JSON_START_RE = re.compile(r'\s*[{\[]')
+_LOG_TIMESTAMP_RE = re.compile(r'^(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}\S*)\s*(.*)$')
+_LOG_ERROR_RE = re.compile(r'error|failed|exception|fatal', re.IGNORECASE)
+_LOG_WARNING_RE = re.compile(r'warning|warn|deprecated', re.IGNORECASE)
+_LOG_SUCCESS_RE = re.compile(r'success|succeeded|completed|done', re.IGNORECASE)
+_LOG_INFO_RE = re.compile(r'info:|information:', re.IGNORECASE)
+
+# Keyword classes in priority order with their styles, plus one combined pattern
+# so lines without any keyword are rejected in a single scan
+_LOG_LEVEL_STYLES = (
+    (_LOG_ERROR_RE, "bold red"),
+    (_LOG_WARNING_RE, "bold yellow"),
+    (_LOG_SUCCESS_RE, "bold green"),
+    (_LOG_INFO_RE, "blue"),
+)
+_LOG_KEYWORD_RE = re.compile('|'.join(pattern.pattern for pattern, _ in _LOG_LEVEL_STYLES), re.IGNORECASE)
+
+# Lines that format_workflow_logs styles in some way: a keyword anywhere, or a JSON
+# or timestamp start. Callers streaming logs can print every other line verbatim
+STYLED_LOG_LINE_RE = re.compile(
+    f"(?i:{_LOG_KEYWORD_RE.pattern})|^(?:{_LOG_JSON_START_RE.pattern})|{_LOG_TIMESTAMP_RE.pattern}"
+)
+
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> Optional[datetime]:
+    """Parse a Kubernetes ISO 8601 timestamp, caching results for repeated values.
+    
+    Args:
+        timestamp: Timestamp string such as 2024-01-01T00:00:00Z
+        
+    Returns:
+        Timezone-aware datetime, or None if the string cannot be parsed
+    """
+    try:
+        if not _FROMISOFORMAT_ACCEPTS_Z and timestamp.endswith('Z'):
+            timestamp = timestamp[:-1] + '+00:00'
+        return datetime.fromisoformat(timestamp)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_datetime(value: datetime) -> str:
+    """Format a timestamp for display, caching results for repeated values.
+    
+    Args:
+        value: Datetime to format
+        
+    Returns:
+        Timestamp as YYYY-MM-DD HH:MM:SS
+    """
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Styled "icon phase" cells, built once per distinct phase
+_PHASE_TEXT_CACHE: Dict[str, Text] = {}
+
+
+def _phase_text(phase: str) -> Text:
+    """Return the status cell for a phase, styled with its color and icon.
+    
+    Args:
+        phase: Workflow or node phase
+        
+    Returns:
+        Copy of the cached Text, safe for the caller's table to own
+    """
+    text = _PHASE_TEXT_CACHE.get(phase)
+    if text is None:
+        color, icon = _PHASE_STYLE.get(phase, _DEFAULT_PHASE_STYLE)
+        text = _PHASE_TEXT_CACHE[phase] = Text(f"{icon} {phase}", style=color)
+    return text.copy()
+
 
 class Formatters:
     """Output formatters for CLI display."""
@@ -29,16 +134,7 @@ class Formatters:
         Returns:
             Color name for rich formatting
         """
-        phase_colors = {
-            "Running": "blue",
-            "Succeeded": "green",
-            "Failed": "red",
-            "Error": "red",
-            "Pending": "yellow",
-            "Skipped": "dim",
-            "Omitted": "dim"
-        }
-        return phase_colors.get(phase, "white")
+        return _PHASE_COLORS.get(phase, "white")
     
     @staticmethod
     def _get_phase_icon(phase: str) -> str:
@@ -50,39 +146,47 @@ class Formatters:
         Returns:
             Icon character
         """
-        phase_icons = {
-            "Running": "⏳",
-            "Succeeded": "✓",
-            "Failed": "✗",
-            "Error": "✗",
-            "Pending": "○",
-            "Skipped": "⊘",
-            "Omitted": "⊘"
-        }
-        return phase_icons.get(phase, "•")
+        return _PHASE_ICONS.get(phase, "•")
+    
+    @staticmethod
+    def _truncate(text: str, width: int) -> str:
+        """Shorten text to at most width characters, ending in an ellipsis when cut.
+        
+        Args:
+            text: Text to shorten
+            width: Maximum length of the result, including the ellipsis
+            
+        Returns:
+            Text unchanged if it fits, otherwise its truncated form
+        """
+        return text if len(text) <= width else text[:width - 3] + "..."
     
     @staticmethod
-    def _format_duration(started_at: datetime, finished_at: Optional[datetime] = None) -> str:
+    def _format_duration(
+        started_at: datetime,
+        finished_at: Optional[datetime] = None,
+        *,
+        now: Optional[datetime] = None
+    ) -> str:
         """Format duration between start and finish times.
         
         Args:
             started_at: Start time
             finished_at: Finish time (None if still running)
+            now: Current time shared across a table's rows; read from the clock
+                when omitted or when its timezone awareness differs from started_at
             
         Returns:
             Formatted duration string
         """
-        if finished_at:
-            duration = finished_at - started_at
-        else:
-            # Make datetime.now() timezone-aware if started_at is timezone-aware
-            now = datetime.now(started_at.tzinfo) if started_at.tzinfo else datetime.now()
-            duration = now - started_at
+        if not finished_at:
+            if now is None or (now.tzinfo is None) != (started_at.tzinfo is None):
+                # Make datetime.now() timezone-aware if started_at is timezone-aware
+                now = datetime.now(started_at.tzinfo) if started_at.tzinfo else datetime.now()
+            finished_at = now
         
-        total_seconds = int(duration.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
+        hours, remainder = divmod(int((finished_at - started_at).total_seconds()), 3600)
+        minutes, seconds = divmod(remainder, 60)
         
         if hours > 0:
             return f"{hours}h {minutes}m {seconds}s"
@@ -92,18 +196,52 @@ class Formatters:
             return f"{seconds}s"
     
     @staticmethod
-    def format_workflow_list(workflows: List[Dict]) -> str:
-        """Format a list of workflows as a table.
+    def _workflow_row(workflow: Dict, now: datetime) -> Tuple[str, Text, str, str, str]:
+        """Build the table cells for one workflow.
         
         Args:
-            workflows: List of workflow objects (dict format from K8s API)
+            workflow: Workflow object (dict format from K8s API)
+            now: Current time used for running workflows' durations
             
         Returns:
-            Formatted table string
+            Tuple of (name, status, progress, started, duration) cells
         """
-        console = Console()
-        buffer = StringIO()
-        console = Console(file=buffer, force_terminal=True)
+        metadata = workflow.get("metadata", {})
+        status = workflow.get("status", {})
+        
+        phase = status.get("phase", "Unknown")
+        started_at_str = status.get("startedAt", "")
+        finished_at_str = status.get("finishedAt", "")
+        
+        # Parse timestamps
+        started_at = _parse_iso(started_at_str) if started_at_str else None
+        finished_at = _parse_iso(finished_at_str) if finished_at_str else None
+        
+        if started_at:
+            started_display = _format_datetime(started_at)
+            duration = Formatters._format_duration(started_at, finished_at, now=now)
+        else:
+            started_display = duration = "N/A"
+        
+        return (
+            metadata.get("name", "N/A"),
+            _phase_text(phase),
+            status.get("progress", "0/0"),
+            started_display,
+            duration
+        )
+    
+    @staticmethod
+    def _render_workflow_list(console: Console, workflows: List[Dict]) -> None:
+        """Render the workflows table onto a console.
+        
+        Args:
+            console: Console to print to
+            workflows: List of workflow objects (dict format from K8s API)
+        """
+        # Table rendering is only needed by the list views, so import it on first use
+        from rich import box
+        from rich.table import Table
         
         table = Table(
             title="Workflows",
@@ -118,68 +256,60 @@ class Formatters:
         table.add_column("Started", style="dim")
         table.add_column("Duration", justify="right")
         
-        for workflow in workflows:
-            metadata = workflow.get("metadata", {})
-            status = workflow.get("status", {})
-            
-            name = metadata.get("name", "N/A")
-            phase = status.get("phase", "Unknown")
-            progress = status.get("progress", "0/0")
-            started_at_str = status.get("startedAt", "")
-            finished_at_str = status.get("finishedAt", "")
-            
-            # Parse timestamps
-            started_at = None
-            finished_at = None
-            if started_at_str:
-                try:
-                    started_at = datetime.fromisoformat(started_at_str.replace('Z', '+00:00'))
-                except:
-                    pass
-            if finished_at_str:
-                try:
-                    finished_at = datetime.fromisoformat(finished_at_str.replace('Z', '+00:00'))
-                except:
-                    pass
-            
-            # Format status with color and icon
-            color = Formatters._get_phase_color(phase)
-            icon = Formatters._get_phase_icon(phase)
-            status_text = Text(f"{icon} {phase}", style=color)
-            
-            # Format duration
-            duration = "N/A"
-            if started_at:
-                duration = Formatters._format_duration(started_at, finished_at)
-            
-            # Format started time
-            started_display = started_at.strftime("%Y-%m-%d %H:%M:%S") if started_at else "N/A"
-            
-            table.add_row(name, status_text, progress, started_display, duration)
+        # Read the clock once for every running workflow's duration
+        now = datetime.now(timezone.utc)
+        
+        # Build every row's cells first, then hand them to the table in one pass
+        workflow_row = Formatters._workflow_row
+        rows = [workflow_row(workflow, now) for workflow in workflows]
+        for row in rows:
+            table.add_row(*row)
         
         if not workflows:
             table.add_row("No workflows found", "", "", "", "")
         
         console.print(table)
-        return buffer.getvalue()
     
     @staticmethod
-    def format_workflow_status(status: WorkflowStatus) -> str:
-        """Format workflow status with progress indicators.
+    def format_workflow_list(workflows: List[Dict]) -> str:
+        """Format a list of workflows as a table.
         
         Args:
-            status: Workflow status object
+            workflows: List of workflow objects (dict format from K8s API)
             
         Returns:
-            Formatted status string
+            Formatted table string
         """
-        console = Console()
-        buffer = StringIO()
-        console = Console(file=buffer, force_terminal=True)
+        with _STDOUT_CONSOLE.capture() as capture:
+            Formatters._render_workflow_list(_STDOUT_CONSOLE, workflows)
+        return capture.get()
+    
+    @staticmethod
+    def print_workflow_list(workflows: List[Dict], console: Optional[Console] = None) -> None:
+        """Print the workflows table straight to the terminal.
+        
+        Skips the intermediate string buffer used by format_workflow_list.
+        
+        Args:
+            workflows: List of workflow objects (dict format from K8s API)
+            console: Console to print to, defaults to the shared stdout console
+        """
+        Formatters._render_workflow_list(console or _STDOUT_CONSOLE, workflows)
+    
+    @staticmethod
+    def _render_workflow_status(console: Console, status: WorkflowStatus) -> None:
+        """Render the workflow status panel and steps table onto a console.
+        
+        Args:
+            console: Console to print to
+            status: Workflow status object
+        """
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
         
         # Main status panel
-        color = Formatters._get_phase_color(status.phase)
-        icon = Formatters._get_phase_icon(status.phase)
+        color, icon = _PHASE_STYLE.get(status.phase, _DEFAULT_PHASE_STYLE)
         
         status_text = Text()
         status_text.append(f"{icon} ", style=color)
@@ -188,10 +318,10 @@ class Formatters:
         status_text.append(f"Status: ", style="dim")
         status_text.append(f"{status.phase}\n", style=f"bold {color}")
         status_text.append(f"Progress: {status.progress}\n", style="dim")
-        status_text.append(f"Started: {status.started_at.strftime('%Y-%m-%d %H:%M:%S')}\n", style="dim")
+        status_text.append(f"Started: {_format_datetime(status.started_at)}\n", style="dim")
         
         if status.finished_at:
-            status_text.append(f"Finished: {status.finished_at.strftime('%Y-%m-%d %H:%M:%S')}\n", style="dim")
+            status_text.append(f"Finished: {_format_datetime(status.finished_at)}\n", style="dim")
             duration = Formatters._format_duration(status.started_at, status.finished_at)
         else:
             duration = Formatters._format_duration(status.started_at)
@@ -219,15 +349,14 @@ class Formatters:
             table.add_column("Duration", justify="right")
             table.add_column("Message", style="dim")
             
+            now = datetime.now(timezone.utc)
             for node in status.nodes:
-                node_color = Formatters._get_phase_color(node.phase)
-                node_icon = Formatters._get_phase_icon(node.phase)
-                node_status = Text(f"{node_icon} {node.phase}", style=node_color)
+                node_status = _phase_text(node.phase)
                 
-                node_duration = Formatters._format_duration(node.started_at, node.finished_at)
+                node_duration = Formatters._format_duration(node.started_at, node.finished_at, now=now)
                 
                 # Truncate long messages
-                message = node.message[:50] + "..." if len(node.message) > 50 else node.message
+                message = Formatters._truncate(node.message, 50)
                 
                 table.add_row(
                     node.display_name,
@@ -238,96 +367,148 @@ class Formatters:
                 )
             
             console.print(table)
-        
-        return buffer.getvalue()
     
     @staticmethod
-    def format_workflow_logs(logs: str, highlight_errors: bool = True) -> str:
-        """Format workflow logs with syntax highlighting.
+    def format_workflow_status(status: WorkflowStatus) -> str:
+        """Format workflow status with progress indicators.
         
         Args:
-            logs: Raw log output
-            highlight_errors: Whether to highlight errors and warnings
+            status: Workflow status object
             
         Returns:
-            Formatted log string with highlighting
+            Formatted status string
         """
-        console = Console()
-        buffer = StringIO()
-        console = Console(file=buffer, force_terminal=True)
+        with _STDOUT_CONSOLE.capture() as capture:
+            Formatters._render_workflow_status(_STDOUT_CONSOLE, status)
+        return capture.get()
+    
+    @staticmethod
+    def print_workflow_status(status: WorkflowStatus, console: Optional[Console] = None) -> None:
+        """Print workflow status straight to the terminal.
         
-        if not logs:
-            console.print("[dim]No logs available[/dim]")
-            return buffer.getvalue()
+        Skips the intermediate string buffer used by format_workflow_status.
         
-        # Split logs into lines for processing
-        lines = logs.split('\n')
+        Args:
+            status: Workflow status object
+            console: Console to print to, defaults to the shared stdout console
+        """
+        Formatters._render_workflow_status(console or _STDOUT_CONSOLE, status)
+    
+    @staticmethod
+    def _render_workflow_logs(console: Console, logs: str, highlight_errors: bool = True) -> None:
+        """Render highlighted workflow logs onto a console.
         
-        for line in lines:
-            if not line.strip():
-                console.print()
+        Args:
+            console: Console to print to
+            logs: Raw log output
+            highlight_errors: Whether to highlight errors and warnings
+        """
+        if not logs:
+            console.print("[dim]No logs available[/dim]")
+            return
+        
+        # Styled spans go straight into one Text, so the whole log is rendered
+        # with a single print and no per-line markup parsing
+        out = Text()
+        # Consecutive JSON-looking lines, highlighted together when the run ends
+        json_run = []
+        
+        for line in logs.split('\n'):
+            # Check if line looks like JSON for syntax highlighting; keyword styling still wins
+            if _LOG_JSON_START_RE.match(line) and not (highlight_errors and _LOG_KEYWORD_RE.search(line)):
+                json_run.append(line)
                 continue
             
-            # Highlight errors and warnings
-            if highlight_errors:
-                line_lower = line.lower()
-                
-                # Error patterns
-                if any(pattern in line_lower for pattern in ['error', 'failed', 'exception', 'fatal']):
-                    console.print(f"[bold red]{line}[/bold red]")
-                    continue
-                
-                # Warning patterns
-                elif any(pattern in line_lower for pattern in ['warning', 'warn', 'deprecated']):
-                    console.print(f"[bold yellow]{line}[/bold yellow]")
-                    continue
-                
-                # Success patterns
-                elif any(pattern in line_lower for pattern in ['success', 'succeeded', 'completed', 'done']):
-                    console.print(f"[bold green]{line}[/bold green]")
-                    continue
-                
-                # Info patterns
-                elif any(pattern in line_lower for pattern in ['info:', 'information:']):
-                    console.print(f"[blue]{line}[/blue]")
-                    continue
+            if json_run:
+                Formatters._append_json_lines(out, json_run)
+                json_run = []
             
-            # Check if line looks like JSON or YAML for syntax highlighting
-            if line.strip().startswith('{') or line.strip().startswith('['):
-                try:
-                    syntax = Syntax(line, "json", theme="monokai", line_numbers=False)
-                    console.print(syntax)
-                    continue
-                except:
-                    pass
+            if not line or line.isspace():
+                out.append("\n")
+                continue
             
-            # Check for timestamp patterns
-            timestamp_pattern = r'^\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}'
-            if re.match(timestamp_pattern, line):
-                # Split timestamp from message
-                parts = re.split(r'(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[^\s]*)', line, maxsplit=1)
-                if len(parts) >= 3:
-                    console.print(f"[dim]{parts[1]}[/dim] {parts[2]}")
-                    continue
+            # Highlight errors, warnings, successes and info, first matching class wins
+            if highlight_errors and _LOG_KEYWORD_RE.search(line):
+                for pattern, style in _LOG_LEVEL_STYLES:
+                    if pattern.search(line):
+                        out.append(line + "\n", style=style)
+                        break
+                continue
+            
+            # Check for timestamp patterns, splitting the timestamp from the message
+            match = _LOG_TIMESTAMP_RE.match(line)
+            if match:
+                out.append(match.group(1), style="dim")
+                out.append(f" {match.group(2)}\n")
+                continue
             
             # Default: print as-is
-            console.print(line)
+            out.append(line + "\n")
         
-        return buffer.getvalue()
+        if json_run:
+            Formatters._append_json_lines(out, json_run)
+        
+        console.print(out, end="")
     
     @staticmethod
-    def format_template_list(templates: List[Dict]) -> str:
-        """Format a list of WorkflowTemplates as a table.
+    def _append_json_lines(out: Text, lines: List[str]) -> None:
+        """Append a run of JSON log lines to out, highlighted in a single lexer pass.
         
         Args:
-            templates: List of WorkflowTemplate objects (dict format from K8s API)
+            out: Text collecting the rendered log
+            lines: Consecutive JSON-looking log lines
+        """
+        code = "\n".join(lines)
+        try:
+            # rich.syntax pulls in pygments, so only import it once a JSON line shows up
+            from rich.syntax import Syntax
+            highlighted = Syntax(code, "json", theme="monokai", line_numbers=False).highlight(code)
+        except Exception:
+            out.append(code + "\n")
+            return
+        
+        if not highlighted.plain.endswith("\n"):
+            highlighted.append("\n")
+        out.append_text(highlighted)
+    
+    @staticmethod
+    def format_workflow_logs(logs: str, highlight_errors: bool = True) -> str:
+        """Format workflow logs with syntax highlighting.
+        
+        Args:
+            logs: Raw log output
+            highlight_errors: Whether to highlight errors and warnings
             
         Returns:
-            Formatted table string
+            Formatted log string with highlighting
+        """
+        with _STDOUT_CONSOLE.capture() as capture:
+            Formatters._render_workflow_logs(_STDOUT_CONSOLE, logs, highlight_errors)
+        return capture.get()
+    
+    @staticmethod
+    def print_workflow_logs(logs: str, highlight_errors: bool = True, console: Optional[Console] = None) -> None:
+        """Print highlighted workflow logs straight to the terminal.
+        
+        Skips the intermediate string buffer used by format_workflow_logs.
+        
+        Args:
+            logs: Raw log output
+            highlight_errors: Whether to highlight errors and warnings
+            console: Console to print to, defaults to the shared stdout console
+        """
+        Formatters._render_workflow_logs(console or _STDOUT_CONSOLE, logs, highlight_errors)
+    
+    @staticmethod
+    def _render_template_list(console: Console, templates: List[Dict]) -> None:
+        """Render the WorkflowTemplates table onto a console.
+        
+        Args:
+            console: Console to print to
+            templates: List of WorkflowTemplate objects (dict format from K8s API)
         """
-        console = Console()
-        buffer = StringIO()
-        console = Console(file=buffer, force_terminal=True)
+        from rich import box
+        from rich.table import Table
         
         table = Table(
             title="Workflow Templates",
@@ -354,8 +535,7 @@ class Formatters:
                 description = "No description"
             
             # Truncate long descriptions
-            if len(description) > 60:
-                description = description[:57] + "..."
+            description = Formatters._truncate(description, 60)
             
             # Count parameters
             arguments = spec.get("arguments", {})
@@ -364,13 +544,8 @@ class Formatters:
             
             # Get creation timestamp
             created_at_str = metadata.get("creationTimestamp", "")
-            created_display = "N/A"
-            if created_at_str:
-                try:
-                    created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-                    created_display = created_at.strftime("%Y-%m-%d %H:%M")
-                except:
-                    pass
+            created_at = _parse_iso(created_at_str) if created_at_str else None
+            created_display = created_at.strftime("%Y-%m-%d %H:%M") if created_at else "N/A"
             
             table.add_row(name, description, str(param_count), created_display)
         
@@ -378,7 +553,32 @@ class Formatters:
             table.add_row("No templates found", "", "", "")
         
         console.print(table)
-        return buffer.getvalue()
+    
+    @staticmethod
+    def format_template_list(templates: List[Dict]) -> str:
+        """Format a list of WorkflowTemplates as a table.
+        
+        Args:
+            templates: List of WorkflowTemplate objects (dict format from K8s API)
+            
+        Returns:
+            Formatted table string
+        """
+        with _STDOUT_CONSOLE.capture() as capture:
+            Formatters._render_template_list(_STDOUT_CONSOLE, templates)
+        return capture.get()
+    
+    @staticmethod
+    def print_template_list(templates: List[Dict], console: Optional[Console] = None) -> None:
+        """Print the WorkflowTemplates table straight to the terminal.
+        
+        Skips the intermediate string buffer used by format_template_list.
+        
+        Args:
+            templates: List of WorkflowTemplate objects (dict format from K8s API)
+            console: Console to print to, defaults to the shared stdout console
+        """
+        Formatters._render_template_list(console or _STDOUT_CONSOLE, templates)
     
     @staticmethod
     def print_success(message: str) -> None:
@@ -387,8 +587,7 @@ class Formatters:
         Args:
             message: Success message to display
         """
-        console = Console()
-        console.print(f"[bold green]✓[/bold green] {message}")
+        _STDOUT_CONSOLE.print(f"[bold green]✓[/bold green] {escape(message)}")
     
     @staticmethod
     def print_error(message: str) -> None:
@@ -397,8 +596,7 @@ class Formatters:
         Args:
             message: Error message to display
         """
-        console = Console()
-        console.print(f"[bold red]✗[/bold red] {message}")
+        _STDOUT_CONSOLE.print(f"[bold red]✗[/bold red] {escape(message)}")
     
     @staticmethod
     def print_warning(message: str) -> None:
@@ -407,8 +605,7 @@ class Formatters:
         Args:
             message: Warning message to display
         """
-        console = Console()
-        console.print(f"[bold yellow]⚠[/bold yellow] {message}")
+        _STDOUT_CONSOLE.print(f"[bold yellow]⚠[/bold yellow] {escape(message)}")
     
     @staticmethod
     def print_info(message: str) -> None:
@@ -417,5 +614,4 @@ class Formatters:
         Args:
             message: Info message to display
         """
-        console = Console()
-        console.print(f"[blue]ℹ[/blue] {message}")
+        _STDOUT_CONSOLE.print(f"[blue]ℹ[/blue] {escape(message)}")
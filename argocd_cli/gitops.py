@@ -1,11 +1,56 @@
 """GitOps functionality for storing ArgoCD manifests in Git repositories."""
 
+import base64
+import concurrent.futures
+import contextlib
+import hashlib
+import json
 import os
+import re
+import shutil
 import subprocess
 import tempfile
-from typing import Optional, Tuple
+import urllib.parse
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+import urllib3
+
+try:
+    import fcntl
+except ImportError:
+    # No flock on Windows; concurrent commits to one cached repo are not serialized there
+    fcntl = None
+
+# Per-user cache of bare repository clones, reused by every commit to the same remote
+REPO_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "argocd_cli" / "repos"
+
+# Seconds allowed for a single network-bound git command (clone, fetch, push)
+GIT_NETWORK_TIMEOUT = 60
+
+# Concurrent manifest commits run by commit_many
+COMMIT_WORKERS = 8
+
+# GitHub REST API, used to commit single manifests without a local checkout
+GITHUB_API_URL = "https://api.github.com"
+
+# Owner and repository name from an HTTPS or SSH github.com URL
+_GITHUB_REPO_RE = re.compile(r"^(?:https://(?:[^@/]+@)?github\.com/|git@github\.com:)([^/]+)/([^/]+?)(?:\.git)?/?$")
+
+# Shared connection pool for GitHub API requests
+_HTTP = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=COMMIT_WORKERS,
+    timeout=urllib3.Timeout(total=GIT_NETWORK_TIMEOUT),
+    retries=urllib3.Retry(total=3, backoff_factor=0.5, allowed_methods=["GET"])
+)
+
+# Parent of the temporary worktrees: ARGOCD_CLI_TMPDIR, else RAM-backed /dev/shm when
+# writable, else the tempfile default
+TEMP_ROOT = os.getenv("ARGOCD_CLI_TMPDIR") or (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
 
 class GitOpsManager:
     """Manages GitOps operations for ArgoCD manifests."""
@@ -46,6 +91,154 @@ class GitOpsManager:
                 return f"https://{self.git_username}:{self.git_token}@{url_parts[0]}/{url_parts[1]}"
         return self.repo_url
     
+    def _git(self, *args: str, cwd: Optional[Path] = None, timeout: Optional[int] = None) -> subprocess.CompletedProcess:
+        """Run a git command, authenticating requests to the repository for this call only.
+        
+        The credentialed URL is supplied as a per-command insteadOf rewrite of the
+        plain URL, so it is never written into the cached repository's config.
+        
+        Args:
+            *args: git subcommand and arguments
+            cwd: Working directory for the command
+            timeout: Seconds before the command is killed
+            
+        Returns:
+            Completed process with captured text output
+        """
+        auth_url = self._get_authenticated_url()
+        auth_config = ["-c", f"url.{auth_url}.insteadOf={self.repo_url}"] if auth_url != self.repo_url else []
+        return subprocess.run(
+            ["git", *auth_config, *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+    
+    @contextlib.contextmanager
+    def _cached_repo_lock(self, cache_dir: Path):
+        """Hold an exclusive lock on a cached repository for the duration of the block.
+        
+        Args:
+            cache_dir: Cached bare repository directory
+        """
+        cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_dir.with_suffix(".lock"), "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _cache_key(self) -> str:
+        """Directory name of this repository's cached clone, derived from its plain URL."""
+        return hashlib.sha256(self.repo_url.encode()).hexdigest()[:16]
+    
+    def _get_cached_repo(self) -> Tuple[Optional[Path], str]:
+        """Return the cached bare clone of the repository, cloning it on first use.
+        
+        Must be called with the repository lock held.
+        
+        Returns:
+            Tuple of (cache directory or None on failure, error message)
+        """
+        cache_dir = REPO_CACHE_DIR / self._cache_key()
+        if (cache_dir / "HEAD").exists():
+            return cache_dir, ""
+        
+        # Cloned from the plain URL so only it is stored on disk. Blobs are left out
+        # and fetched on demand, so only files under manifests_path are ever downloaded
+        result = self._git(
+            "clone", "--bare", "--depth", "1", "--filter=blob:none", self.repo_url, str(cache_dir),
+            timeout=GIT_NETWORK_TIMEOUT
+        )
+        if result.returncode != 0:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            return None, f"Failed to clone repository: {result.stderr}"
+        return cache_dir, ""
+    
+    def _with_repo(self, callback: Callable[[Path], Tuple[bool, str]]) -> Tuple[bool, str]:
+        """Check out the branch tip in a temporary worktree and run callback in it.
+        
+        Works in a throwaway worktree of a cached bare clone, so repeated
+        operations on the same repository fetch only new objects.
+        
+        Args:
+            callback: Called with the worktree path; its result is returned
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            with self._cached_repo_lock(REPO_CACHE_DIR / self._cache_key()):
+                cache_dir, error = self._get_cached_repo()
+                if cache_dir is None:
+                    return False, error
+                
+                # Fetch only the branch tip into the cached clone
+                result = self._git(
+                    "fetch", "--depth", "1", "origin", self.branch,
+                    cwd=cache_dir, timeout=GIT_NETWORK_TIMEOUT
+                )
+                if result.returncode != 0:
+                    # Branch doesn't exist yet: start it from the default branch
+                    result = self._git(
+                        "fetch", "--depth", "1", "origin", "HEAD",
+                        cwd=cache_dir, timeout=GIT_NETWORK_TIMEOUT
+                    )
+                    if result.returncode != 0:
+                        # An empty repository has nothing to fetch: commit from a fresh one
+                        listing = self._git("ls-remote", "origin", cwd=cache_dir, timeout=GIT_NETWORK_TIMEOUT)
+                        if listing.returncode != 0 or listing.stdout.strip():
+                            return False, f"Failed to fetch repository: {result.stderr}"
+                        return self._with_empty_repo(callback)
+                
+                with tempfile.TemporaryDirectory(dir=TEMP_ROOT) as tmpdir:
+                    repo_path = Path(tmpdir) / "repo"
+                    
+                    # Check the fetched tip out into a throwaway worktree of the cached clone,
+                    # materializing only manifests_path (plus top-level files). Temp paths are
+                    # unique, so stale registrations never collide and are left to git gc
+                    result = self._git(
+                        "worktree", "add", "--no-checkout", "--detach", str(repo_path), "FETCH_HEAD",
+                        cwd=cache_dir
+                    )
+                    if result.returncode != 0:
+                        return False, f"Failed to check out repository: {result.stderr}"
+                    
+                    try:
+                        result = self._git("sparse-checkout", "set", self.manifests_path, cwd=repo_path)
+                        if result.returncode == 0:
+                            result = self._git("checkout", cwd=repo_path, timeout=GIT_NETWORK_TIMEOUT)
+                        if result.returncode != 0:
+                            return False, f"Failed to check out repository: {result.stderr}"
+                        
+                        return callback(repo_path)
+                    finally:
+                        self._git("worktree", "remove", "--force", str(repo_path), cwd=cache_dir)
+                
+        except subprocess.TimeoutExpired:
+            return False, "Git operation timed out"
+        except Exception as e:
+            return False, f"Error during Git operation: {str(e)}"
+    
+    def _with_empty_repo(self, callback: Callable[[Path], Tuple[bool, str]]) -> Tuple[bool, str]:
+        """Run callback in a new local repository whose origin is the (empty) remote.
+        
+        Args:
+            callback: Called with the repository path; its result is returned
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        with tempfile.TemporaryDirectory(dir=TEMP_ROOT) as tmpdir:
+            repo_path = Path(tmpdir) / "repo"
+            subprocess.run(["git", "init", "-q", str(repo_path)], check=True)
+            subprocess.run(["git", "remote", "add", "origin", self.repo_url], cwd=repo_path, check=True)
+            return callback(repo_path)
+    
     def commit_manifest(
         self,
         manifest_content: str,
@@ -64,115 +257,196 @@ class GitOpsManager:
         Returns:
             Tuple of (success, message)
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            try:
-                repo_path = Path(tmpdir) / "repo"
-                
-                # Clone repository
-                auth_url = self._get_authenticated_url()
-                result = subprocess.run(
-                    ["git", "clone", "--depth", "1", "--branch", self.branch, auth_url, str(repo_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                if result.returncode != 0:
-                    # Try to clone and create branch if it doesn't exist
-                    result = subprocess.run(
-                        ["git", "clone", "--depth", "1", auth_url, str(repo_path)],
-                        capture_output=True,
-                        text=True,
-                        timeout=60
-                    )
-                    if result.returncode != 0:
-                        return False, f"Failed to clone repository: {result.stderr}"
-                    
-                    # Create and checkout new branch
-                    subprocess.run(
-                        ["git", "checkout", "-b", self.branch],
-                        cwd=repo_path,
-                        capture_output=True,
-                        text=True
-                    )
-                
-                # Create manifests directory if it doesn't exist
-                manifests_dir = repo_path / self.manifests_path
-                manifests_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Write manifest file
-                manifest_file = manifests_dir / manifest_name
-                manifest_file.write_text(manifest_content)
-                
-                # Configure git user if not set
-                subprocess.run(
-                    ["git", "config", "user.email", "argocd-cli@automated.local"],
-                    cwd=repo_path,
-                    capture_output=True
-                )
-                subprocess.run(
-                    ["git", "config", "user.name", "ArgoCD CLI"],
-                    cwd=repo_path,
-                    capture_output=True
-                )
-                
-                # Add and commit
-                subprocess.run(
-                    ["git", "add", str(manifest_file.relative_to(repo_path))],
-                    cwd=repo_path,
-                    check=True
-                )
-                
-                if not commit_message:
-                    commit_message = f"Add/Update ArgoCD manifest: {manifest_name}"
-                
-                result = subprocess.run(
-                    ["git", "commit", "-m", commit_message],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode != 0 and "nothing to commit" in result.stdout:
+        if not create_pr and self.git_token:
+            result = self._github_contents_put(manifest_name, manifest_content, commit_message)
+            if result is not None:
+                return result
+        return self.commit_manifests({manifest_name: manifest_content}, commit_message, create_pr)
+    
+    def _github_contents_put(
+        self,
+        manifest_name: str,
+        manifest_content: str,
+        commit_message: Optional[str] = None
+    ) -> Optional[Tuple[bool, str]]:
+        """Create or update one manifest on the branch through the GitHub contents API.
+        
+        The file and its commit are written by a single API request, with no
+        clone or worktree. Only github.com repositories are handled.
+        
+        Args:
+            manifest_name: Name of the manifest file
+            manifest_content: YAML content of the manifest
+            commit_message: Custom commit message
+            
+        Returns:
+            Tuple of (success, message), or None when the manifest should be
+            committed through git instead
+        """
+        match = _GITHUB_REPO_RE.match(self.repo_url)
+        if not match:
+            return None
+        
+        owner, repo = match.groups()
+        path = urllib.parse.quote(f"{self.manifests_path.strip('/')}/{manifest_name}")
+        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{path}"
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"token {self.git_token}",
+            "User-Agent": "argocd-cli"
+        }
+        content = manifest_content.encode()
+        
+        try:
+            # The blob sha of an existing file is required to update it
+            response = _HTTP.request(
+                "GET", url, fields={"ref": self.branch}, headers=headers
+            )
+            if response.status == 200:
+                existing = json.loads(response.data)
+                if not isinstance(existing, dict):
+                    # A directory listing, not a file
+                    return None
+                if base64.b64decode(existing.get("content", "")) == content:
                     return True, f"Manifest {manifest_name} already up to date in Git"
-                
-                # Push to remote
-                if create_pr:
-                    # Create a feature branch for PR
-                    pr_branch = f"argocd-manifest-{manifest_name.replace('.yaml', '')}"
-                    subprocess.run(
-                        ["git", "checkout", "-b", pr_branch],
-                        cwd=repo_path,
-                        capture_output=True
-                    )
-                    push_branch = pr_branch
-                else:
-                    push_branch = self.branch
-                
-                result = subprocess.run(
-                    ["git", "push", "origin", push_branch],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                if result.returncode != 0:
-                    return False, f"Failed to push to repository: {result.stderr}"
-                
-                success_msg = f"Successfully committed {manifest_name} to {self.repo_url}"
-                if create_pr:
-                    success_msg += f"\nBranch '{pr_branch}' created. Create PR manually on GitHub."
-                
-                return True, success_msg
-                
-            except subprocess.TimeoutExpired:
-                return False, "Git operation timed out"
-            except Exception as e:
-                return False, f"Error during Git operation: {str(e)}"
+                sha = existing["sha"]
+            elif response.status == 404:
+                sha = None
+            else:
+                return None
+            
+            body = {
+                "message": commit_message or f"Add/Update ArgoCD manifest: {manifest_name}",
+                "content": base64.b64encode(content).decode(),
+                "branch": self.branch,
+                "committer": {"name": "ArgoCD CLI", "email": "argocd-cli@automated.local"}
+            }
+            if sha:
+                body["sha"] = sha
+            response = _HTTP.request(
+                "PUT", url,
+                body=json.dumps(body).encode(),
+                headers={**headers, "Content-Type": "application/json"}
+            )
+        except (urllib3.exceptions.HTTPError, ValueError, KeyError):
+            return None
+        
+        # Anything else (missing branch, conflicting update, no API access) goes through git
+        if response.status not in (200, 201):
+            return None
+        return True, f"Successfully committed {manifest_name} to {self.repo_url}"
     
-    def save_manifest_locally(
+    def commit_manifests(
+        self,
+        manifests: Dict[str, str],
+        commit_message: Optional[str] = None,
+        create_pr: bool = False
+    ) -> Tuple[bool, str]:
+        """Commit several ArgoCD manifests to Git repository in a single commit and push.
+        
+        Args:
+            manifests: Mapping of manifest file names to their YAML content
+            commit_message: Custom commit message
+            create_pr: Whether to create a pull request instead of direct commit
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        if not manifests:
+            return False, "No manifests to commit"
+        
+        return self._with_repo(
+            lambda repo_path: self._commit_and_push(repo_path, manifests, commit_message, create_pr)
+        )
+    
+    def _commit_and_push(
         self,
+        repo_path: Path,
+        manifests: Dict[str, str],
+        commit_message: Optional[str],
+        create_pr: bool
+    ) -> Tuple[bool, str]:
+        """Write, commit and push manifests from a checked-out worktree.
+        
+        Args:
+            repo_path: Worktree checked out at the branch tip
+            manifests: Mapping of manifest file names to their YAML content
+            commit_message: Custom commit message
+            create_pr: Whether to push to a feature branch for a pull request
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        # Create manifests directory if it doesn't exist
+        manifests_dir = repo_path / self.manifests_path
+        manifests_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Write manifest files
+        manifest_paths = []
+        for manifest_name, manifest_content in manifests.items():
+            manifest_file = manifests_dir / manifest_name
+            manifest_file.write_text(manifest_content)
+            manifest_paths.append(str(manifest_file.relative_to(repo_path)))
+        
+        # Add and commit everything at once
+        subprocess.run(
+            ["git", "add", "--", *manifest_paths],
+            cwd=repo_path,
+            check=True
+        )
+        
+        names = ", ".join(manifests)
+        if not commit_message:
+            if len(manifests) == 1:
+                commit_message = f"Add/Update ArgoCD manifest: {names}"
+            else:
+                commit_message = f"Add/Update ArgoCD manifests: {names}"
+        
+        # Commit identity is passed per command rather than written to the shared config
+        result = subprocess.run(
+            [
+                "git",
+                "-c", "user.email=argocd-cli@automated.local",
+                "-c", "user.name=ArgoCD CLI",
+                "commit", "-m", commit_message
+            ],
+            cwd=repo_path,
+            capture_output=True,
+            text=True
+        )
+        
+        if result.returncode != 0 and "nothing to commit" in result.stdout:
+            noun = "Manifest" if len(manifests) == 1 else "Manifests"
+            return True, f"{noun} {names} already up to date in Git"
+        
+        # Push to remote
+        if create_pr:
+            # Create a feature branch for PR
+            if len(manifests) == 1:
+                pr_branch = f"argocd-manifest-{names.replace('.yaml', '')}"
+            else:
+                digest = hashlib.sha256("\0".join(sorted(manifests)).encode()).hexdigest()[:8]
+                pr_branch = f"argocd-manifests-{digest}"
+            push_branch = pr_branch
+        else:
+            push_branch = self.branch
+        
+        result = self._git(
+            "push", "origin", f"HEAD:refs/heads/{push_branch}",
+            cwd=repo_path, timeout=GIT_NETWORK_TIMEOUT
+        )
+        
+        if result.returncode != 0:
+            return False, f"Failed to push to repository: {result.stderr}"
+        
+        success_msg = f"Successfully committed {names} to {self.repo_url}"
+        if create_pr:
+            success_msg += f"\nBranch '{pr_branch}' created. Create PR manually on GitHub."
+        
+        return True, success_msg
+    
+    @staticmethod
+    def save_manifest_locally(
         manifest_content: str,
         manifest_name: str,
         local_path: str = "./argocd-manifests"
@@ -197,3 +471,38 @@ class GitOpsManager:
             return True, f"Manifest saved to {manifest_file.absolute()}"
         except Exception as e:
             return False, f"Failed to save manifest locally: {str(e)}"
+
+
+def commit_many(
+    jobs: List[Tuple[GitOpsManager, str, str]],
+    max_workers: int = COMMIT_WORKERS
+) -> List[Tuple[bool, str]]:
+    """Commit manifests to several repositories concurrently.
+    
+    Commits are network-bound, so threads overlap their clones, fetches and
+    pushes. Jobs targeting the same repository still run one at a time,
+    serialized by that repository's cache lock.
+    
+    Args:
+        jobs: (manager, manifest_name, manifest_content) tuples
+        max_workers: Maximum number of commits in flight
+        
+    Returns:
+        (success, message) for each job, in the order the jobs were given
+    """
+    results: List[Tuple[bool, str]] = [(False, "Not run")] * len(jobs)
+    if not jobs:
+        return results
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+        futures = {
+            pool.submit(manager.commit_manifest, manifest_content, manifest_name): index
+            for index, (manager, manifest_name, manifest_content) in enumerate(jobs)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = (False, f"Error during Git operation: {str(e)}")
+    return results
@@ -0,0 +1,44 @@
+"""Shared Kubernetes API client for all CLI commands."""
+
+import functools
+
+from kubernetes import client, config
+
+from argocd_cli.exceptions import ClusterAccessError
+
+# HTTP connections kept open to the API server; covers the manifest apply
+# workers, concurrent workflow deletes and any watches running alongside them
+API_CONNECTION_POOL_SIZE = 32
+
+
+@functools.lru_cache(maxsize=1)
+def get_api_client() -> client.ApiClient:
+    """Load the Kubernetes configuration once and return a shared API client.
+    
+    Sharing the client lets installers, validators and the workflow client
+    reuse the same urllib3 connection pool, so keep-alive connections and
+    TLS sessions survive across operations.
+    
+    Returns:
+        Kubernetes ApiClient backed by a single connection pool
+        
+    Raises:
+        ClusterAccessError: If Kubernetes configuration cannot be loaded
+    """
+    try:
+        config.load_kube_config()
+    except config.ConfigException:
+        try:
+            # Fall back to in-cluster config if kubeconfig is not available
+            config.load_incluster_config()
+        except Exception as e:
+            raise ClusterAccessError(f"Failed to load Kubernetes configuration: {str(e)}")
+    except Exception as e:
+        raise ClusterAccessError(f"Failed to initialize Kubernetes client: {str(e)}")
+    
+    # Size the pool for concurrent requests and watches, and make it the
+    # default so clients created elsewhere inherit it
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = API_CONNECTION_POOL_SIZE
+    client.Configuration.set_default(configuration)
+    return client.ApiClient(configuration)
@@ -1,14 +1,44 @@
 """Generates WorkflowTemplate YAML definitions for Argo Workflows."""
 
-import subprocess
+import concurrent.futures
+import string
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
 
 from argocd_cli.exceptions import (
+    ClusterAccessError,
     TemplateError,
-    ValidationError,
-    KubernetesAPIError
+    ValidationError
 )
+from argocd_cli.k8s_client import get_api_client
+
+WORKFLOW_TEMPLATE_GROUP = "argoproj.io"
+WORKFLOW_TEMPLATE_VERSION = "v1alpha1"
+WORKFLOW_TEMPLATE_PLURAL = "workflowtemplates"
+
+# Application manifest saved by GitOps, compiled once at import
+_APPLICATION_MANIFEST = string.Template("""apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: $app_name
+  namespace: $namespace
+spec:
+  project: default
+  source:
+    repoURL: $repo_url
+    $source_key: $chart_path
+    targetRevision: $target_revision
+    helm: {}
+  destination:
+    server: $destination_cluster
+    namespace: $destination_namespace
+  syncPolicy:
+${automated_block}    syncOptions:
+    - CreateNamespace=true
+""")
 
 
 class TemplateGenerator:
@@ -21,6 +51,67 @@ class TemplateGenerator:
             namespace: Kubernetes namespace for templates
         """
         self.namespace = namespace
+        self._custom_api = None
+    
+    @property
+    def custom_api(self) -> client.CustomObjectsApi:
+        """Custom objects client shared by every apply, created on first use.
+        
+        Raises:
+            ClusterAccessError: If Kubernetes configuration cannot be loaded
+        """
+        if self._custom_api is None:
+            self._custom_api = client.CustomObjectsApi(get_api_client())
+        return self._custom_api
+    
+    @staticmethod
+    def render_application_yaml(
+        app_name: str,
+        namespace: str,
+        repo_url: str,
+        chart_path: str,
+        is_helm_repo: bool,
+        destination_cluster: str,
+        destination_namespace: str,
+        automated: bool,
+        prune: bool,
+        self_heal: bool
+    ) -> str:
+        """Render an ArgoCD Application manifest.
+        
+        Produces the same manifest the Application workflow generates in
+        the cluster, for saving to Git or disk.
+        
+        Args:
+            app_name: Application name
+            namespace: Namespace of the Application resource
+            repo_url: Helm or Git repository URL
+            chart_path: Chart name (Helm repository) or path (Git repository)
+            is_helm_repo: Whether repo_url is a Helm repository
+            destination_cluster: Destination cluster URL
+            destination_namespace: Destination namespace
+            automated: Whether automated sync is enabled
+            prune: Whether automated sync prunes resources
+            self_heal: Whether automated sync self-heals
+            
+        Returns:
+            YAML string of the Application
+        """
+        automated_block = (
+            f"    automated:\n      selfHeal: {self_heal}\n      prune: {prune}\n"
+            if automated else ""
+        )
+        return _APPLICATION_MANIFEST.substitute(
+            app_name=app_name,
+            namespace=namespace,
+            repo_url=repo_url,
+            source_key="chart" if is_helm_repo else "path",
+            chart_path=chart_path,
+            target_revision='"*"' if is_helm_repo else "HEAD",
+            destination_cluster=destination_cluster,
+            destination_namespace=destination_namespace,
+            automated_block=automated_block
+        )
     
     def _validate_yaml(self, yaml_str: str) -> bool:
         """Validate YAML syntax.
@@ -797,7 +888,6 @@ fi
         Raises:
             ValidationError: If YAML is invalid
             TemplateError: If template application fails
-            KubernetesAPIError: If kubectl command fails
         """
         # Validate YAML before applying
         try:
@@ -805,40 +895,120 @@ fi
         except ValidationError:
             raise
         
-        try:
-            # Apply the template using kubectl
-            result = subprocess.run(
-                ["kubectl", "apply", "-f", "-"],
-                input=template_yaml.encode(),
-                capture_output=True,
-                check=True,
-                timeout=30
-            )
+        self._apply_template_object(yaml.safe_load(template_yaml))
+        return True
+    
+    def apply_templates_batch(self, template_yamls: List[str]) -> List[str]:
+        """Apply several WorkflowTemplates concurrently over one shared API client.
+        
+        Every template is attempted even if another fails. The first failure,
+        in input order, is then raised with an ``applied_templates`` attribute
+        listing the templates that were applied.
+        
+        Args:
+            template_yamls: YAML strings of the templates
             
-            print(result.stdout.decode())
-            return True
+        Returns:
+            Names of the applied templates, in input order
+            
+        Raises:
+            ValidationError: If YAML is invalid
+            TemplateError: If template application fails
+        """
+        stream = "\n---\n".join(template_yamls)
+        try:
+            templates = [doc for doc in yaml.safe_load_all(stream) if doc]
+        except yaml.YAMLError as e:
+            raise ValidationError(f"Invalid YAML syntax: {str(e)}", field="template_yaml")
+        
+        errors: List[Optional[Exception]] = [None] * len(templates)
+        
+        def apply(index: int) -> None:
+            try:
+                self._apply_template_object(templates[index])
+            except Exception as e:
+                errors[index] = e
+        
+        if len(templates) <= 1:
+            for index in range(len(templates)):
+                apply(index)
+        else:
+            # Templates are independent, so overlap their API round trips.
+            # Build the client first so the worker threads share it.
+            self.custom_api
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(templates)) as pool:
+                list(pool.map(apply, range(len(templates))))
+        
+        applied = [
+            template["metadata"]["name"]
+            for template, error in zip(templates, errors)
+            if error is None
+        ]
+        for error in errors:
+            if error is not None:
+                error.applied_templates = applied
+                raise error
+        return applied
+    
+    def _apply_template_object(self, template: Dict[str, Any]) -> None:
+        """Create a WorkflowTemplate, or replace it if it already exists.
+        
+        Args:
+            template: Parsed WorkflowTemplate
             
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+        Raises:
+            ValidationError: If the API server rejects the template
+            TemplateError: If template application fails
+        """
+        metadata = template.get("metadata", {})
+        name = metadata.get("name")
+        namespace = metadata.get("namespace", self.namespace)
+        
+        try:
+            try:
+                self.custom_api.create_namespaced_custom_object(
+                    WORKFLOW_TEMPLATE_GROUP,
+                    WORKFLOW_TEMPLATE_VERSION,
+                    namespace,
+                    WORKFLOW_TEMPLATE_PLURAL,
+                    template
+                )
+            except ApiException as e:
+                if e.status != 409:
+                    raise
+                # Already exists: replace it like kubectl apply would
+                existing = self.custom_api.get_namespaced_custom_object(
+                    WORKFLOW_TEMPLATE_GROUP,
+                    WORKFLOW_TEMPLATE_VERSION,
+                    namespace,
+                    WORKFLOW_TEMPLATE_PLURAL,
+                    name
+                )
+                template = dict(template, metadata=dict(
+                    metadata,
+                    resourceVersion=existing["metadata"]["resourceVersion"]
+                ))
+                self.custom_api.replace_namespaced_custom_object(
+                    WORKFLOW_TEMPLATE_GROUP,
+                    WORKFLOW_TEMPLATE_VERSION,
+                    namespace,
+                    WORKFLOW_TEMPLATE_PLURAL,
+                    name,
+                    template
+                )
+        except ApiException as e:
+            error_msg = e.body or e.reason
             
-            # Parse common kubectl errors
-            if "forbidden" in error_msg.lower():
+            # Map common API errors
+            if e.status in (401, 403):
                 raise TemplateError(f"Permission denied: {error_msg}")
-            elif "not found" in error_msg.lower():
+            elif e.status == 404:
                 raise TemplateError(f"Resource not found: {error_msg}")
-            elif "invalid" in error_msg.lower():
+            elif e.status == 422:
                 raise ValidationError(f"Invalid template specification: {error_msg}")
             else:
                 raise TemplateError(f"Failed to apply template: {error_msg}")
-                
-        except subprocess.TimeoutExpired:
-            raise TemplateError("Template application timed out after 30 seconds")
-            
-        except FileNotFoundError:
-            raise KubernetesAPIError(
-                "kubectl command not found. Please ensure kubectl is installed and in PATH.",
-                "WorkflowTemplate",
-                "apply"
-            )
+        except (ClusterAccessError, TemplateError, ValidationError):
+            raise
         except Exception as e:
             raise TemplateError(f"Unexpected error applying template: {str(e)}")
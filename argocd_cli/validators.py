@@ -3,7 +3,7 @@
 from typing import List, Dict, Optional
 import re
 import subprocess
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 
 from argocd_cli.exceptions import (
@@ -14,6 +14,19 @@ from argocd_cli.exceptions import (
     HelmError,
     handle_kubernetes_api_exception
 )
+from argocd_cli.k8s_client import get_api_client
+
+
+# Git repository URL forms, compiled once into a single alternation
+_GIT_URL_PATTERN = re.compile(
+    r'https?://.*\.git$'
+    r'|https?://github\.com/'
+    r'|https?://gitlab\.com/'
+    r'|https?://bitbucket\.org/'
+    r'|git@'
+    r'|git://'
+    r'|ssh://'
+)
 
 
 class Validator:
@@ -22,31 +35,37 @@ class Validator:
     def __init__(self):
         """Initialize the validator with Kubernetes client."""
         try:
-            config.load_kube_config()
-        except config.ConfigException:
-            try:
-                # Fall back to in-cluster config if kubeconfig is not available
-                config.load_incluster_config()
-            except Exception as e:
-                raise ClusterAccessError(f"Failed to load Kubernetes configuration: {str(e)}")
-        except Exception as e:
-            raise ClusterAccessError(f"Failed to initialize Kubernetes client: {str(e)}")
-        
-        try:
-            self.core_api = client.CoreV1Api()
-            self.version_api = client.VersionApi()
+            api_client = get_api_client()
+            self.core_api = client.CoreV1Api(api_client)
+            self.version_api = client.VersionApi(api_client)
+        except ClusterAccessError:
+            raise
         except Exception as e:
             raise ClusterAccessError(f"Failed to create Kubernetes API clients: {str(e)}")
+        
+        # Successful cluster probes, reused for the life of this validator
+        self._cluster_ok = False
+        self._valid_namespaces = set()
+    
+    def invalidate(self) -> None:
+        """Forget cached cluster and namespace checks so they are probed again."""
+        self._cluster_ok = False
+        self._valid_namespaces.clear()
     
     def validate_cluster_access(self) -> bool:
         """Validate that the cluster is accessible.
         
+        Only the first successful check contacts the API server.
+        
         Returns:
             True if cluster is accessible
             
         Raises:
             ClusterAccessError: If cluster is not accessible
         """
+        if self._cluster_ok:
+            return True
+        
         try:
             # Try to get cluster version to verify connectivity
             version_info = self.version_api.get_code()
@@ -54,6 +73,7 @@ class Validator:
             if not version_info or not version_info.git_version:
                 raise ClusterAccessError("Cluster version information unavailable")
             
+            self._cluster_ok = True
             return True
         except ApiException as e:
             error = handle_kubernetes_api_exception(e, "access cluster")
@@ -85,9 +105,13 @@ class Validator:
                 field="namespace"
             )
         
+        if namespace in self._valid_namespaces:
+            return True
+        
         try:
             # Try to get the namespace
             self.core_api.read_namespace(name=namespace)
+            self._valid_namespaces.add(namespace)
             return True
         except ApiException as e:
             if e.status == 404:
@@ -193,17 +217,7 @@ class Validator:
         Returns:
             True if URL appears to be a Git repository
         """
-        git_patterns = [
-            r'^https?://.*\.git$',
-            r'^https?://github\.com/',
-            r'^https?://gitlab\.com/',
-            r'^https?://bitbucket\.org/',
-            r'^git@',
-            r'^git://',
-            r'^ssh://',
-        ]
-        
-        return any(re.match(pattern, url) for pattern in git_patterns)
+        return bool(_GIT_URL_PATTERN.match(url))
     
     def _validate_git_chart(self, repo_url: str, chart_path: str) -> bool:
         """Validate that a Helm chart exists in a Git repository.
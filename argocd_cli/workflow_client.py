@@ -1,9 +1,10 @@
 """Kubernetes client wrapper for Argo Workflows API interactions."""
 
+import concurrent.futures
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 import time
 
@@ -17,6 +18,21 @@ from argocd_cli.exceptions import (
     TimeoutError as CLITimeoutError,
     handle_kubernetes_api_exception
 )
+from argocd_cli.k8s_client import get_api_client
+
+
+# Default bound on concurrent per-workflow delete requests
+DELETE_WORKERS = 10
+
+
+def _json_loads(data):
+    """Parse a JSON response body, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(data)
+    return orjson.loads(data)
 
 
 @dataclass
@@ -53,6 +69,9 @@ class WorkflowClient:
     WORKFLOW_PLURAL = "workflows"
     WORKFLOW_TEMPLATE_PLURAL = "workflowtemplates"
     
+    # Phases after which a workflow no longer changes
+    TERMINAL_PHASES = ("Succeeded", "Failed", "Error")
+    
     def __init__(self, namespace: str = "argo"):
         """Initialize the workflow client.
         
@@ -64,25 +83,35 @@ class WorkflowClient:
         """
         self.namespace = namespace
         
-        # Load Kubernetes configuration
-        try:
-            config.load_kube_config()
-        except config.ConfigException:
-            try:
-                # Fall back to in-cluster config if kubeconfig is not available
-                config.load_incluster_config()
-            except Exception as e:
-                raise ClusterAccessError(f"Failed to load Kubernetes configuration: {str(e)}")
-        except Exception as e:
-            raise ClusterAccessError(f"Failed to initialize Kubernetes client: {str(e)}")
-        
-        # Initialize Kubernetes API clients
+        # Initialize Kubernetes API clients on the shared connection pool
         try:
-            self.custom_api = client.CustomObjectsApi()
-            self.core_api = client.CoreV1Api()
+            api_client = get_api_client()
+            self.custom_api = client.CustomObjectsApi(api_client)
+            self.core_api = client.CoreV1Api(api_client)
+        except ClusterAccessError:
+            raise
         except Exception as e:
             raise ClusterAccessError(f"Failed to create Kubernetes API clients: {str(e)}")
     
+    def _read_custom_object(self, method, **kwargs) -> Dict:
+        """Call a CustomObjectsApi get/list method and decode the raw response body.
+        
+        The generated client decodes bodies with the stdlib json module before
+        handing back a dict; reading the raw body lets orjson do it instead.
+        
+        Args:
+            method: Bound CustomObjectsApi get/list method
+            **kwargs: Arguments for the call besides group and version
+            
+        Returns:
+            Decoded response object
+            
+        Raises:
+            ApiException: If the API server returns an error status
+        """
+        response = method(group=self.GROUP, version=self.VERSION, _preload_content=False, **kwargs)
+        return _json_loads(response.data)
+    
     def submit_workflow(self, template_name: str, parameters: Dict[str, str]) -> str:
         """Submit a workflow from a template.
         
@@ -157,78 +186,153 @@ class WorkflowClient:
         """
         try:
             # Get workflow from Kubernetes
-            workflow = self.custom_api.get_namespaced_custom_object(
-                group=self.GROUP,
-                version=self.VERSION,
+            workflow = self._read_custom_object(
+                self.custom_api.get_namespaced_custom_object,
                 namespace=self.namespace,
                 plural=self.WORKFLOW_PLURAL,
                 name=workflow_name
             )
             
-            # Extract status information
-            status = workflow.get("status", {})
-            metadata = workflow.get("metadata", {})
+            return self._parse_workflow_status(workflow, workflow_name)
+        except ApiException as e:
+            if e.status == 404:
+                raise WorkflowNotFoundError(workflow_name, self.namespace)
+            error = handle_kubernetes_api_exception(e, "get workflow status", "Workflow")
+            raise KubernetesAPIError(f"Failed to get workflow status: {error.message}", "Workflow", "get")
+        except Exception as e:
+            raise KubernetesAPIError(f"Unexpected error getting workflow status: {str(e)}", "Workflow", "get")
+    
+    def _parse_workflow_status(self, workflow: Dict, workflow_name: str) -> WorkflowStatus:
+        """Build a WorkflowStatus from a raw Workflow object.
+        
+        Args:
+            workflow: Workflow object (dict format from K8s API)
+            workflow_name: Name to fall back to if metadata lacks one
             
-            # Parse timestamps
-            started_at = None
-            if status.get("startedAt"):
+        Returns:
+            WorkflowStatus object for the workflow
+        """
+        # Extract status information
+        status = workflow.get("status", {})
+        metadata = workflow.get("metadata", {})
+        
+        # Parse timestamps
+        started_at = None
+        if status.get("startedAt"):
+            try:
+                started_at = datetime.fromisoformat(status["startedAt"].replace("Z", "+00:00"))
+            except (ValueError, AttributeError) as e:
+                # Log warning but continue - timestamp parsing is not critical
+                pass
+        
+        finished_at = None
+        if status.get("finishedAt"):
+            try:
+                finished_at = datetime.fromisoformat(status["finishedAt"].replace("Z", "+00:00"))
+            except (ValueError, AttributeError):
+                pass
+        
+        # Parse nodes
+        nodes = []
+        for node_id, node_data in status.get("nodes", {}).items():
+            node_started_at = None
+            if node_data.get("startedAt"):
                 try:
-                    started_at = datetime.fromisoformat(status["startedAt"].replace("Z", "+00:00"))
-                except (ValueError, AttributeError) as e:
-                    # Log warning but continue - timestamp parsing is not critical
+                    node_started_at = datetime.fromisoformat(node_data["startedAt"].replace("Z", "+00:00"))
+                except (ValueError, AttributeError):
                     pass
             
-            finished_at = None
-            if status.get("finishedAt"):
+            node_finished_at = None
+            if node_data.get("finishedAt"):
                 try:
-                    finished_at = datetime.fromisoformat(status["finishedAt"].replace("Z", "+00:00"))
+                    node_finished_at = datetime.fromisoformat(node_data["finishedAt"].replace("Z", "+00:00"))
                 except (ValueError, AttributeError):
                     pass
             
-            # Parse nodes
-            nodes = []
-            for node_id, node_data in status.get("nodes", {}).items():
-                node_started_at = None
-                if node_data.get("startedAt"):
-                    try:
-                        node_started_at = datetime.fromisoformat(node_data["startedAt"].replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
-                        pass
-                
-                node_finished_at = None
-                if node_data.get("finishedAt"):
-                    try:
-                        node_finished_at = datetime.fromisoformat(node_data["finishedAt"].replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
-                        pass
-                
-                nodes.append(WorkflowNode(
-                    name=node_data.get("name", node_id),
-                    display_name=node_data.get("displayName", node_data.get("name", node_id)),
-                    type=node_data.get("type", "Unknown"),
-                    phase=node_data.get("phase", "Unknown"),
-                    message=node_data.get("message", ""),
-                    started_at=node_started_at,
-                    finished_at=node_finished_at
-                ))
-            
-            return WorkflowStatus(
-                name=metadata.get("name", workflow_name),
-                namespace=metadata.get("namespace", self.namespace),
-                phase=status.get("phase", "Unknown"),
-                started_at=started_at,
-                finished_at=finished_at,
-                progress=status.get("progress", "0/0"),
-                message=status.get("message", ""),
-                nodes=nodes
-            )
-        except ApiException as e:
-            if e.status == 404:
-                raise WorkflowNotFoundError(workflow_name, self.namespace)
-            error = handle_kubernetes_api_exception(e, "get workflow status", "Workflow")
-            raise KubernetesAPIError(f"Failed to get workflow status: {error.message}", "Workflow", "get")
-        except Exception as e:
-            raise KubernetesAPIError(f"Unexpected error getting workflow status: {str(e)}", "Workflow", "get")
+            nodes.append(WorkflowNode(
+                name=node_data.get("name", node_id),
+                display_name=node_data.get("displayName", node_data.get("name", node_id)),
+                type=node_data.get("type", "Unknown"),
+                phase=node_data.get("phase", "Unknown"),
+                message=node_data.get("message", ""),
+                started_at=node_started_at,
+                finished_at=node_finished_at
+            ))
+        
+        return WorkflowStatus(
+            name=metadata.get("name", workflow_name),
+            namespace=metadata.get("namespace", self.namespace),
+            phase=status.get("phase", "Unknown"),
+            started_at=started_at,
+            finished_at=finished_at,
+            progress=status.get("progress", "0/0"),
+            message=status.get("message", ""),
+            nodes=nodes
+        )
+    
+    def watch_workflow_status(self, workflow_name: str):
+        """Yield a workflow's status now and again whenever the API server reports a change.
+        
+        Uses a Kubernetes watch on the single workflow instead of polling, and stops
+        after yielding a status in one of TERMINAL_PHASES.
+        
+        Args:
+            workflow_name: Name of the workflow
+            
+        Yields:
+            WorkflowStatus objects as the workflow changes
+            
+        Raises:
+            WorkflowNotFoundError: If workflow doesn't exist or is deleted while watching
+            KubernetesAPIError: If workflow retrieval or the watch fails
+        """
+        from kubernetes import watch
+        
+        while True:
+            # (Re)read the current state to start the watch from its resourceVersion
+            try:
+                workflow = self._read_custom_object(
+                    self.custom_api.get_namespaced_custom_object,
+                    namespace=self.namespace,
+                    plural=self.WORKFLOW_PLURAL,
+                    name=workflow_name
+                )
+            except ApiException as e:
+                if e.status == 404:
+                    raise WorkflowNotFoundError(workflow_name, self.namespace)
+                error = handle_kubernetes_api_exception(e, "get workflow status", "Workflow")
+                raise KubernetesAPIError(f"Failed to get workflow status: {error.message}", "Workflow", "get")
+            
+            status = self._parse_workflow_status(workflow, workflow_name)
+            yield status
+            if status.phase in self.TERMINAL_PHASES:
+                return
+            
+            watcher = watch.Watch()
+            try:
+                for event in watcher.stream(
+                    self.custom_api.list_namespaced_custom_object,
+                    group=self.GROUP,
+                    version=self.VERSION,
+                    namespace=self.namespace,
+                    plural=self.WORKFLOW_PLURAL,
+                    field_selector=f"metadata.name={workflow_name}",
+                    resource_version=workflow.get("metadata", {}).get("resourceVersion")
+                ):
+                    if event["type"] == "DELETED":
+                        raise WorkflowNotFoundError(workflow_name, self.namespace)
+                    
+                    status = self._parse_workflow_status(event["raw_object"], workflow_name)
+                    yield status
+                    if status.phase in self.TERMINAL_PHASES:
+                        return
+            except ApiException as e:
+                # 410 Gone: our resourceVersion is too old, so resync from a fresh read
+                if e.status != 410:
+                    error = handle_kubernetes_api_exception(e, "watch workflow", "Workflow")
+                    raise KubernetesAPIError(f"Failed to watch workflow: {error.message}", "Workflow", "watch")
+            finally:
+                watcher.stop()
     
     def list_workflows(self, namespace: Optional[str] = None, labels: Optional[Dict[str, str]] = None) -> List[Dict]:
         """List workflows in a namespace.
@@ -252,9 +356,8 @@ class WorkflowClient:
         
         try:
             # List workflows from Kubernetes
-            response = self.custom_api.list_namespaced_custom_object(
-                group=self.GROUP,
-                version=self.VERSION,
+            response = self._read_custom_object(
+                self.custom_api.list_namespaced_custom_object,
                 namespace=target_namespace,
                 plural=self.WORKFLOW_PLURAL,
                 label_selector=label_selector
@@ -306,12 +409,18 @@ class WorkflowClient:
         except Exception as e:
             raise KubernetesAPIError(f"Unexpected error deleting workflow: {str(e)}", "Workflow", "delete")
     
-    def delete_workflows_by_labels(self, labels: Dict[str, str], delete_pods: bool = True) -> int:
+    def delete_workflows_by_labels(self, labels: Dict[str, str], delete_pods: bool = True,
+                                   max_workers: int = DELETE_WORKERS) -> int:
         """Delete workflows matching label selectors.
         
+        Uses a single collection delete, falling back to one request per workflow
+        (up to max_workers at a time) when the API server refuses it, e.g. when
+        RBAC grants delete but not deletecollection.
+        
         Args:
             labels: Label selectors for filtering workflows to delete
             delete_pods: Whether to delete associated pods (default: True)
+            max_workers: Maximum number of concurrent delete requests
             
         Returns:
             Number of workflows deleted
@@ -319,16 +428,25 @@ class WorkflowClient:
         Raises:
             ApiException: If workflow deletion fails
         """
+        try:
+            return self.delete_workflows_by_selector(labels, delete_pods=delete_pods)
+        except KubernetesAPIError:
+            pass
+        
         try:
             # List workflows matching labels
             workflows = self.list_workflows(labels=labels)
+            names = [wf.get("metadata", {}).get("name") for wf in workflows]
+            names = [name for name in names if name]
+            if not names:
+                return 0
             
             deleted_count = 0
-            for workflow in workflows:
-                workflow_name = workflow.get("metadata", {}).get("name")
-                if workflow_name:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as pool:
+                futures = [pool.submit(self.delete_workflow, name, delete_pods=delete_pods) for name in names]
+                for future in concurrent.futures.as_completed(futures):
                     try:
-                        self.delete_workflow(workflow_name, delete_pods=delete_pods)
+                        future.result()
                         deleted_count += 1
                     except Exception:
                         # Continue deleting other workflows even if one fails
@@ -338,6 +456,43 @@ class WorkflowClient:
         except ApiException as e:
             raise Exception(f"Failed to delete workflows by labels: {e.reason}") from e
     
+    def delete_workflows_by_selector(self, labels: Optional[Dict[str, str]] = None, delete_pods: bool = True) -> int:
+        """Delete all workflows matching label selectors in a single API call.
+        
+        Args:
+            labels: Label selectors for filtering workflows to delete (all workflows if empty)
+            delete_pods: Whether to delete associated pods (default: True)
+            
+        Returns:
+            Number of workflows deleted, as reported by the API server
+            
+        Raises:
+            KubernetesAPIError: If workflow deletion fails
+        """
+        label_selector = None
+        if labels:
+            label_selector = ",".join([f"{k}={v}" for k, v in labels.items()])
+        
+        try:
+            body = client.V1DeleteOptions(
+                propagation_policy='Background' if delete_pods else 'Orphan'
+            )
+            
+            # The server answers with the list of workflows it deleted
+            response = self._read_custom_object(
+                self.custom_api.delete_collection_namespaced_custom_object,
+                namespace=self.namespace,
+                plural=self.WORKFLOW_PLURAL,
+                label_selector=label_selector,
+                body=body
+            )
+            return len(response.get("items") or [])
+        except ApiException as e:
+            error = handle_kubernetes_api_exception(e, "delete workflows", "Workflow")
+            raise KubernetesAPIError(f"Failed to delete workflows: {error.message}", "Workflow", "delete")
+        except Exception as e:
+            raise KubernetesAPIError(f"Unexpected error deleting workflows: {str(e)}", "Workflow", "delete")
+    
     def list_workflow_templates(self, namespace: Optional[str] = None) -> List[Dict]:
         """List available workflow templates.
         
@@ -354,9 +509,8 @@ class WorkflowClient:
         
         try:
             # List workflow templates from Kubernetes
-            response = self.custom_api.list_namespaced_custom_object(
-                group=self.GROUP,
-                version=self.VERSION,
+            response = self._read_custom_object(
+                self.custom_api.list_namespaced_custom_object,
                 namespace=target_namespace,
                 plural=self.WORKFLOW_TEMPLATE_PLURAL
             )
@@ -384,9 +538,8 @@ class WorkflowClient:
         """
         try:
             # Get workflow to find pod names
-            workflow = self.custom_api.get_namespaced_custom_object(
-                group=self.GROUP,
-                version=self.VERSION,
+            workflow = self._read_custom_object(
+                self.custom_api.get_namespaced_custom_object,
                 namespace=self.namespace,
                 plural=self.WORKFLOW_PLURAL,
                 name=workflow_name
@@ -460,9 +613,8 @@ class WorkflowClient:
         """
         try:
             # Get workflow to find pod names
-            workflow = self.custom_api.get_namespaced_custom_object(
-                group=self.GROUP,
-                version=self.VERSION,
+            workflow = self._read_custom_object(
+                self.custom_api.get_namespaced_custom_object,
                 namespace=self.namespace,
                 plural=self.WORKFLOW_PLURAL,
                 name=workflow_name
@@ -4,9 +4,11 @@ import subprocess
 import time
 from typing import Optional, Tuple
 
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 
+from argocd_cli.argocd_installer import ARGO_HELM_REPO_URL
+from argocd_cli.k8s_client import get_api_client
 from argocd_cli.exceptions import (
     ClusterAccessError,
     HelmError,
@@ -28,19 +30,13 @@ class WorkflowsInstaller:
             ClusterAccessError: If Kubernetes configuration cannot be loaded
         """
         try:
-            config.load_kube_config()
-        except config.ConfigException:
-            try:
-                config.load_incluster_config()
-            except Exception as e:
-                raise ClusterAccessError(f"Failed to load Kubernetes configuration: {str(e)}")
-        except Exception as e:
-            raise ClusterAccessError(f"Failed to initialize Kubernetes client: {str(e)}")
-        
-        try:
-            self.core_v1 = client.CoreV1Api()
-            self.rbac_v1 = client.RbacAuthorizationV1Api()
-            self.apps_v1 = client.AppsV1Api()
+            # Share the configuration and connection pool with the other commands
+            api_client = get_api_client()
+            self.core_v1 = client.CoreV1Api(api_client)
+            self.rbac_v1 = client.RbacAuthorizationV1Api(api_client)
+            self.apps_v1 = client.AppsV1Api(api_client)
+        except ClusterAccessError:
+            raise
         except Exception as e:
             raise ClusterAccessError(f"Failed to create Kubernetes API clients: {str(e)}")
 
@@ -48,11 +44,24 @@ class WorkflowsInstaller:
         """
         Validate that the cluster is accessible.
         
+        Probes /readyz, which returns a tiny body, and falls back to the
+        API versions list when that endpoint is not readable.
+        
         Returns:
             Tuple of (success, message)
         """
         try:
-            self.core_v1.get_api_resources()
+            try:
+                self.core_v1.api_client.call_api(
+                    "/readyz", "GET",
+                    auth_settings=["BearerToken"],
+                    response_type="str",
+                    _return_http_data_only=True
+                )
+            except ApiException as e:
+                if e.status not in (401, 403, 404):
+                    raise
+                client.CoreApi(self.core_v1.api_client).get_api_versions()
             return True, "Cluster is accessible"
         except ApiException as e:
             error = handle_kubernetes_api_exception(e, "access cluster")
@@ -127,32 +136,13 @@ class WorkflowsInstaller:
             else:
                 return False, f"Error checking namespace: {str(e)}"
 
-        # Add Argo Helm repository
-        try:
-            subprocess.run(
-                ["helm", "repo", "add", "argo", "https://argoproj.github.io/argo-helm"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True
-            )
-            subprocess.run(
-                ["helm", "repo", "update"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True
-            )
-        except subprocess.CalledProcessError as e:
-            return False, f"Failed to add Argo Helm repository: {e.stderr}"
-        except Exception as e:
-            return False, f"Error adding Helm repository: {str(e)}"
-
-        # Install Argo Workflows
+        # Install Argo Workflows, fetching the chart straight from the repository
+        # rather than registering it with `helm repo add` and `helm repo update`
         try:
             result = subprocess.run(
                 [
-                    "helm", "install", release_name, "argo/argo-workflows",
+                    "helm", "install", release_name, "argo-workflows",
+                    "--repo", ARGO_HELM_REPO_URL,
                     "--namespace", namespace,
                     "--create-namespace",
                     "--set", "server.serviceType=LoadBalancer",
@@ -9,7 +9,12 @@ setup(
         "PyYAML>=6.0",
         "click>=8.1.0",
         "rich>=13.7.0",
+        "urllib3>=1.26.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.8"],
+        "stream": ["ijson>=3.1"],
+    },
     entry_points={
         "console_scripts": [
             "argocd-cli=argocd_cli.cli:cli",
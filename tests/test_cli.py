@@ -0,0 +1,109 @@
+"""Tests for the workflows CLI commands."""
+
+import unittest
+from unittest import mock
+
+from click.testing import CliRunner
+
+from argocd_cli import cli
+
+
+class DeleteWorkflowsTest(unittest.TestCase):
+    """Tests for `workflows delete`."""
+
+    def setUp(self):
+        self.client = mock.MagicMock()
+        patcher = mock.patch.object(cli, "_get_workflow_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unattended_delete_all_fails_when_collection_delete_fails(self):
+        self.client.delete_workflows_by_selector.side_effect = RuntimeError("forbidden")
+
+        result = CliRunner().invoke(cli.cli, ["workflows", "delete", "--all", "--yes"])
+
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("forbidden", result.output)
+        self.client.list_workflows.assert_not_called()
+        self.client.delete_workflow.assert_not_called()
+
+    def test_unattended_delete_all_succeeds(self):
+        self.client.delete_workflows_by_selector.return_value = 3
+
+        result = CliRunner().invoke(cli.cli, ["workflows", "delete", "--all", "--yes"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("Successfully deleted 3 workflow(s)", result.output)
+
+
+class SubmitAppTest(unittest.TestCase):
+    """Tests for `workflows submit app`."""
+
+    def setUp(self):
+        self.client = mock.MagicMock()
+        self.client.submit_workflow.return_value = "create-app-abc12"
+        mock.patch.object(cli, "_get_workflow_client", return_value=self.client).start()
+        mock.patch.object(cli, "_cluster_ok", return_value=True).start()
+        mock.patch("argocd_cli.validators.Validator").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_helm_parameters_are_normalized(self):
+        result = CliRunner().invoke(cli.cli, [
+            "workflows", "submit", "app",
+            "--app-name", "my-app",
+            "--repo-url", "https://charts.example.com",
+            "--chart-path", "my-app",
+            "--helm-parameters", " replicas = 3 , image.tag=v2",
+        ])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        parameters = self.client.submit_workflow.call_args[1]["parameters"]
+        self.assertEqual(parameters["helm_parameters"], "replicas=3,image.tag=v2")
+
+
+class CreateTemplatesTest(unittest.TestCase):
+    """Tests for `workflows templates create`."""
+
+    def setUp(self):
+        mock.patch.object(cli, "_cluster_ok", return_value=True).start()
+        mock.patch("argocd_cli.validators.Validator").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_apply_failure_reports_applied_templates(self):
+        from argocd_cli.exceptions import TemplateError
+        from argocd_cli.template_generator import TemplateGenerator
+
+        def apply(generator, template):
+            if template["metadata"]["name"] == "create-argocd-applicationset":
+                raise TemplateError("forbidden")
+
+        mock.patch.object(TemplateGenerator, "custom_api", new=mock.MagicMock()).start()
+        mock.patch.object(TemplateGenerator, "_apply_template_object", autospec=True, side_effect=apply).start()
+
+        result = CliRunner().invoke(cli.cli, ["workflows", "templates", "create"])
+
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("Failed to apply templates: forbidden", result.output)
+        self.assertIn("Template 'create-argocd-application' created successfully", result.output)
+        self.assertNotIn("Unexpected Error", result.output)
+
+
+class WorkflowLogsTest(unittest.TestCase):
+    """Tests for `workflows logs`."""
+
+    def test_follow_styles_only_lines_the_formatter_styles(self):
+        client = mock.MagicMock()
+        client.stream_workflow_logs.return_value = iter(["plain line", "ERROR: boom"])
+        mock.patch.object(cli, "_get_workflow_client", return_value=client).start()
+        self.addCleanup(mock.patch.stopall)
+
+        with mock.patch("argocd_cli.formatters.Formatters.print_workflow_logs") as print_logs:
+            result = CliRunner().invoke(cli.cli, ["workflows", "logs", "my-wf", "--follow"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("plain line\n", result.output)
+        self.assertEqual([c[0][0] for c in print_logs.call_args_list], ["ERROR: boom"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for committing manifests through the GitHub contents API."""
+
+import base64
+import json
+import unittest
+from unittest import mock
+
+from argocd_cli import gitops
+from argocd_cli.gitops import GitOpsManager
+
+
+def _response(status, payload=None):
+    """Build a fake urllib3 response with a JSON body."""
+    return mock.Mock(status=status, data=json.dumps(payload).encode() if payload is not None else b"")
+
+
+def _file(content, sha="abc123"):
+    """Contents API payload for an existing file."""
+    return {"type": "file", "sha": sha, "content": base64.b64encode(content.encode()).decode()}
+
+
+class GitHubContentsPutTest(unittest.TestCase):
+    """Tests for GitOpsManager.commit_manifest routing to the contents API."""
+
+    def setUp(self):
+        self.manager = GitOpsManager("https://github.com/owner/repo.git", git_token="token")
+        self.request = mock.patch.object(gitops._HTTP, "request").start()
+        self.commit_manifests = mock.patch.object(
+            GitOpsManager, "commit_manifests", return_value=(True, "committed through git")
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def _put_body(self):
+        method, url = self.request.call_args_list[-1][0]
+        self.assertEqual(method, "PUT")
+        self.assertEqual(url, "https://api.github.com/repos/owner/repo/contents/argocd-manifests/app.yaml")
+        return json.loads(self.request.call_args_list[-1][1]["body"])
+
+    def test_creates_new_file(self):
+        self.request.side_effect = [_response(404), _response(201, {})]
+
+        success, message = self.manager.commit_manifest("kind: App\n", "app.yaml")
+
+        self.assertTrue(success)
+        self.assertIn("Successfully committed app.yaml", message)
+        body = self._put_body()
+        self.assertNotIn("sha", body)
+        self.assertEqual(base64.b64decode(body["content"]), b"kind: App\n")
+        self.assertEqual(body["branch"], "main")
+        self.commit_manifests.assert_not_called()
+
+    def test_updates_existing_file_with_its_sha(self):
+        self.request.side_effect = [_response(200, _file("old\n")), _response(200, {})]
+
+        success, _ = self.manager.commit_manifest("new\n", "app.yaml")
+
+        self.assertTrue(success)
+        self.assertEqual(self._put_body()["sha"], "abc123")
+        self.commit_manifests.assert_not_called()
+
+    def test_unchanged_file_is_not_committed(self):
+        self.request.return_value = _response(200, _file("same\n"))
+
+        success, message = self.manager.commit_manifest("same\n", "app.yaml")
+
+        self.assertTrue(success)
+        self.assertIn("already up to date", message)
+        self.assertEqual(self.request.call_count, 1)
+
+    def test_directory_path_falls_back_to_git(self):
+        self.request.return_value = _response(200, [_file("x")])
+
+        self.assertEqual(self.manager.commit_manifest("x", "app.yaml"), (True, "committed through git"))
+        self.assertEqual(self.request.call_count, 1)
+
+    def test_rejected_put_falls_back_to_git(self):
+        for status in (409, 422):
+            with self.subTest(status=status):
+                self.commit_manifests.reset_mock()
+                self.request.side_effect = [_response(200, _file("old\n")), _response(status, {})]
+
+                self.assertEqual(self.manager.commit_manifest("new\n", "app.yaml"), (True, "committed through git"))
+                self.commit_manifests.assert_called_once()
+
+    def test_unreadable_file_falls_back_to_git(self):
+        self.request.return_value = _response(403, {})
+
+        self.assertEqual(self.manager.commit_manifest("x", "app.yaml"), (True, "committed through git"))
+
+    def test_non_github_remote_uses_git(self):
+        manager = GitOpsManager("https://gitlab.com/owner/repo.git", git_token="token")
+
+        self.assertEqual(manager.commit_manifest("x", "app.yaml"), (True, "committed through git"))
+        self.request.assert_not_called()
+
+    def test_pull_requests_use_git(self):
+        self.manager.commit_manifest("x", "app.yaml", create_pr=True)
+
+        self.request.assert_not_called()
+        self.commit_manifests.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()